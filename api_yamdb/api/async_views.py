@@ -0,0 +1,77 @@
+import time
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from django.http import HttpResponse
+from django.urls import URLPattern
+
+from api.routers import SAFE_METHODS
+
+# Routes of `api.urls` served by `async_read_view` under ASGI.
+ASYNC_READ_ROUTES = (
+    'titles-list',
+    'titles-detail',
+    'review-list',
+    'comment-list',
+)
+
+
+def run_read(view, request, *args, **kwargs):
+    """
+    Run a read request in a worker thread and render its response.
+
+    The thread has its own database connections: they are closed
+    according to `CONN_MAX_AGE` just like at the end of a request.
+    """
+    close_old_connections()
+    try:
+        response = view(request, *args, **kwargs)
+        if hasattr(response, 'render'):
+            request._render_started = time.perf_counter()
+            response.render()
+    finally:
+        close_old_connections()
+    # A plain response skips the template response middleware and
+    # rendering, which Django runs one request at a time. It keeps
+    # everything sent to the client: status, headers and cookies.
+    rendered = HttpResponse(
+        response.content, status=response.status_code,
+        reason=response.reason_phrase, charset=response.charset,
+        headers=response.headers
+    )
+    rendered.cookies = response.cookies
+    return rendered
+
+
+def async_read_view(view):
+    """
+    ASGI-native variant of a DRF view.
+
+    Safe-method requests run in a pool of threads
+    (`thread_sensitive=False`), so queries of concurrent requests do not
+    block the event loop or wait for each other; other methods keep
+    the single thread Django runs sync views in.
+    """
+    read = sync_to_async(run_read, thread_sensitive=False)
+    write = sync_to_async(view, thread_sensitive=True)
+
+    async def async_view(request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return await read(view, request, *args, **kwargs)
+        return await write(request, *args, **kwargs)
+
+    async_view.csrf_exempt = True
+    return async_view
+
+
+def async_read_urls(urls, names=ASYNC_READ_ROUTES):
+    """URL patterns with the views of the `names` routes made async."""
+    return [
+        URLPattern(
+            pattern.pattern,
+            async_read_view(pattern.callback),
+            pattern.default_args,
+            pattern.name
+        ) if pattern.name in names else pattern
+        for pattern in urls
+    ]
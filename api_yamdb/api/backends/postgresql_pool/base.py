@@ -0,0 +1,124 @@
+import threading
+
+import psycopg2
+import psycopg2.extras
+from django.db.backends.postgresql import base
+from psycopg2.pool import ThreadedConnectionPool
+
+from api.backends.postgresql_pool.creation import DatabaseCreation
+
+POOLS = {}
+POOLS_LOCK = threading.Lock()
+
+
+class BlockingConnectionPool(ThreadedConnectionPool):
+    """`ThreadedConnectionPool` that waits `timeout` s for a connection."""
+
+    def __init__(self, minconn, maxconn, timeout, *args, **kwargs):
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(maxconn)
+
+    def getconn(self, key=None):
+        if not self.slots.acquire(timeout=self.timeout):
+            raise psycopg2.OperationalError(
+                f'No free pooled connection within {self.timeout} s '
+                f'(MAX_SIZE={self.maxconn}).'
+            )
+        try:
+            return super().getconn(key)
+        except BaseException:
+            self.slots.release()
+            raise
+
+    def putconn(self, conn=None, key=None, close=False):
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self.slots.release()
+
+
+def pool_key(conn_params):
+    """Pools are shared by connections with the same parameters."""
+    return tuple(sorted(
+        (name, repr(value)) for name, value in conn_params.items()
+    ))
+
+
+def is_alive(connection):
+    """Whether a raw connection still talks to the server."""
+    if connection.closed:
+        return False
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        if not connection.autocommit:
+            connection.rollback()
+    except psycopg2.Error:
+        return False
+    return True
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostgreSQL backend taking connections from a pool per process."""
+
+    creation_class = DatabaseCreation
+
+    def get_pool(self, conn_params):
+        key = pool_key(conn_params)
+        with POOLS_LOCK:
+            if key not in POOLS:
+                options = self.settings_dict.get('POOL', {})
+                POOLS[key] = BlockingConnectionPool(
+                    options.get('MIN_SIZE', 1),
+                    options.get('MAX_SIZE', 10),
+                    options.get('TIMEOUT', 30),
+                    **conn_params
+                )
+            return POOLS[key]
+
+    def close_pool(self, conn_params):
+        """Disconnect all connections of the pool for these parameters."""
+        with POOLS_LOCK:
+            pool = POOLS.pop(pool_key(conn_params), None)
+        if pool is not None:
+            pool.closeall()
+
+    def checkout(self):
+        """
+        Take a connection from the pool; with `CONN_HEALTH_CHECKS` the
+        ones that died while idle in the pool are dropped.
+        """
+        if self.settings_dict.get('CONN_HEALTH_CHECKS'):
+            # The pool holds at most `maxconn` connections, so the
+            # following attempt gets a new one.
+            for _ in range(self.pool.maxconn):
+                connection = self.pool.getconn()
+                if is_alive(connection):
+                    return connection
+                self.pool.putconn(connection, close=True)
+        return self.pool.getconn()
+
+    def get_new_connection(self, conn_params):
+        self.pool = self.get_pool(conn_params)
+        connection = self.checkout()
+        # Same session setup as the parent backend, pooled connections
+        # may have been left with other settings.
+        options = self.settings_dict['OPTIONS']
+        self.isolation_level = options.get(
+            'isolation_level', connection.isolation_level
+        )
+        if self.isolation_level != connection.isolation_level:
+            connection.set_session(isolation_level=self.isolation_level)
+        psycopg2.extras.register_default_jsonb(
+            conn_or_curs=connection, loads=lambda x: x
+        )
+        return connection
+
+    def _close(self):
+        # The pool rolls back unfinished transactions and drops
+        # connections in an unknown state.
+        with self.wrap_database_errors:
+            self.pool.putconn(
+                self.connection, close=bool(self.connection.closed)
+            )
@@ -0,0 +1,13 @@
+from django.db.backends.postgresql import creation
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # Idle pooled sessions of the test database would make
+        # DROP DATABASE fail.
+        self.connection.close_pool({
+            **self.connection.get_connection_params(),
+            'database': test_database_name,
+        })
+        super()._destroy_test_db(test_database_name, verbosity)
@@ -0,0 +1,64 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+CATEGORIES = 'categories'
+GENRES = 'genres'
+TITLES = 'titles'
+# Usernames of authors rendered in reviews and comments.
+AUTHORS = 'authors'
+
+
+def reviews_namespace(title_id):
+    # URL kwargs may carry leading zeros: `01` is title 1.
+    return f'reviews:{int(title_id)}'
+
+
+def comments_namespace(review_id):
+    return f'comments:{int(review_id)}'
+
+
+def get_cache():
+    """The cache of versions and responses, see the `api.W001` check."""
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def version_key(namespace):
+    return f'api:version:{namespace}'
+
+
+def get_versions(namespaces):
+    """
+    Current versions of namespaces, unknown ones are started anew.
+
+    A version is the `time.time_ns()` of the last invalidation,
+    so it also serves as the modification time of the namespace data.
+    """
+    cache = get_cache()
+    keys = [version_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def response_etag(versions, *parts):
+    """Strong ETag of a response rendered from data of given versions."""
+    source = ':'.join(str(part) for part in (*versions, *parts))
+    return f'"{hashlib.md5(source.encode()).hexdigest()}"'
+
+
+def invalidate(*namespaces):
+    """Start new versions of namespaces once the transaction commits."""
+    def bump_versions():
+        version = time.time_ns()
+        get_cache().set_many(
+            {version_key(namespace): version for namespace in namespaces},
+            None
+        )
+    transaction.on_commit(bump_versions)
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Tags, Warning, register
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """Warn when the API cache is local to the process."""
+    if not isinstance(caches[settings.API_CACHE_ALIAS], LocMemCache):
+        return []
+    return [
+        Warning(
+            f'The {settings.API_CACHE_ALIAS!r} cache is local to the '
+            f'process.',
+            hint=(
+                'Response versions and cached users change in the process '
+                'that handles the write, other worker processes keep '
+                'serving stale ETags and responses. Run a single worker '
+                'process or set CACHE_BACKEND and CACHE_LOCATION to a '
+                'cache shared by all workers.'
+            ),
+            id='api.W001',
+        )
+    ]
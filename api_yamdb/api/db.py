@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.db import connections, router
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """
+    Run `SQLITE_PRAGMAS` on every new SQLite connection.
+
+    The statements go through the raw DB-API connection, so they are
+    not logged and do not count in query assertions.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    for name, value in settings.SQLITE_PRAGMAS.items():
+        connection.connection.execute(f'PRAGMA {name} = {value}')
+
+
+def check_connection(connection):
+    """
+    Close a reused connection that no longer works.
+
+    Applies to databases with `CONN_HEALTH_CHECKS`, so a connection
+    dropped by the server is replaced before the request uses it.
+    """
+    if (
+        connection.connection is not None
+        and connection.settings_dict.get('CONN_HEALTH_CHECKS')
+        and not connection.in_atomic_block
+        and not connection.is_usable()
+    ):
+        connection.close()
+
+
+def check_connections(**kwargs):
+    for connection in connections.all():
+        check_connection(connection)
+
+
+def bulk_create_with_pks(model, objs, batch_size=None):
+    """
+    `bulk_create` that sets primary keys on every backend.
+
+    Backends returning rows from bulk inserts set them as usual. On
+    SQLite each batch is a single INSERT statement: its rows get
+    consecutive AUTOINCREMENT ids ending at `last_insert_rowid()`,
+    which is per connection and so unaffected by concurrent writers.
+    Other backends insert the objects one by one.
+    """
+    objs = list(objs)
+    connection = connections[router.db_for_write(model)]
+    if connection.features.can_return_rows_from_bulk_insert:
+        return model.objects.bulk_create(objs, batch_size=batch_size)
+    if connection.vendor != 'sqlite':
+        for obj in objs:
+            obj.save(force_insert=True)
+        return objs
+    fields = [
+        field for field in model._meta.concrete_fields
+        if not field.primary_key
+    ]
+    max_size = connection.ops.bulk_batch_size(fields, objs)
+    size = min(batch_size, max_size) if batch_size else max_size
+    for start in range(0, len(objs), size):
+        batch = objs[start:start + size]
+        model.objects.bulk_create(batch, batch_size=size)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT last_insert_rowid()')
+            last_id = cursor.fetchone()[0]
+        for pk, obj in enumerate(batch, last_id - len(batch) + 1):
+            obj.pk = pk
+    return objs
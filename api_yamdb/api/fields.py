@@ -0,0 +1,63 @@
+from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
+
+
+class BulkSlugManyRelatedField(serializers.ManyRelatedField):
+    """Many slug relation resolving all slugs with a single query."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+        relation = self.child_relation
+        slugs = []
+        for slug in data:
+            if not isinstance(slug, str):
+                relation.fail('invalid')
+            if slug not in slugs:
+                slugs.append(slug)
+        objects = relation.get_preloaded()
+        if objects is None:
+            objects = relation.get_queryset().in_bulk(
+                slugs,
+                field_name=relation.slug_field
+            )
+        for slug in slugs:
+            if slug not in objects:
+                relation.fail(
+                    'does_not_exist',
+                    slug_name=relation.slug_field,
+                    value=slug
+                )
+        return [objects[slug] for slug in slugs]
+
+
+class BulkSlugRelatedField(serializers.SlugRelatedField):
+    """
+    Slug relation that uses `BulkSlugManyRelatedField` for many=True.
+
+    Objects found in `context['preloaded'][model]` (a slug to object
+    mapping filled in by list serializers) are used without a query.
+    """
+
+    def get_preloaded(self):
+        return self.context.get('preloaded', {}).get(self.queryset.model)
+
+    def to_internal_value(self, data):
+        objects = self.get_preloaded()
+        if objects is None:
+            return super().to_internal_value(data)
+        if not isinstance(data, str):
+            self.fail('invalid')
+        if data not in objects:
+            self.fail('does_not_exist', slug_name=self.slug_field, value=data)
+        return objects[data]
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BulkSlugManyRelatedField(**list_kwargs)
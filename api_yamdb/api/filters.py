@@ -1,7 +1,14 @@
+import re
+
+from django.db import connections
+from django.db.models import Q
 from django_filters import rest_framework as filters
+from rest_framework.filters import BaseFilterBackend
 
 from reviews.models import Title
 
+TITLE_SEARCH_TABLE = 'reviews_title_fts'
+
 
 class TitleFilter(filters.FilterSet):
     name = filters.CharFilter(
@@ -23,3 +30,42 @@ class TitleFilter(filters.FilterSet):
             'genre',
             'category',
         )
+
+
+class TitleSearchFilter(BaseFilterBackend):
+    """
+    Full-text search of titles by name and description.
+
+    On SQLite the `reviews_title_fts` FTS5 index, kept in sync with
+    titles by triggers, is matched and results are ordered by relevance.
+    Every word of the query must match the start of a word in the title.
+    Other databases fall back to case insensitive substring search.
+    """
+
+    search_param = 'search'
+
+    def get_search_terms(self, request):
+        return re.findall(r'\w+', request.query_params.get(
+            self.search_param, ''
+        ))
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        if connections[queryset.db].vendor != 'sqlite':
+            for term in terms:
+                queryset = queryset.filter(
+                    Q(name__icontains=term) | Q(description__icontains=term)
+                )
+            return queryset
+        match = ' '.join(f'"{term}"*' for term in terms)
+        return queryset.extra(
+            tables=(TITLE_SEARCH_TABLE,),
+            where=(
+                f'{TITLE_SEARCH_TABLE}.rowid = {Title._meta.db_table}.id',
+                f'{TITLE_SEARCH_TABLE} MATCH %s',
+            ),
+            params=(match,),
+            select={'search_rank': f'{TITLE_SEARCH_TABLE}.rank'},
+        ).order_by('search_rank', 'name')
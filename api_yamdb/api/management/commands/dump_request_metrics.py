@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.metrics import (
+    RESET_MARKER,
+    empty_stats,
+    merge_stats,
+    percentile,
+    read_dumps,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Выводит метрики запросов по маршрутам, собранные '
+        'RequestMetricsMiddleware во всех процессах.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Вывести метрики в формате JSON.'
+        )
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help=(
+                'Сбросить метрики после вывода: удалить сохранённые и '
+                'вычесть их из счётчиков работающих процессов.'
+            )
+        )
+
+    def handle(self, *args, **options):
+        if not settings.REQUEST_METRICS_DIR:
+            raise CommandError('REQUEST_METRICS_DIR не задан.')
+        dumps = read_dumps(settings.REQUEST_METRICS_DIR)
+        routes = {}
+        for dump in dumps.values():
+            for route, stats in dump.items():
+                merge_stats(routes.setdefault(route, empty_stats()), stats)
+        if options['json']:
+            self.stdout.write(json.dumps(routes, indent=2, sort_keys=True))
+        else:
+            self.write_table(routes)
+        if options['reset']:
+            # Running processes drop what they dumped on their next flush.
+            (Path(settings.REQUEST_METRICS_DIR) / RESET_MARKER).touch()
+            for path in dumps:
+                path.unlink()
+
+    def write_table(self, routes):
+        columns = ('route', 'requests', 'queries', 'sql ms', 'app ms',
+                   'serializer ms', 'render ms', 'bytes', 'p50 ms',
+                   'p95 ms', 'p99 ms')
+        rows = [columns]
+        for route, stats in sorted(routes.items()):
+            requests = stats['requests']
+            rows.append((
+                route,
+                requests,
+                f"{stats['queries'] / requests:.1f}",
+                f"{stats['sql_ms'] / requests:.2f}",
+                f"{stats['app_ms'] / requests:.2f}",
+                f"{stats['serializer_ms'] / requests:.2f}",
+                f"{stats['render_ms'] / requests:.2f}",
+                f"{stats['bytes'] / requests:.0f}",
+                *(
+                    f'<={percentile(stats["histogram"], fraction)}'
+                    for fraction in (0.5, 0.95, 0.99)
+                ),
+            ))
+        widths = [
+            max(len(str(row[idx])) for row in rows)
+            for idx in range(len(columns))
+        ]
+        for row in rows:
+            self.stdout.write('  '.join(
+                str(value).ljust(width) for value, width in zip(row, widths)
+            ))
@@ -0,0 +1,177 @@
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+# Upper bounds (ms) of request duration histogram buckets.
+BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+COUNTERS = ('requests', 'queries', 'sql_ms', 'app_ms', 'serializer_ms',
+            'render_ms', 'total_ms', 'bytes')
+# Written by `dump_request_metrics --reset`, see `RequestMetrics.flush`.
+RESET_MARKER = 'reset'
+
+
+def empty_stats():
+    stats = dict.fromkeys(COUNTERS, 0)
+    stats['histogram'] = [0] * (len(BUCKETS) + 1)
+    return stats
+
+
+def merge_stats(target, stats):
+    for counter in COUNTERS:
+        target[counter] += stats.get(counter, 0)
+    target['histogram'] = [
+        total + count
+        for total, count in zip(target['histogram'], stats['histogram'])
+    ]
+    return target
+
+
+def subtract_stats(target, stats):
+    for counter in COUNTERS:
+        target[counter] -= stats[counter]
+    target['histogram'] = [
+        total - count
+        for total, count in zip(target['histogram'], stats['histogram'])
+    ]
+    return target
+
+
+def process_exists(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def read_dumps(directory):
+    """
+    Read per-process dumps of `directory`: {path: routes}.
+
+    Dumps of processes that no longer run on this host are read until
+    they are `REQUEST_METRICS_RETENTION` seconds old, then removed.
+    """
+    dumps = {}
+    expired_before = time.time() - settings.REQUEST_METRICS_RETENTION
+    for path in sorted(Path(directory).glob('*.json')):
+        if (
+            path.stem.isdigit()
+            and not process_exists(int(path.stem))
+            and path.stat().st_mtime < expired_before
+        ):
+            path.unlink()
+            continue
+        dumps[path] = json.loads(path.read_text())
+    return dumps
+
+
+def percentile(histogram, fraction):
+    """Upper bound (ms) of the bucket holding the given fraction."""
+    total = sum(histogram)
+    if not total:
+        return None
+    threshold = total * fraction
+    seen = 0
+    for bound, count in zip((*BUCKETS, float('inf')), histogram):
+        seen += count
+        if seen >= threshold:
+            return bound
+    return float('inf')
+
+
+class RequestMetrics:
+    """
+    In-process per-route request metrics.
+
+    Totals and a duration histogram are kept per route name and, when
+    `settings.REQUEST_METRICS_DIR` is set, periodically written there
+    as `<pid>.json`, so that `dump_request_metrics` can merge them
+    across worker processes. A newer reset marker there drops what the
+    last dump held: those requests were reported and reset.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.routes = {}
+        self.flushed = {}
+        self.reset_seen = 0
+        self.flushed_at = time.monotonic()
+
+    def record(self, route, queries, sql_ms, app_ms, serializer_ms,
+               render_ms, total_ms, size):
+        bucket = next(
+            (idx for idx, bound in enumerate(BUCKETS) if total_ms <= bound),
+            len(BUCKETS)
+        )
+        with self.lock:
+            stats = self.routes.setdefault(route, empty_stats())
+            stats['requests'] += 1
+            stats['queries'] += queries
+            stats['sql_ms'] += sql_ms
+            stats['app_ms'] += app_ms
+            stats['serializer_ms'] += serializer_ms
+            stats['render_ms'] += render_ms
+            stats['total_ms'] += total_ms
+            stats['bytes'] += size
+            stats['histogram'][bucket] += 1
+            flush = (
+                time.monotonic() - self.flushed_at
+                >= settings.REQUEST_METRICS_FLUSH_INTERVAL
+            )
+        if flush:
+            self.flush()
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                route: merge_stats(empty_stats(), stats)
+                for route, stats in self.routes.items()
+            }
+
+    def reset(self):
+        with self.lock:
+            self.routes = {}
+            self.flushed = {}
+
+    def drop_flushed(self):
+        with self.lock:
+            for route, stats in self.flushed.items():
+                if route in self.routes:
+                    subtract_stats(self.routes[route], stats)
+                    if not self.routes[route]['requests']:
+                        del self.routes[route]
+            self.flushed = {}
+
+    def flush(self):
+        directory = settings.REQUEST_METRICS_DIR
+        self.flushed_at = time.monotonic()
+        if not directory:
+            return
+        directory = Path(directory)
+        try:
+            reset_at = (directory / RESET_MARKER).stat().st_mtime_ns
+        except FileNotFoundError:
+            reset_at = 0
+        if reset_at > self.reset_seen:
+            self.reset_seen = reset_at
+            self.drop_flushed()
+        snapshot = self.snapshot()
+        if not snapshot:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f'{os.getpid()}.json'
+        tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+        tmp_path.write_text(json.dumps(snapshot))
+        os.replace(tmp_path, path)
+        self.flushed = snapshot
+
+
+request_metrics = RequestMetrics()
+atexit.register(request_metrics.flush)
@@ -0,0 +1,147 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from api.metrics import request_metrics
+
+current_timer = ContextVar('current_timer', default=None)
+
+
+class QueryTimer:
+    """
+    Database execute wrapper counting queries and their time.
+
+    Also sums the serializer time of the request, see `time_serializer`.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.duration = 0.0
+        self.serializer = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.duration += time.perf_counter() - started
+
+
+def time_query(execute, sql, params, many, context):
+    """Execute wrapper passing queries to the timer of the request."""
+    timer = current_timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    return timer(execute, sql, params, many, context)
+
+
+@contextmanager
+def time_serializer():
+    """Count the block, less its queries, as serializer time."""
+    timer = current_timer.get()
+    if timer is None:
+        yield
+        return
+    started = time.perf_counter()
+    sql_before = timer.duration
+    try:
+        yield
+    finally:
+        timer.serializer += (
+            time.perf_counter() - started - (timer.duration - sql_before)
+        )
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """
+    Time the queries of every connection, in whatever thread it runs.
+
+    The timer of a request travels in a context variable, so queries
+    of views run in other threads under ASGI are counted too.
+    """
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_query)
+
+
+class RequestMetricsMiddleware:
+    """
+    Measure queries, SQL, serializer and rendering time and response size.
+
+    Metrics are sent back in the `Server-Timing` header and recorded
+    per resolved route name (`titles-list`, `review-detail`, ...)
+    in `api.metrics.request_metrics`. `serializer` covers the
+    `serializer.data` of list and retrieve responses (see
+    `api.mixins.SerializerTimingMixin`), `render` the time of
+    `response.render()`.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        timer = QueryTimer()
+        token = current_timer.set(timer)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_timer.reset(token)
+        return self.finish(request, response, timer, started)
+
+    async def __acall__(self, request):
+        timer = QueryTimer()
+        token = current_timer.set(timer)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_timer.reset(token)
+        return self.finish(request, response, timer, started)
+
+    def finish(self, request, response, timer, started):
+        finished = time.perf_counter()
+        render_started = getattr(request, '_render_started', finished)
+
+        sql_ms = timer.duration * 1000
+        serializer_ms = timer.serializer * 1000
+        total_ms = (finished - started) * 1000
+        render_ms = (finished - render_started) * 1000
+        app_ms = max(total_ms - render_ms - serializer_ms - sql_ms, 0)
+        size = (
+            len(response.content) if not response.streaming
+            else int(response.get('Content-Length', 0))
+        )
+        response['Server-Timing'] = ', '.join((
+            f'db;dur={sql_ms:.2f};desc="{timer.queries} queries"',
+            f'app;dur={app_ms:.2f}',
+            f'serializer;dur={serializer_ms:.2f}',
+            f'render;dur={render_ms:.2f}',
+            f'total;dur={total_ms:.2f}',
+        ))
+        match = request.resolver_match
+        request_metrics.record(
+            match.url_name if match and match.url_name else '<unresolved>',
+            timer.queries,
+            sql_ms,
+            app_ms,
+            serializer_ms,
+            render_ms,
+            total_ms,
+            size
+        )
+        return response
+
+    def process_template_response(self, request, response):
+        request._render_started = time.perf_counter()
+        return response
@@ -1,4 +1,15 @@
-from rest_framework import mixins, viewsets
+import time
+
+from django.conf import settings
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import mixins, status, viewsets
+from rest_framework.response import Response
+
+from api.cache import get_cache, get_versions, response_etag
+from api.middleware import time_serializer
+from api.routers import reads_from_replica
 
 
 class ListCreateDestroyViewSet(
@@ -11,3 +22,192 @@ class ListCreateDestroyViewSet(
 
     lookup_field = 'slug'
     search_fields = ['name']
+
+
+class ParentObjectMixin:
+    """
+    Mixin for viewsets nested under a parent object from the URL.
+
+    `parent_lookups` maps parent model fields to URL kwargs.
+    Querysets are filtered by these kwargs directly, the parent row
+    is fetched at most once per request: on create and when
+    a list page comes out empty, to tell it from a missing parent.
+    """
+
+    parent_model = None
+    parent_field = None
+    parent_lookups = {}
+
+    def get_parent_lookups(self):
+        return {
+            field: self.kwargs[kwarg]
+            for field, kwarg in self.parent_lookups.items()
+        }
+
+    def get_parent(self):
+        if not hasattr(self, '_parent'):
+            self._parent = get_object_or_404(
+                self.parent_model,
+                **self.get_parent_lookups()
+            )
+        return self._parent
+
+    def get_queryset(self):
+        return super().get_queryset().filter(**{
+            f'{self.parent_field}__{field}': value
+            for field, value in self.get_parent_lookups().items()
+        })
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if not page:
+            self.get_parent()
+        return page
+
+
+class SerializerTimingMixin:
+    """Mixin timing `serializer.data` as serializer time of the request."""
+
+    def get_serializer_data(self, *args, **kwargs):
+        serializer = self.get_serializer(*args, **kwargs)
+        with time_serializer():
+            return serializer.data
+
+
+class TimedListMixin(SerializerTimingMixin):
+    """`list` of `ListModelMixin` with serializer timing."""
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                self.get_serializer_data(page, many=True)
+            )
+        return Response(self.get_serializer_data(queryset, many=True))
+
+
+class TimedRetrieveMixin(SerializerTimingMixin):
+    """`retrieve` of `RetrieveModelMixin` with serializer timing."""
+
+    def retrieve(self, request, *args, **kwargs):
+        return Response(self.get_serializer_data(self.get_object()))
+
+
+class VersionedResponseMixin:
+    """
+    Base mixin for conditional and cached GET responses.
+
+    Versions of `get_cache_namespaces()` (see `api.cache`) identify
+    the state of the data the viewset renders. Together with the
+    absolute request URI (pages hold absolute links) and media type
+    they give a strong `ETag`, and the latest of them gives
+    `Last-Modified` (once its second is over);
+    a request with the current ETag gets 304 before anything is
+    queried or serialized, other validators only once the target
+    is found.
+    With `cache_responses` the response data is cached by the ETag.
+    Writes invalidate the namespaces, see `api.signals`.
+    Responses read from a replica less than `READ_YOUR_WRITES_WINDOW`
+    after the last change are neither cached nor tagged: the replica
+    may not have the change yet.
+    """
+
+    cache_namespace = None
+    cache_responses = False
+
+    def get_cache_namespaces(self):
+        return (self.cache_namespace,)
+
+    def get_versioned_response(self, handler, request, *args, **kwargs):
+        versions = get_versions(self.get_cache_namespaces())
+        etag = response_etag(
+            versions, request.accepted_media_type,
+            request.build_absolute_uri()
+        )
+        last_modified = max(versions) // 10 ** 9
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None and not (
+            self.etag_matches(request, etag) or self.target_exists()
+        ):
+            # Preconditions about a missing object: the handler gives 404.
+            response = None
+        if response is None:
+            if self.replica_may_lag(versions):
+                return handler(request, *args, **kwargs)
+            response = self.get_response_data(
+                etag, handler, request, *args, **kwargs
+            )
+        if response.status_code in (
+            status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED
+        ):
+            response['ETag'] = etag
+            # A write later in the same second would keep the date:
+            # it is only a validator once that second is over.
+            if time.time_ns() // 10 ** 9 > last_modified:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    @staticmethod
+    def etag_matches(request, etag):
+        """
+        Whether `If-None-Match` lists `etag` itself.
+
+        Such an ETag was sent with this URL at the current versions,
+        and deletes bump them: the target exists. `*` and dates do not
+        tell that.
+        """
+        return etag in request.META.get('HTTP_IF_NONE_MATCH', '')
+
+    def target_exists(self):
+        """Whether the object or the parent of the response exists."""
+        if self.action == 'retrieve':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            return self.get_queryset().filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            ).exists()
+        if isinstance(self, ParentObjectMixin):
+            return self.parent_model.objects.filter(
+                **self.get_parent_lookups()
+            ).exists()
+        return True
+
+    @staticmethod
+    def replica_may_lag(versions):
+        return reads_from_replica() and (
+            time.time_ns() - max(versions)
+            < settings.READ_YOUR_WRITES_WINDOW * 10 ** 9
+        )
+
+    def get_response_data(self, etag, handler, request, *args, **kwargs):
+        if not self.cache_responses:
+            return handler(request, *args, **kwargs)
+        cache = get_cache()
+        key = f'api:response:{etag}'
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, settings.API_CACHE_TIMEOUT)
+        return response
+
+
+class VersionedListMixin(VersionedResponseMixin, TimedListMixin):
+    """Mixin for conditional and cached `list` responses."""
+
+    def list(self, request, *args, **kwargs):
+        return self.get_versioned_response(
+            super().list, request, *args, **kwargs
+        )
+
+
+class VersionedRetrieveMixin(VersionedResponseMixin, TimedRetrieveMixin):
+    """Mixin for conditional and cached `retrieve` responses."""
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_versioned_response(
+            super().retrieve, request, *args, **kwargs
+        )
@@ -0,0 +1,147 @@
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    CursorPagination,
+    PageNumberPagination,
+    _reverse_ordering,
+)
+
+
+class PubDateCursorPagination(CursorPagination):
+    """
+    Keyset pagination over `(pub_date, id)`, newest first.
+
+    DRF keys the cursor on the first ordering field only and pages
+    through its ties with OFFSET; here the cursor holds both fields,
+    so rows sharing a `pub_date` are paged by `id` without an offset.
+    """
+
+    ordering = ('-pub_date', '-id')
+    position_separator = '|'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            offset, reverse, current_position = 0, False, None
+        else:
+            offset, reverse, current_position = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if current_position is not None:
+            queryset = queryset.filter(self.get_position_filter(
+                queryset.model, current_position, reverse
+            ))
+
+        # Positions are unique, so links never need an offset; cursors
+        # with one are still served.
+        results = list(queryset[offset:offset + self.page_size + 1])
+        self.page = results[:self.page_size]
+        if len(results) > len(self.page):
+            following_position = self._get_position_from_instance(
+                results[-1], self.ordering
+            )
+        else:
+            following_position = None
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None or offset > 0
+            self.has_previous = following_position is not None
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = following_position is not None
+            self.has_previous = current_position is not None or offset > 0
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_position_filter(self, model, position, reverse):
+        """
+        Rows after `position` in the cursor direction:
+        `a < x OR (a = x AND b < y)` for a descending `(a, b)`.
+        """
+        values = position.split(self.position_separator)
+        if len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        lookups = []
+        for order, value in zip(self.ordering, values):
+            name = order.lstrip('-')
+            try:
+                value = model._meta.get_field(name).to_python(value)
+            except ValidationError:
+                raise NotFound(self.invalid_cursor_message)
+            descending = order.startswith('-') != reverse
+            lookups.append((name, 'lt' if descending else 'gt', value))
+
+        condition = Q()
+        for index, (name, lookup, value) in enumerate(lookups):
+            ties = {previous: equal for previous, _, equal in lookups[:index]}
+            condition |= Q(**ties, **{f'{name}__{lookup}': value})
+        return condition
+
+    def _get_position_from_instance(self, instance, ordering):
+        return self.position_separator.join(
+            str(
+                instance[order.lstrip('-')] if isinstance(instance, dict)
+                else getattr(instance, order.lstrip('-'))
+            )
+            for order in ordering
+        )
+
+
+class PageNumberOrCursorPagination(PageNumberPagination):
+    """
+    Page number pagination with opt-in cursor mode.
+
+    Clients keep receiving `count`/`next`/`previous`/`results` pages
+    unless they pass `?pagination=cursor` or a `cursor` parameter.
+    In cursor mode no `COUNT(*)` and no `OFFSET` are issued,
+    so deep pages cost the same as the first one.
+    """
+
+    mode_query_param = 'pagination'
+    cursor_mode = 'cursor'
+    cursor_pagination_class = PubDateCursorPagination
+
+    def __init__(self):
+        self.cursor_paginator = None
+
+    def is_cursor_mode(self, request):
+        cursor_param = self.cursor_pagination_class.cursor_query_param
+        return (
+            request.query_params.get(self.mode_query_param)
+            == self.cursor_mode
+            or cursor_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.is_cursor_mode(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(
+                queryset, request, view
+            )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
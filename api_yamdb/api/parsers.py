@@ -0,0 +1,89 @@
+import codecs
+import io
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# orjson reads integers beyond 64 bits as floats: documents with such
+# long runs of digits are left to the stdlib. Digits are translated
+# to zeros and searched for as a substring, much faster than a regex.
+DIGITS_TO_ZERO = bytes.maketrans(b'0123456789', b'0' * 10)
+LONG_NUMBER = b'0' * 19
+UNPARSED = object()
+
+
+def orjson_loads(data):
+    """
+    Parse `data` with orjson or return `UNPARSED`.
+
+    The stdlib has to parse the document when orjson is not installed,
+    could lose precision or rejects it: the stdlib accepts or reports
+    it as before.
+    """
+    if orjson is None:
+        return UNPARSED
+    if isinstance(data, str):
+        data = data.encode()
+    if LONG_NUMBER in data.translate(DIGITS_TO_ZERO):
+        return UNPARSED
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return UNPARSED
+
+
+def loads(data):
+    """`json.loads` through orjson when it is installed."""
+    parsed = orjson_loads(data)
+    return json.loads(data) if parsed is UNPARSED else parsed
+
+
+class FastJSONParser(JSONParser):
+    """`JSONParser` backed by orjson for UTF-8 request bodies."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+        body = stream.read()
+        parsed = orjson_loads(body)
+        if parsed is UNPARSED:
+            return super().parse(
+                io.BytesIO(body), media_type, parser_context
+            )
+        return parsed
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline delimited JSON into a list, line by line.
+
+    The whole list is kept in memory: the bulk import caps the body
+    at `BULK_IMPORT_MAX_SIZE`.
+    """
+
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        items = []
+        reader = codecs.getreader(encoding)(stream)
+        for number, line in enumerate(reader, 1):
+            if not line.strip():
+                continue
+            try:
+                items.append(loads(line))
+            except ValueError as exc:
+                raise ParseError(
+                    f'NDJSON parse error at line {number} - {exc}'
+                )
+        return items
@@ -0,0 +1,63 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if orjson is not None:
+    # Datetimes go to `JSONEncoder.default`, DRF formats them its own way.
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    `JSONRenderer` backed by orjson when it is installed.
+
+    Compact UTF-8 output (DRF defaults) is rendered by orjson, types it
+    does not know are converted by DRF's `JSONEncoder.default`, so the
+    result is the same JSON. Indented output, other JSON settings and
+    data orjson rejects (integers beyond 64 bits) go through the stdlib
+    encoder of the parent class, as does everything without orjson.
+
+    Known differences: floats with an exponent are written as `1e16`
+    instead of `1e+16`, and NaN and infinity as `null` where the parent
+    class raises `ValueError`. Finding them would mean walking the data
+    in Python, which costs about as much as the stdlib encoder; the
+    serializers of this API do not produce such floats.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        renderer_context = renderer_context or {}
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context)
+            is not None
+        ):
+            return super().render(
+                data, accepted_media_type, renderer_context
+            )
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=ORJSON_OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            return super().render(
+                data, accepted_media_type, renderer_context
+            )
+        # Escaped like in the parent class: JSON must stay a strict
+        # JavaScript subset.
+        return ret.replace(
+            b'\xe2\x80\xa8', b'\\u2028'
+        ).replace(
+            b'\xe2\x80\xa9', b'\\u2029'
+        )
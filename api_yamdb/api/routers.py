@@ -0,0 +1,112 @@
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+PIN_COOKIE = 'db_pin'
+
+replica_alias = ContextVar('replica_alias', default=None)
+replica_counter = itertools.count()
+
+
+@contextmanager
+def replica_reads(enabled=True):
+    """
+    Send reads of the ORM inside the block to one replica, the next of
+    `DATABASE_REPLICAS` in round robin.
+    """
+    replicas = settings.DATABASE_REPLICAS
+    alias = None
+    if enabled and replicas:
+        alias = replicas[next(replica_counter) % len(replicas)]
+    token = replica_alias.set(alias)
+    try:
+        yield
+    finally:
+        replica_alias.reset(token)
+
+
+def reads_from_replica():
+    return replica_alias.get() is not None
+
+
+def is_pinned(request):
+    """Whether the client wrote less than `READ_YOUR_WRITES_WINDOW` ago."""
+    return bool(request.get_signed_cookie(
+        PIN_COOKIE, default=None, salt=PIN_COOKIE,
+        max_age=settings.READ_YOUR_WRITES_WINDOW
+    ))
+
+
+class ReadReplicaRouter:
+    """
+    Reads go to the replica chosen by `replica_reads`, everything else
+    goes to the primary (`default`).
+    """
+
+    def db_for_read(self, model, **hints):
+        return replica_alias.get() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # Objects read from a replica are saved to the primary too.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+
+class ReadReplicaMiddleware:
+    """
+    Route safe-method requests to a read replica, one per request, so
+    the count, the page and the prefetches of a list see the same data.
+
+    A successful write pins its client to the primary for
+    `READ_YOUR_WRITES_WINDOW` seconds, so the client reads its own
+    reviews and comments before the replicas catch up. The pin is a
+    signed cookie with the time of the write: it follows the client to
+    any worker process and is not shared by clients behind one address.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+        if request.method in SAFE_METHODS:
+            with replica_reads(not is_pinned(request)):
+                return self.get_response(request)
+        return self.pin(self.get_response(request))
+
+    async def __acall__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return await self.get_response(request)
+        if request.method in SAFE_METHODS:
+            with replica_reads(not is_pinned(request)):
+                return await self.get_response(request)
+        return self.pin(await self.get_response(request))
+
+    @staticmethod
+    def pin(response):
+        if response.status_code < 400:
+            response.set_signed_cookie(
+                PIN_COOKIE, '1', salt=PIN_COOKIE,
+                max_age=settings.READ_YOUR_WRITES_WINDOW,
+                httponly=True, samesite='Lax'
+            )
+        return response
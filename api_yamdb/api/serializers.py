@@ -1,5 +1,10 @@
+from operator import attrgetter
+
+from django.db import models, transaction
 from rest_framework import serializers
 
+from api.db import bulk_create_with_pks
+from api.fields import BulkSlugRelatedField
 from api.utils import HTTPMethods
 from reviews.models import (
     Category,
@@ -74,11 +79,22 @@ class GenreSerializer(serializers.ModelSerializer):
         lookup_field = 'slug'
 
 
+class NameOrderedListSerializer(serializers.ListSerializer):
+    """List serializer that sorts objects by `name` in Python."""
+
+    def to_representation(self, data):
+        if isinstance(data, models.Manager):
+            data = data.all()
+        return super().to_representation(
+            sorted(data, key=attrgetter('name'))
+        )
+
+
 class TitleGetSerializer(serializers.ModelSerializer):
     """Сериализотор для возврата списка произвдений."""
 
-    genre = GenreSerializer(
-        many=True,
+    genre = NameOrderedListSerializer(
+        child=GenreSerializer(),
         read_only=True
     )
     category = CategorySerializer(
@@ -90,24 +106,91 @@ class TitleGetSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Title
-        fields = '__all__'
+        exclude = (
+            'rating_sum',
+            'rating_count',
+        )
+
+
+class TitleListSerializer(serializers.ListSerializer):
+    """
+    Batch validation and insert of titles for the bulk import.
+
+    Category and genre slugs of all items are resolved with
+    one query per model, items are validated one by one so that
+    errors are reported per item.
+    """
+
+    batch_size = 500
+
+    def preload_slugs(self):
+        category_slugs, genre_slugs = set(), set()
+        for item in self.initial_data:
+            if not isinstance(item, dict):
+                continue
+            if isinstance(item.get('category'), str):
+                category_slugs.add(item['category'])
+            if isinstance(item.get('genre'), list):
+                genre_slugs.update(
+                    slug for slug in item['genre'] if isinstance(slug, str)
+                )
+        self.context['preloaded'] = {
+            Category: Category.objects.in_bulk(
+                category_slugs, field_name='slug'
+            ),
+            Genre: Genre.objects.in_bulk(genre_slugs, field_name='slug'),
+        }
+
+    def validate_items(self):
+        """Return valid items data and errors by item index."""
+        if not isinstance(self.initial_data, list):
+            raise serializers.ValidationError(
+                'Ожидается список произведений.'
+            )
+        self.preload_slugs()
+        valid, errors = [], {}
+        for index, item in enumerate(self.initial_data):
+            try:
+                valid.append(self.child.run_validation(item))
+            except serializers.ValidationError as error:
+                errors[index] = error.detail
+        return valid, errors
+
+    def create(self, validated_data):
+        genres = [data.pop('genre', ()) for data in validated_data]
+        with transaction.atomic():
+            titles = bulk_create_with_pks(
+                Title,
+                (Title(**data) for data in validated_data),
+                batch_size=self.batch_size
+            )
+            GenreTitle.objects.bulk_create(
+                (
+                    GenreTitle(genre_id=genre, title_id=title)
+                    for title, title_genres in zip(titles, genres)
+                    for genre in title_genres
+                ),
+                batch_size=self.batch_size
+            )
+        return titles
 
 
 class TitleSerializer(serializers.ModelSerializer):
     """Сериализатор для добавления произведений."""
 
-    genre = serializers.SlugRelatedField(
+    genre = BulkSlugRelatedField(
         slug_field='slug',
         queryset=Genre.objects.all(),
         many=True
     )
-    category = serializers.SlugRelatedField(
+    category = BulkSlugRelatedField(
         slug_field='slug',
         queryset=Category.objects.all()
     )
 
     class Meta:
         model = Title
+        list_serializer_class = TitleListSerializer
         fields = (
             'name',
             'year',
@@ -119,18 +202,35 @@ class TitleSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         return TitleGetSerializer().to_representation(instance)
 
+    @staticmethod
+    def link_genres(title, genres, linked_ids=()):
+        """Bulk insert `GenreTitle` rows for genres not linked yet."""
+        GenreTitle.objects.bulk_create(
+            GenreTitle(genre_id=genre, title_id=title)
+            for genre in genres
+            if genre.pk not in linked_ids
+        )
+
     def create(self, validated_data):
-        if 'genre' not in self.initial_data:
-            return Title.objects.create(**validated_data)
-        genres = validated_data.pop('genre')
-        title = Title.objects.create(**validated_data)
-        for genre in genres:
-            GenreTitle.objects.create(
-                genre_id=genre,
-                title_id=title
-            )
+        genres = validated_data.pop('genre', ())
+        with transaction.atomic():
+            title = Title.objects.create(**validated_data)
+            self.link_genres(title, genres)
         return title
 
+    def update(self, instance, validated_data):
+        genres = validated_data.pop('genre', None)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if genres is not None:
+                linked = GenreTitle.objects.filter(title_id=instance)
+                linked_ids = set(linked.values_list('genre_id', flat=True))
+                linked.exclude(
+                    genre_id__in=[genre.pk for genre in genres]
+                ).delete()
+                self.link_genres(instance, genres, linked_ids)
+        return instance
+
 
 class CommentSerializer(serializers.ModelSerializer):
     """
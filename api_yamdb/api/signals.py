@@ -0,0 +1,61 @@
+from django.core.signals import request_started
+from django.db.backends.signals import connection_created
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from api.cache import (
+    CATEGORIES,
+    GENRES,
+    TITLES,
+    comments_namespace,
+    invalidate,
+    reviews_namespace,
+)
+from api.db import apply_sqlite_pragmas, check_connections
+from api.middleware import install_query_timer
+from reviews.models import (
+    Category,
+    Comment,
+    Genre,
+    GenreTitle,
+    Review,
+    Title,
+)
+
+INVALIDATED_NAMESPACES = {
+    Category: lambda category: (CATEGORIES, TITLES),
+    Genre: lambda genre: (GENRES, TITLES),
+    Title: lambda title: (TITLES,),
+    GenreTitle: lambda genre_title: (TITLES,),
+    Review: lambda review: (TITLES, reviews_namespace(review.title_id)),
+    Comment: lambda comment: (comments_namespace(comment.review_id),),
+}
+# Nested routes of a deleted parent answer 404 from now on, their
+# validators must not match any more.
+DELETED_PARENT_NAMESPACES = {
+    Title: lambda title: (reviews_namespace(title.pk),),
+    Review: lambda review: (comments_namespace(review.pk),),
+}
+
+
+def invalidate_responses(sender, instance, **kwargs):
+    """Invalidate cached responses that render the changed object."""
+    invalidate(*INVALIDATED_NAMESPACES[sender](instance))
+
+
+def invalidate_nested_responses(sender, instance, **kwargs):
+    invalidate(*DELETED_PARENT_NAMESPACES[sender](instance))
+
+
+def invalidate_title_genres(sender, **kwargs):
+    invalidate(TITLES)
+
+
+for model in INVALIDATED_NAMESPACES:
+    post_save.connect(invalidate_responses, sender=model)
+    post_delete.connect(invalidate_responses, sender=model)
+for model in DELETED_PARENT_NAMESPACES:
+    post_delete.connect(invalidate_nested_responses, sender=model)
+m2m_changed.connect(invalidate_title_genres, sender=GenreTitle)
+connection_created.connect(apply_sqlite_pragmas)
+connection_created.connect(install_query_timer)
+request_started.connect(check_connections)
@@ -1,6 +1,8 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework import routers
 
+from api.async_views import async_read_urls
 from api.views import (
     CategoryViewSet,
     CommentViewSet,
@@ -53,8 +55,12 @@ router_v1.register(
     basename='titles'
 )
 
+router_urls = router_v1.urls
+if settings.ASYNC_READ_VIEWS:
+    router_urls = async_read_urls(router_urls)
+
 urlpatterns = [
     path('v1/auth/token/', get_jwt_token_for_user, name='token'),
     path('v1/auth/signup/', signup),
-    path('v1/', include(router_v1.urls)),
+    path('v1/', include(router_urls)),
 ]
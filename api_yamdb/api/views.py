@@ -1,12 +1,23 @@
-from django.db.models import Avg
-from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, viewsets
+from rest_framework import filters, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
-
-from api.filters import TitleFilter
-from api.mixins import ListCreateDestroyViewSet
+from rest_framework.response import Response
+
+from api.filters import TitleFilter, TitleSearchFilter
+from api import cache
+from api.mixins import (
+    ListCreateDestroyViewSet,
+    ParentObjectMixin,
+    VersionedListMixin,
+    VersionedRetrieveMixin,
+)
+from api.pagination import PageNumberOrCursorPagination
+from api.parsers import FastJSONParser, NDJSONParser
 from api.permissions import (
+    IsAdmin,
     IsAdminUserOrReadOnly,
     IsAdminModeratorAuthorOrReadOnly,
 )
@@ -21,79 +32,99 @@ from api.serializers import (
 from api.utils import HTTPMethods
 from reviews.models import (
     Category,
+    Comment,
     Genre,
     Review,
     Title,
 )
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(
+    ParentObjectMixin,
+    VersionedListMixin,
+    VersionedRetrieveMixin,
+    viewsets.ModelViewSet
+):
     """
     Review model ViewsSet.
 
     Only authenticated users can add new reviews.
     Users can edit only their own reviews.
     Admins and moders can edit reviews of all users.
+    `?pagination=cursor` switches the list to cursor pagination.
+    GET responses carry ETag and Last-Modified of the title reviews.
     """
 
+    queryset = Review.objects.select_related('author')
     serializer_class = ReviewSerializer
     permission_classes = (
         IsAuthenticatedOrReadOnly,
         IsAdminModeratorAuthorOrReadOnly,
     )
-
-    def get_queryset(self):
-        title = get_object_or_404(Title, pk=self.kwargs['title_id'])
-        return title.reviews.all()
+    pagination_class = PageNumberOrCursorPagination
+    parent_model = Title
+    parent_field = 'title'
+    parent_lookups = {'pk': 'title_id'}
+
+    def get_cache_namespaces(self):
+        return (
+            cache.reviews_namespace(self.kwargs['title_id']),
+            cache.AUTHORS,
+        )
 
     def perform_create(self, serializer):
-        title = get_object_or_404(Title, pk=self.kwargs.get('title_id'))
-        serializer.save(author=self.request.user, title=title)
+        serializer.save(author=self.request.user, title=self.get_parent())
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(
+    ParentObjectMixin,
+    VersionedListMixin,
+    VersionedRetrieveMixin,
+    viewsets.ModelViewSet
+):
     """
     Comment model ViewsSet.
 
     Only authenticated users can add new comments.
     Users can edit only their own comments.
     Admins and moders can edit coments of all users.
+    `?pagination=cursor` switches the list to cursor pagination.
+    GET responses carry ETag and Last-Modified of the review comments.
     """
 
+    queryset = Comment.objects.select_related('author')
     serializer_class = CommentSerializer
     permission_classes = (
         IsAuthenticatedOrReadOnly,
         IsAdminModeratorAuthorOrReadOnly,
     )
-
-    def get_queryset(self):
-        review = get_object_or_404(
-            Review,
-            pk=self.kwargs['review_id'],
-            title=self.kwargs['title_id']
+    pagination_class = PageNumberOrCursorPagination
+    parent_model = Review
+    parent_field = 'review'
+    parent_lookups = {'pk': 'review_id', 'title': 'title_id'}
+
+    def get_cache_namespaces(self):
+        return (
+            cache.comments_namespace(self.kwargs['review_id']),
+            cache.AUTHORS,
         )
-        return review.comments.all()
 
     def perform_create(self, serializer):
-        serializer.save(
-            author=self.request.user,
-            review=get_object_or_404(
-                Review,
-                pk=self.kwargs['review_id'],
-                title=self.kwargs['title_id']
-            )
-        )
+        serializer.save(author=self.request.user, review=self.get_parent())
 
 
-class CategoryViewSet(ListCreateDestroyViewSet):
+class CategoryViewSet(VersionedListMixin, ListCreateDestroyViewSet):
     """
     Category model ViewsSet.
 
     Only the administrator can retrieve the data.
+    List responses are cached and support conditional GET.
     """
 
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    cache_namespace = cache.CATEGORIES
+    cache_responses = True
     permission_classes = (
         IsAdminUserOrReadOnly,
     )
@@ -102,16 +133,19 @@ class CategoryViewSet(ListCreateDestroyViewSet):
     )
 
 
-class GenreViewSet(ListCreateDestroyViewSet):
+class GenreViewSet(VersionedListMixin, ListCreateDestroyViewSet):
     """
     Genre model ViewSet.
 
     Only the administrator can retrieve the data.
-    The search is by name.
+    The search is by name. List responses are cached
+    and support conditional GET.
     """
 
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
+    cache_namespace = cache.GENRES
+    cache_responses = True
     permission_classes = (
         IsAdminUserOrReadOnly,
     )
@@ -122,24 +156,37 @@ class GenreViewSet(ListCreateDestroyViewSet):
     lookup_field = 'slug'
 
 
-class TitleViewSet(viewsets.ModelViewSet):
+class TitleViewSet(
+    VersionedListMixin,
+    VersionedRetrieveMixin,
+    viewsets.ModelViewSet
+):
     """
     Title model ViewSet.
 
-    We calculate the average rating and sort by name.
+    The rating is read from totals stored on the title and sorted by name.
     We did this so that there would be equal paganation.
     Only the administrator can retrieve the data.
+    `?search=` runs a full-text search ordered by relevance.
+    List and detail responses are cached and support conditional GET.
     """
 
-    queryset = Title.objects.annotate(
-        rating=Avg('reviews__score')
+    queryset = Title.objects.select_related(
+        'category'
+    ).prefetch_related(
+        # Unordered: `TitleGetSerializer` sorts the few genres of a title
+        # by name, sorting them in SQL needs a temporary B-tree.
+        Prefetch('genre', queryset=Genre.objects.order_by())
     ).order_by('name')
     serializer_class = TitleSerializer
+    cache_namespace = cache.TITLES
+    cache_responses = True
     permission_classes = (
         IsAdminUserOrReadOnly,
     )
     filter_backends = (
         DjangoFilterBackend,
+        TitleSearchFilter,
     )
     filterset_class = TitleFilter
 
@@ -147,3 +194,47 @@ class TitleViewSet(viewsets.ModelViewSet):
         if self.request.method == HTTPMethods.GET:
             return TitleGetSerializer
         return TitleSerializer
+
+    @action(
+        methods=[HTTPMethods.POST],
+        detail=False,
+        permission_classes=(IsAdmin,),
+        parser_classes=(FastJSONParser, NDJSONParser),
+    )
+    def bulk(self, request):
+        """
+        Import a JSON array or NDJSON stream of titles.
+
+        Valid items are inserted in bulk, invalid ones are skipped
+        and reported by their index in `errors`. Bodies larger than
+        `BULK_IMPORT_MAX_SIZE` are rejected before they are read.
+        """
+        content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+        if content_length > settings.BULK_IMPORT_MAX_SIZE:
+            return Response(
+                {
+                    'detail': (
+                        f'Тело запроса больше '
+                        f'{settings.BULK_IMPORT_MAX_SIZE} байт.'
+                    ),
+                },
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+        serializer = self.get_serializer(data=request.data, many=True)
+        valid, errors = serializer.validate_items()
+        titles = serializer.create(valid) if valid else []
+        if titles:
+            cache.invalidate(cache.TITLES)
+        return Response(
+            {
+                'created': [title.pk for title in titles],
+                'errors': [
+                    {'index': index, 'errors': item_errors}
+                    for index, item_errors in errors.items()
+                ],
+            },
+            status=(
+                status.HTTP_400_BAD_REQUEST if errors and not titles
+                else status.HTTP_201_CREATED
+            )
+        )
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from datetime import timedelta
@@ -37,6 +38,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.middleware.RequestMetricsMiddleware',
+    'api.routers.ReadReplicaMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -67,15 +70,136 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'api_yamdb.wsgi.application'
 
+# Serve the hot read routes with async views (api.async_views). Meant
+# for ASGI servers: set ASYNC_READ_VIEWS=1 in their environment. Off by
+# default, under WSGI the views would only add async_to_sync overhead.
+ASYNC_READ_VIEWS = os.getenv('ASYNC_READ_VIEWS', '') == '1'
+
 
 # Database
 
-DATABASES = {
+# Deployment profile of the database, chosen by the DATABASE_PROFILE
+# environment variable:
+#   sqlite - the local file, a new connection per request (default);
+#   sqlite-persistent - the local file, connections kept between requests;
+#   postgresql - PostgreSQL (POSTGRES_* variables) with a connection pool
+#   per process, see the README for sizing DB_POOL_MAX_SIZE.
+DATABASE_PROFILE = os.getenv('DATABASE_PROFILE', 'sqlite')
+
+# Seconds a connection is reused between requests in the
+# sqlite-persistent profile.
+DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE', 600))
+
+if DATABASE_PROFILE == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+        }
+    }
+elif DATABASE_PROFILE == 'sqlite-persistent':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            # Reused connections are checked at the start of every
+            # request (api.db.check_connections).
+            'CONN_HEALTH_CHECKS': True,
+        }
+    }
+elif DATABASE_PROFILE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'api.backends.postgresql_pool',
+            'NAME': os.getenv('POSTGRES_DB', 'yamdb'),
+            'USER': os.getenv('POSTGRES_USER', 'yamdb'),
+            'PASSWORD': os.getenv('POSTGRES_PASSWORD', ''),
+            'HOST': os.getenv('POSTGRES_HOST', 'localhost'),
+            'PORT': os.getenv('POSTGRES_PORT', '5432'),
+            # Connections go back to the pool after every request and
+            # are checked when taken from it.
+            'CONN_MAX_AGE': 0,
+            'CONN_HEALTH_CHECKS': True,
+            'POOL': {
+                'MIN_SIZE': int(os.getenv('DB_POOL_MIN_SIZE', 1)),
+                'MAX_SIZE': int(os.getenv('DB_POOL_MAX_SIZE', 20)),
+                'TIMEOUT': float(os.getenv('DB_POOL_TIMEOUT', 30)),
+            },
+        }
+    }
+else:
+    raise ValueError(f'Unknown DATABASE_PROFILE: {DATABASE_PROFILE}')
+
+# Read replicas of the primary: comma-separated hosts (postgresql) or
+# SQLite files in the DATABASE_REPLICAS environment variable. Safe-method
+# requests read from them round robin (api.routers), a client reads from
+# the primary for READ_YOUR_WRITES_WINDOW seconds after its own write.
+DATABASE_REPLICAS = []
+for number, location in enumerate(
+    filter(None, os.getenv('DATABASE_REPLICAS', '').split(',')), 1
+):
+    DATABASE_REPLICAS.append(f'replica{number}')
+    DATABASES[f'replica{number}'] = {
+        **DATABASES['default'],
+        'HOST' if DATABASE_PROFILE == 'postgresql' else 'NAME': location,
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_ROUTERS = ['api.routers.ReadReplicaRouter']
+READ_YOUR_WRITES_WINDOW = 5
+
+# PRAGMA statements run on every new SQLite connection: WAL lets readers
+# work alongside a writer, busy_timeout (ms) makes writers wait for the
+# lock instead of failing, cache_size is in KiB when negative.
+# An empty dict keeps the SQLite defaults.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+
+# Cache
+
+# CACHE_BACKEND and CACHE_LOCATION replace the local memory cache,
+# see the api.W001 check of `manage.py check --deploy`.
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
     }
 }
+if os.getenv('CACHE_BACKEND'):
+    CACHES['default'] = {
+        'BACKEND': os.getenv('CACHE_BACKEND'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+
+# Cache alias and timeout (seconds) for read-only catalogue responses.
+API_CACHE_ALIAS = 'default'
+API_CACHE_TIMEOUT = 60 * 60
+
+# Lifetime (seconds) of users cached by CachedJWTAuthentication.
+USER_CACHE_TIMEOUT = 60
+
+
+# Largest body (bytes) of the bulk title import: the parsed items
+# are held in memory.
+BULK_IMPORT_MAX_SIZE = 10 * 1024 * 1024
+
+
+# Per-route request metrics of RequestMetricsMiddleware: directory
+# for per-process dumps (the REQUEST_METRICS_DIR environment variable,
+# no dumps when unset), the dump interval and how long (seconds) dumps
+# of finished processes are kept.
+REQUEST_METRICS_DIR = os.getenv('REQUEST_METRICS_DIR') or None
+REQUEST_METRICS_FLUSH_INTERVAL = 10
+REQUEST_METRICS_RETENTION = 60 * 60
 
 
 # Password validation
@@ -131,7 +255,18 @@ REST_FRAMEWORK = {
     ],
 
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.RoleClaimsJWTAuthentication',
+    ],
+
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
 }
 
@@ -178,3 +313,15 @@ SIMPLE_JWT = {
 EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
 DEFAULT_FROM_EMAIL = 'admin@12sprint.ru'
+
+# Queue of outgoing emails drained by `send_queued_mail`: attempts
+# before giving up, base retry delay (seconds, doubled after each
+# failure), how long (seconds) a claimed email stays with a worker
+# and how long (seconds) sent and failed emails are kept.
+MAIL_QUEUE_MAX_ATTEMPTS = 5
+MAIL_QUEUE_RETRY_DELAY = 30
+MAIL_QUEUE_LOCK_TIMEOUT = 5 * 60
+MAIL_QUEUE_RETENTION = 7 * 24 * 60 * 60
+
+# Lifetime (seconds) of confirmation codes sent on signup.
+CONFIRMATION_CODE_LIFETIME = 24 * 60 * 60
@@ -0,0 +1,382 @@
+import math
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+from django.db.models import Max
+
+from api.cache import CATEGORIES, GENRES, TITLES, invalidate
+from reviews.management.commands.load_csv import (
+    Command as LoadCSVCommand,
+    explicit_values,
+)
+from reviews.models import (
+    Category,
+    Comment,
+    Genre,
+    GenreTitle,
+    Review,
+    Title,
+    User,
+)
+
+WORDS = (
+    'красный', 'ночь', 'река', 'история', 'сад', 'зима', 'город', 'песня',
+    'свет', 'империя', 'тень', 'дом', 'море', 'сон', 'дорога', 'звезда',
+    'последний', 'тихий', 'далёкий', 'старый', 'северный', 'золотой',
+)
+DATES_FROM = datetime(2015, 1, 1, tzinfo=timezone.utc)
+DATES_SPAN = int(
+    (datetime(2023, 1, 1, tzinfo=timezone.utc) - DATES_FROM).total_seconds()
+)
+# Distinct texts generated up front, rows pick one of them.
+TEXT_POOL_SIZE = 4096
+# Terms of the harmonic number summed exactly, the tail is integrated.
+HARMONIC_EXACT_TERMS = 100000
+# Columns of generated rows.
+TITLE_COLUMNS = (
+    'id', 'name', 'year', 'description', 'category_id', 'rating_sum',
+    'rating_count',
+)
+REVIEW_COLUMNS = ('id', 'title_id', 'author_id', 'score', 'text', 'pub_date')
+COMMENT_COLUMNS = ('review_id', 'author_id', 'text', 'pub_date')
+
+
+def next_id(model):
+    return (model.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+
+
+def harmonic(n, skew):
+    """Generalized harmonic number `sum(k ** -skew for k in 1..n)`."""
+    exact = min(n, HARMONIC_EXACT_TERMS)
+    total = math.fsum(k ** -skew for k in range(1, exact + 1))
+    if n > exact:
+        low, high = exact + 0.5, n + 0.5
+        if skew == 1:
+            total += math.log(high / low)
+        else:
+            total += (high ** (1 - skew) - low ** (1 - skew)) / (1 - skew)
+    return total
+
+
+def zipf_counts(total, n, skew, rng, cap=None):
+    """
+    Split about `total` items between `n` buckets by Zipf's law.
+
+    Bucket popularity ranks are a pseudo-random permutation `(a*i+b) % n`,
+    so nothing of size `n` is kept in memory. Fractional counts are
+    rounded stochastically, which keeps the expected sum equal to `total`.
+    """
+    if not n:
+        return
+    multiplier = 1
+    if n > 1:
+        multiplier = rng.randrange(1, n)
+        while math.gcd(multiplier, n) != 1:
+            multiplier = rng.randrange(1, n)
+    offset = rng.randrange(n)
+    scale = total / harmonic(n, skew)
+    for idx in range(n):
+        rank = (multiplier * idx + offset) % n + 1
+        count = int(scale * rank ** -skew + rng.random())
+        yield count if cap is None else min(count, cap)
+
+
+def random_date(rng):
+    return DATES_FROM + timedelta(seconds=rng.randrange(DATES_SPAN))
+
+
+def sentence(rng, words):
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+@contextmanager
+def sqlite_bulk_mode(enabled):
+    """
+    Switch SQLite to WAL and turn off fsync while loading.
+
+    The journal mode is stored in the database file: the previous one
+    is restored afterwards, like `synchronous`.
+    """
+    if not enabled or connection.vendor != 'sqlite':
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA journal_mode')
+        journal_mode = cursor.fetchone()[0]
+        cursor.execute('PRAGMA synchronous')
+        synchronous = cursor.fetchone()[0]
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=OFF')
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f'PRAGMA synchronous={synchronous}')
+            cursor.execute(f'PRAGMA journal_mode={journal_mode}')
+
+
+class RawInsert:
+    """
+    `INSERT` of rows of column values with `executemany`.
+
+    Skips model instances and SQL compilation of `bulk_create`, which
+    take most of the time of a load. Columns left out of `columns`
+    get the default of their field, the auto primary key is left to
+    the database.
+    """
+
+    def __init__(self, model, columns):
+        meta = model._meta
+        template = model()
+        fields = [
+            field for field in meta.concrete_fields
+            if field.attname not in columns
+            and not isinstance(field, models.AutoField)
+        ]
+        self.defaults = tuple(
+            field.get_db_prep_save(field.pre_save(template, True), connection)
+            for field in fields
+        )
+        self.datetimes = [
+            idx for idx, column in enumerate(columns)
+            if isinstance(meta.get_field(column), models.DateTimeField)
+        ]
+        names = [
+            connection.ops.quote_name(meta.get_field(column).column)
+            for column in columns
+        ] + [connection.ops.quote_name(field.column) for field in fields]
+        self.sql = (
+            f'INSERT INTO {connection.ops.quote_name(meta.db_table)} '
+            f'({", ".join(names)}) VALUES ({", ".join(["%s"] * len(names))})'
+        )
+
+    @staticmethod
+    def adapt_datetime(value):
+        if connection.timezone_name == 'UTC':
+            # Generated datetimes are in UTC: skip the conversion.
+            return str(value.replace(tzinfo=None))
+        return connection.ops.adapt_datetimefield_value(value)
+
+    def __call__(self, rows):
+        adapt = self.adapt_datetime
+        if self.datetimes:
+            rows = [list(row) for row in rows]
+            for row in rows:
+                for idx in self.datetimes:
+                    row[idx] = adapt(row[idx])
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(
+                self.sql, [(*row, *self.defaults) for row in rows]
+            )
+
+
+class Command(BaseCommand):
+    help = (
+        'Генерирует детерминированный по seed синтетический набор данных: '
+        'число отзывов на произведение и комментариев на отзыв '
+        'распределено по закону Ципфа.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--genres', type=int, default=50)
+        parser.add_argument('--titles', type=int, default=10000)
+        parser.add_argument(
+            '--reviews',
+            type=int,
+            default=100000,
+            help='Ожидаемое общее число отзывов.'
+        )
+        parser.add_argument(
+            '--comments',
+            type=int,
+            default=200000,
+            help='Ожидаемое общее число комментариев.'
+        )
+        parser.add_argument(
+            '--skew',
+            type=float,
+            default=1.1,
+            help='Показатель степени распределения Ципфа.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Количество строк в одном INSERT.'
+        )
+        parser.add_argument(
+            '--wal',
+            action='store_true',
+            help='Перевести SQLite в режим WAL и отключить fsync '
+                 'на время загрузки.'
+        )
+        parser.add_argument(
+            '--raw',
+            action='store_true',
+            help='Писать в SQLite через executemany в обход bulk_create.'
+        )
+
+    def handle(self, *args, **options):
+        for name in ('users', 'categories', 'genres', 'titles'):
+            if options[name] < 1:
+                raise CommandError(f'--{name} должен быть больше нуля.')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size должен быть больше нуля.')
+        if options['skew'] <= 0:
+            raise CommandError('--skew должен быть больше нуля.')
+        if options['raw'] and connection.vendor != 'sqlite':
+            raise CommandError('--raw поддерживается только для SQLite.')
+        self.raw = options['raw']
+        self.raw_inserts = {}
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.texts = [
+            sentence(self.rng, self.rng.randint(3, 40))
+            for _ in range(TEXT_POOL_SIZE)
+        ]
+        self.stats = {}
+        started = time.perf_counter()
+        with sqlite_bulk_mode(options['wal']):
+            user_ids = self.generate_users(options['users'])
+            category_ids = self.generate_named(
+                Category, 'category', options['categories']
+            )
+            genre_ids = self.generate_named(
+                Genre, 'genre', options['genres']
+            )
+            review_ids = self.generate_titles(
+                options['titles'], options['reviews'], options['skew'],
+                user_ids, category_ids, genre_ids
+            )
+            self.generate_comments(
+                options['comments'], options['skew'], review_ids, user_ids
+            )
+        LoadCSVCommand.reset_sequences(list(self.stats))
+        invalidate(CATEGORIES, GENRES, TITLES)
+        for model, (rows, elapsed) in self.stats.items():
+            self.stdout.write(
+                f'{model._meta.verbose_name_plural}: {rows} строк за '
+                f'{elapsed:.2f} с '
+                f'({rows / elapsed if elapsed else rows:.0f} строк/с)'
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'Генерация завершена за {time.perf_counter() - started:.1f} с.'
+        ))
+
+    def insert(self, model, columns, rows):
+        """Write an iterable of rows of `columns` values in batches."""
+        rows = iter(rows)
+        write = self.raw_insert(model, columns) if self.raw else None
+        count, elapsed = self.stats.get(model, (0, 0))
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                break
+            started = time.perf_counter()
+            if write is not None:
+                write(batch)
+            else:
+                model.objects.bulk_create(
+                    (model(**dict(zip(columns, row))) for row in batch),
+                    batch_size=self.batch_size
+                )
+            elapsed += time.perf_counter() - started
+            count += len(batch)
+        self.stats[model] = (count, elapsed)
+
+    def raw_insert(self, model, columns):
+        if (model, columns) not in self.raw_inserts:
+            self.raw_inserts[model, columns] = RawInsert(model, columns)
+        return self.raw_inserts[model, columns]
+
+    def generate_users(self, amount):
+        first = next_id(User)
+        self.insert(User, ('id', 'username', 'email'), (
+            (pk, f'user{pk}', f'user{pk}@yamdb.fake')
+            for pk in range(first, first + amount)
+        ))
+        return range(first, first + amount)
+
+    def generate_named(self, model, prefix, amount):
+        first = next_id(model)
+        self.insert(model, ('id', 'name', 'slug'), (
+            (pk, f'{prefix.capitalize()} {pk}', f'{prefix}-{pk}')
+            for pk in range(first, first + amount)
+        ))
+        return range(first, first + amount)
+
+    def generate_titles(self, amount, reviews, skew, user_ids, category_ids,
+                        genre_ids):
+        """
+        Write titles with their genres and reviews.
+
+        Ratings are summed up while reviews are generated, so titles are
+        stored with final `rating_sum`/`rating_count` right away.
+        Returns the range of created review ids.
+        """
+        rng = self.rng
+        first_title = next_id(Title)
+        first_review = review_id = next_id(Review)
+        counts = zipf_counts(reviews, amount, skew, rng, cap=len(user_ids))
+        title_ids = iter(range(first_title, first_title + amount))
+        pub_date = Review._meta.get_field('pub_date')
+        with explicit_values([pub_date]):
+            while True:
+                chunk = list(islice(title_ids, self.batch_size))
+                if not chunk:
+                    break
+                titles, links, chunk_reviews = [], [], []
+                for title_id, count in zip(chunk, counts):
+                    offset = rng.randrange(len(user_ids))
+                    rating_sum = 0
+                    for idx in range(count):
+                        score = round(rng.triangular(1, 10, 8))
+                        rating_sum += score
+                        chunk_reviews.append((
+                            review_id,
+                            title_id,
+                            user_ids[(offset + idx) % len(user_ids)],
+                            score,
+                            rng.choice(self.texts),
+                            random_date(rng),
+                        ))
+                        review_id += 1
+                    titles.append((
+                        title_id,
+                        sentence(rng, rng.randint(1, 4)).capitalize(),
+                        rng.randint(1900, 2023),
+                        rng.choice(self.texts),
+                        rng.choice(category_ids),
+                        rating_sum,
+                        count,
+                    ))
+                    links.extend(
+                        (title_id, genre_id)
+                        for genre_id in rng.sample(
+                            genre_ids, min(rng.randint(1, 3), len(genre_ids))
+                        )
+                    )
+                self.insert(Title, TITLE_COLUMNS, titles)
+                self.insert(GenreTitle, ('title_id_id', 'genre_id_id'), links)
+                self.insert(Review, REVIEW_COLUMNS, chunk_reviews)
+        return range(first_review, review_id)
+
+    def generate_comments(self, amount, skew, review_ids, user_ids):
+        rng = self.rng
+        counts = zipf_counts(amount, len(review_ids), skew, rng)
+        comments = (
+            (review_id, rng.choice(user_ids), rng.choice(self.texts),
+             random_date(rng))
+            for review_id, count in zip(review_ids, counts)
+            for _ in range(count)
+        )
+        with explicit_values([Comment._meta.get_field('pub_date')]):
+            self.insert(Comment, COMMENT_COLUMNS, comments)
@@ -0,0 +1,140 @@
+import csv
+import time
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from api.cache import CATEGORIES, GENRES, TITLES, invalidate
+from reviews.models import (
+    Category,
+    Comment,
+    Genre,
+    GenreTitle,
+    Review,
+    Title,
+    User,
+)
+
+# Files in dependency order: CSV file, model, CSV column -> model field.
+CSV_FILES = (
+    ('users.csv', User, {}),
+    ('category.csv', Category, {}),
+    ('genre.csv', Genre, {}),
+    ('titles.csv', Title, {}),
+    ('genre_title.csv', GenreTitle, {}),
+    ('review.csv', Review, {'title_id': 'title'}),
+    ('comments.csv', Comment, {'review_id': 'review'}),
+)
+
+
+@contextmanager
+def explicit_values(fields):
+    """Let bulk_create keep CSV values of `auto_now_add` fields."""
+    fields = [
+        field for field in fields if getattr(field, 'auto_now_add', False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+class Command(BaseCommand):
+    help = (
+        'Потоково загружает CSV-файлы с данными в базу пачками '
+        'через bulk_create.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default=settings.BASE_DIR / 'static' / 'data',
+            type=Path,
+            help='Каталог с CSV-файлами.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            default=1000,
+            type=int,
+            help='Количество строк в одном INSERT.'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        batch_size = options['batch_size']
+        if not path.is_dir():
+            raise CommandError(f'Каталог {path} не найден.')
+        if batch_size < 1:
+            raise CommandError('--batch-size должен быть больше нуля.')
+        loaded = []
+        for filename, model, columns in CSV_FILES:
+            file_path = path / filename
+            if not file_path.exists():
+                self.stdout.write(
+                    self.style.WARNING(f'{filename}: файл не найден.')
+                )
+                continue
+            started = time.perf_counter()
+            rows = self.load_file(file_path, model, columns, batch_size)
+            elapsed = time.perf_counter() - started
+            loaded.append(model)
+            self.stdout.write(
+                f'{filename}: {rows} строк за {elapsed:.2f} с '
+                f'({rows / elapsed if elapsed else rows:.0f} строк/с)'
+            )
+        self.reset_sequences(loaded)
+        invalidate(CATEGORIES, GENRES, TITLES)
+        if Review in loaded:
+            call_command('rebuild_ratings', stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS('Загрузка завершена.'))
+
+    def load_file(self, file_path, model, columns, batch_size):
+        with open(file_path, encoding='utf-8', newline='') as csv_file:
+            reader = csv.reader(csv_file)
+            header = next(reader, None)
+            if not header:
+                return 0
+            fields = [
+                model._meta.get_field(columns.get(column, column))
+                for column in header
+            ]
+            objects = (self.build(model, fields, row) for row in reader)
+            rows = 0
+            with transaction.atomic(), explicit_values(fields):
+                while True:
+                    batch = list(islice(objects, batch_size))
+                    if not batch:
+                        break
+                    model.objects.bulk_create(batch, batch_size=batch_size)
+                    rows += len(batch)
+        return rows
+
+    @staticmethod
+    def build(model, fields, row):
+        values = {}
+        for field, value in zip(fields, row):
+            if value == '':
+                value = None if field.null else ''
+            elif field.is_relation:
+                value = field.target_field.to_python(value)
+            else:
+                value = field.to_python(value)
+            values[field.attname] = value
+        return model(**values)
+
+    @staticmethod
+    def reset_sequences(models):
+        statements = connection.ops.sequence_reset_sql(no_style(), models)
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+from api.cache import TITLES, invalidate
+from reviews.models import Review, Title
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает сохранённые рейтинги произведений по отзывам.'
+
+    def handle(self, *args, **options):
+        reviews = Review.objects.filter(
+            title=OuterRef('pk')
+        ).order_by().values('title')
+        with transaction.atomic():
+            updated = Title.objects.update(
+                rating_sum=Coalesce(
+                    Subquery(
+                        reviews.annotate(total=Sum('score')).values('total'),
+                        output_field=IntegerField()
+                    ),
+                    0
+                ),
+                rating_count=Coalesce(
+                    Subquery(
+                        reviews.annotate(total=Count('pk')).values('total'),
+                        output_field=IntegerField()
+                    ),
+                    0
+                ),
+            )
+            invalidate(TITLES)
+        self.stdout.write(
+            self.style.SUCCESS(f'Пересчитаны рейтинги {updated} произведений.')
+        )
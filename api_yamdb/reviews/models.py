@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 
 from reviews.validators import now_year_validator
 
@@ -23,6 +24,9 @@ class Category(models.Model):
         verbose_name = 'Категория'
         verbose_name_plural = 'Категории'
         ordering = ('name',)
+        indexes = [
+            models.Index(fields=('name',), name='category_name_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.name[:LENGTH_CHAR]
@@ -44,6 +48,9 @@ class Genre(models.Model):
         verbose_name = 'Жанр'
         verbose_name_plural = 'Жанры'
         ordering = ('name',)
+        indexes = [
+            models.Index(fields=('name',), name='genre_name_idx'),
+        ]
 
     def __str__(self):
         return self.name[:LENGTH_CHAR]
@@ -76,6 +83,16 @@ class Title(models.Model):
         null=True,
         blank=True
     )
+    rating_sum = models.PositiveIntegerField(
+        verbose_name='Сумма оценок',
+        default=0,
+        editable=False
+    )
+    rating_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок',
+        default=0,
+        editable=False
+    )
 
     class Meta:
         verbose_name = 'Произведение'
@@ -83,10 +100,33 @@ class Title(models.Model):
         ordering = (
             'name',
         )
+        indexes = [
+            models.Index(fields=('name',), name='title_name_idx'),
+            models.Index(fields=('year', 'name'), name='title_year_name_idx'),
+            models.Index(
+                fields=('category', 'name'),
+                name='title_category_name_idx'
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name[:LENGTH_CHAR]
 
+    @property
+    def rating(self):
+        """Average review score rounded down, `None` without reviews."""
+        if not self.rating_count:
+            return None
+        return self.rating_sum // self.rating_count
+
+    @classmethod
+    def add_score(cls, title_id, score, count=1):
+        """Shift stored rating totals of the title by `score`/`count`."""
+        cls.objects.filter(pk=title_id).update(
+            rating_sum=F('rating_sum') + score,
+            rating_count=F('rating_count') + count
+        )
+
 
 class GenreTitle(models.Model):
     title_id = models.ForeignKey(
@@ -104,6 +144,12 @@ class GenreTitle(models.Model):
         verbose_name = 'Произведение и жанры'
         verbose_name_plural = 'Произведения и жанры'
         unique_together = ('title_id', 'genre_id')
+        indexes = [
+            models.Index(
+                fields=('genre_id', 'title_id'),
+                name='genretitle_genre_title_idx'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.title_id}, {self.genre_id}'
@@ -121,6 +167,8 @@ class Review(models.Model):
     * pub_date(DateTime) - review add date, auto on add.
 
     User can have only one review for a single title. Ordered by `pub_date`.
+    Saving a review updates `rating_sum`/`rating_count` of its title
+    in the same transaction.
     """
 
     SCORE_ERROR_MESSAGE = 'Score must be in range from 1 to 10'
@@ -158,6 +206,12 @@ class Review(models.Model):
                 name='unique_author_title'
             )
         ]
+        indexes = [
+            models.Index(
+                fields=('title', 'pub_date', 'id'),
+                name='review_title_pub_date_idx'
+            )
+        ]
         ordering = ('-pub_date',)
         verbose_name = 'Отзыв'
         verbose_name_plural = 'Отзывы'
@@ -165,6 +219,31 @@ class Review(models.Model):
     def __str__(self):
         return self.text[:LENGTH_CHAR]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = (
+            instance.__dict__.get('title_id'),
+            instance.__dict__.get('score'),
+        )
+        return instance
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        loaded_title_id, loaded_score = getattr(
+            self, '_loaded_rating', (None, None)
+        )
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                Title.add_score(self.title_id, self.score)
+            elif loaded_title_id != self.title_id:
+                Title.add_score(loaded_title_id, -loaded_score, -1)
+                Title.add_score(self.title_id, self.score)
+            elif loaded_score != self.score:
+                Title.add_score(self.title_id, self.score - loaded_score, 0)
+        self._loaded_rating = (self.title_id, self.score)
+
 
 class Comment(models.Model):
     """
@@ -200,6 +279,12 @@ class Comment(models.Model):
     )
 
     class Meta:
+        indexes = [
+            models.Index(
+                fields=('review', 'pub_date', 'id'),
+                name='comment_review_pub_date_idx'
+            )
+        ]
         ordering = ('-pub_date',)
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
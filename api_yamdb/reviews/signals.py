@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from reviews.models import Review, Title
+
+
+@receiver(post_delete, sender=Review)
+def remove_review_score(sender, instance, **kwargs):
+    """Subtract deleted review score from its title rating totals."""
+    Title.add_score(instance.title_id, -instance.score, -1)
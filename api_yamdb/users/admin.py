@@ -0,0 +1,21 @@
+from django.contrib import admin
+
+from users.models import QueuedEmail
+
+
+@admin.register(QueuedEmail)
+class QueuedEmailAdmin(admin.ModelAdmin):
+    """Админка очереди писем."""
+
+    list_display = (
+        'pk',
+        'subject',
+        'recipients',
+        'status',
+        'attempts',
+        'next_attempt_at',
+        'sent_at',
+    )
+    search_fields = ('recipients',)
+    list_filter = ('status',)
+    empty_value_display = '-empty-'
@@ -0,0 +1,135 @@
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.functional import SimpleLazyObject
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from api.cache import get_cache
+from api.routers import replica_reads
+from users.tokens import ROLE_CLAIM, SUPERUSER_CLAIM, VERSION_CLAIM
+
+User = get_user_model()
+
+
+def user_cache_key(user_id):
+    return f'users:user:{user_id}'
+
+
+def token_version_cache_key(user_id):
+    return f'users:token_version:{user_id}'
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication resolving users from a short-lived cache.
+
+    Users are cached by the token's user id for `USER_CACHE_TIMEOUT`
+    seconds, so authenticated requests do not load the user row.
+    Cached users are dropped whenever they are saved or deleted.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+        cache = get_cache()
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+        return user
+
+
+class TokenUser(SimpleLazyObject):
+    """
+    User backed by the claims of a `RoleAccessToken`.
+
+    Identity and role are read from the token, so permission checks
+    need no user row; any other attribute loads the user on first use.
+    """
+
+    def __init__(self, token, load_user):
+        super().__init__(load_user)
+        self.__dict__['token'] = token
+
+    @property
+    def pk(self):
+        return self.token[api_settings.USER_ID_CLAIM]
+
+    id = pk
+
+    @property
+    def role(self):
+        return self.token[ROLE_CLAIM]
+
+    @property
+    def is_superuser(self):
+        return self.token[SUPERUSER_CLAIM]
+
+    @property
+    def is_admin(self):
+        return self.role == User.ADMIN or self.is_superuser
+
+    @property
+    def is_moderator(self):
+        return self.role == User.MODERATOR
+
+    is_active = True
+    is_anonymous = False
+    is_authenticated = True
+
+    def __bool__(self):
+        return True
+
+    def __eq__(self, other):
+        if isinstance(other, (TokenUser, User)):
+            return self.pk == other.pk
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.pk)
+
+
+class RoleClaimsJWTAuthentication(CachedJWTAuthentication):
+    """
+    JWT authentication evaluating permissions from token claims.
+
+    Tokens issued by `RoleAccessToken` resolve to a `TokenUser`;
+    they are accepted while their `token_version` claim matches the
+    user's counter, which is bumped on role or status changes.
+    Other tokens fall back to the cached user lookup.
+    """
+
+    def get_user(self, validated_token):
+        if VERSION_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+        if validated_token[VERSION_CLAIM] != self.get_token_version(user_id):
+            raise AuthenticationFailed(
+                'Токен отозван.', code='token_revoked'
+            )
+        return TokenUser(
+            validated_token, partial(super().get_user, validated_token)
+        )
+
+    @staticmethod
+    def get_token_version(user_id):
+        cache = get_cache()
+        key = token_version_cache_key(user_id)
+        version = cache.get(key)
+        if version is None:
+            # A replica may not have the bumped counter yet.
+            with replica_reads(False):
+                version = User.objects.filter(
+                    **{api_settings.USER_ID_FIELD: user_id}, is_active=True
+                ).values_list('token_version', flat=True).first()
+            if version is None:
+                raise AuthenticationFailed(
+                    'Пользователь не найден.', code='user_not_found'
+                )
+            cache.set(key, version, settings.USER_CACHE_TIMEOUT)
+        return version
@@ -0,0 +1,180 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+
+from users.models import QueuedEmail
+
+CONFIRMATION_SUBJECT = 'Код подтверждения'
+
+
+def confirmation_message(code):
+    return f'Ваш код {code}'
+
+
+def queue_mail(subject, message, recipient_list, from_email=None):
+    """Put an email into the queue instead of sending it right away."""
+    return QueuedEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients='\n'.join(recipient_list),
+    )
+
+
+def claim_due(batch_size):
+    """
+    Claim up to `batch_size` due emails for this worker.
+
+    The claim is a single conditional UPDATE, so concurrent workers
+    never get the same email.
+    """
+    now = timezone.now()
+    claim = uuid4()
+    due = QueuedEmail.objects.filter(
+        status=QueuedEmail.PENDING, next_attempt_at__lte=now
+    )
+    due.filter(
+        pk__in=due.order_by('next_attempt_at', 'pk').values('pk')[:batch_size]
+    ).update(
+        claim=claim,
+        next_attempt_at=now + timedelta(
+            seconds=settings.MAIL_QUEUE_LOCK_TIMEOUT
+        ),
+    )
+    return list(QueuedEmail.objects.filter(claim=claim))
+
+
+def send_chunk(emails):
+    """Send emails over one connection, return `(email, error)` pairs."""
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as error:
+        return [(email, error) for email in emails]
+    results = []
+    try:
+        for email in emails:
+            message = EmailMessage(
+                email.subject, email.body, email.from_email,
+                email.recipient_list, connection=connection
+            )
+            try:
+                message.send()
+            except Exception as error:
+                results.append((email, error))
+            else:
+                results.append((email, None))
+    finally:
+        connection.close()
+    return results
+
+
+def retry_delay(attempts):
+    """Exponential backoff: the base delay doubles after each failure."""
+    return timedelta(
+        seconds=settings.MAIL_QUEUE_RETRY_DELAY * 2 ** (attempts - 1)
+    )
+
+
+def record_results(results):
+    """
+    Mark sent emails and schedule retries of failed ones.
+
+    Bodies of finished emails are blanked: they may carry confirmation
+    codes, which must not outlive the delivery in plain text.
+    """
+    now = timezone.now()
+    sent = [email.pk for email, error in results if error is None]
+    QueuedEmail.objects.filter(pk__in=sent).update(
+        status=QueuedEmail.SENT, sent_at=now, claim=None, last_error='',
+        body=''
+    )
+    failed = []
+    for email, error in results:
+        if error is None:
+            continue
+        email.attempts += 1
+        email.claim = None
+        email.last_error = repr(error)
+        if email.attempts >= settings.MAIL_QUEUE_MAX_ATTEMPTS:
+            email.status = QueuedEmail.FAILED
+            email.body = ''
+        else:
+            email.next_attempt_at = now + retry_delay(email.attempts)
+        failed.append(email)
+    QueuedEmail.objects.bulk_update(
+        failed,
+        ('attempts', 'claim', 'last_error', 'status', 'next_attempt_at',
+         'body')
+    )
+    return len(sent), len(failed)
+
+
+def process_queue(batch_size=100, workers=4):
+    """
+    Deliver one batch of due emails with a pool of sender threads.
+
+    Threads only talk to the mail backend; claiming and recording
+    results stay in the calling thread. Returns `(sent, failed)`.
+    """
+    emails = claim_due(batch_size)
+    if not emails:
+        return 0, 0
+    workers = min(workers, len(emails))
+    chunks = [emails[idx::workers] for idx in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = [
+            result for chunk in pool.map(send_chunk, chunks)
+            for result in chunk
+        ]
+    return record_results(results)
+
+
+def purge_finished(batch_size=1000):
+    """
+    Delete sent and failed emails older than `MAIL_QUEUE_RETENTION`.
+
+    The age is taken from `next_attempt_at`, the end of the last claim,
+    so the due index finds them. Rows go in short batches to keep write
+    locks short. Returns the number of deleted emails.
+    """
+    finished = QueuedEmail.objects.filter(
+        status__in=(QueuedEmail.SENT, QueuedEmail.FAILED),
+        next_attempt_at__lt=timezone.now() - timedelta(
+            seconds=settings.MAIL_QUEUE_RETENTION
+        ),
+    )
+    purged = 0
+    while True:
+        deleted, _ = QueuedEmail.objects.filter(
+            pk__in=finished.values('pk')[:batch_size]
+        ).delete()
+        purged += deleted
+        if deleted < batch_size:
+            return purged
+
+
+def send_batches(batches, max_rate=None):
+    """
+    Send batches of messages over a single backend connection.
+
+    Each batch goes out with one `send_messages` call; with `max_rate`
+    (messages per second) sending pauses to stay under the limit.
+    Returns `(sent, batches, elapsed seconds)`.
+    """
+    sent = count = 0
+    started = time.perf_counter()
+    with get_connection() as connection:
+        for messages in batches:
+            sent += connection.send_messages(messages) or 0
+            count += 1
+            if max_rate:
+                ahead = sent / max_rate - (time.perf_counter() - started)
+                if ahead > 0:
+                    time.sleep(ahead)
+    return sent, count, time.perf_counter() - started
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from users.models import ConfirmationCode
+
+
+class Command(BaseCommand):
+    help = 'Удаляет просроченные коды подтверждения.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            default=10000,
+            type=int,
+            help='Количество строк, удаляемых одним запросом.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size должен быть больше нуля.')
+        expired = ConfirmationCode.objects.filter(
+            expires_at__lte=timezone.now()
+        )
+        purged = 0
+        while True:
+            # Short batches keep write locks short on busy databases.
+            deleted, _ = ConfirmationCode.objects.filter(
+                pk__in=expired.values('pk')[:batch_size]
+            ).delete()
+            purged += deleted
+            if deleted < batch_size:
+                break
+        self.stdout.write(self.style.SUCCESS(
+            f'Удалено просроченных кодов подтверждения: {purged}.'
+        ))
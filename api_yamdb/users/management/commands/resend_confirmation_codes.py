@@ -0,0 +1,93 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from users.mail import CONFIRMATION_SUBJECT, confirmation_message, send_batches
+from users.models import ConfirmationCode
+from users.tokens import generate_confirmation_code
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Выдаёт новые коды подтверждения и рассылает их пачками '
+        'через одно соединение с почтовым сервером.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'usernames',
+            nargs='*',
+            help='Имена пользователей.'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Разослать коды всем пользователям.'
+        )
+        parser.add_argument(
+            '--role',
+            choices=[role for role, _ in User.ROLES],
+            help='Разослать коды пользователям с этой ролью.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            default=100,
+            type=int,
+            help='Количество писем в одном вызове send_messages.'
+        )
+        parser.add_argument(
+            '--max-rate',
+            default=0,
+            type=float,
+            help='Ограничение скорости, писем в секунду (0 - без ограничения).'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size должен быть больше нуля.')
+        users = User.objects.exclude(email='').order_by('pk')
+        if options['role']:
+            users = users.filter(role=options['role'])
+        if options['usernames']:
+            users = users.filter(username__in=options['usernames'])
+        elif not options['all'] and not options['role']:
+            raise CommandError('Укажите пользователей, --role или --all.')
+        sent, batches, elapsed = send_batches(
+            self.batches(users, options['batch_size']),
+            max_rate=options['max_rate']
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Отправлено писем: {sent}, пачек: {batches}, за {elapsed:.2f} с '
+            f'({sent / elapsed if elapsed else sent:.0f} писем/с).'
+        ))
+
+    @staticmethod
+    def batches(users, batch_size):
+        """New codes are saved right before their batch is sent."""
+        users = users.only('pk', 'username', 'email')
+        last_pk = 0
+        while True:
+            batch = list(users.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                return
+            last_pk = batch[-1].pk
+            codes = {user.pk: generate_confirmation_code() for user in batch}
+            with transaction.atomic():
+                ConfirmationCode.objects.filter(user_id__in=codes).delete()
+                ConfirmationCode.objects.bulk_create(
+                    ConfirmationCode.build(user, codes[user.pk])
+                    for user in batch
+                )
+            yield [
+                EmailMessage(
+                    CONFIRMATION_SUBJECT,
+                    confirmation_message(codes[user.pk]),
+                    settings.DEFAULT_FROM_EMAIL,
+                    [user.email]
+                )
+                for user in batch
+            ]
@@ -0,0 +1,64 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.mail import process_queue, purge_finished
+
+
+class Command(BaseCommand):
+    help = (
+        'Отправляет письма из очереди пачками пулом потоков '
+        'с повторными попытками и экспоненциальной задержкой; '
+        'удаляет отправленные письма старше MAIL_QUEUE_RETENTION.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            default=100,
+            type=int,
+            help='Количество писем, забираемых из очереди за раз.'
+        )
+        parser.add_argument(
+            '--workers',
+            default=4,
+            type=int,
+            help='Количество потоков отправки.'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Не завершаться, а ждать новых писем.'
+        )
+        parser.add_argument(
+            '--interval',
+            default=5.0,
+            type=float,
+            help='Пауза (с) между проверками пустой очереди в режиме --loop.'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1 or options['workers'] < 1:
+            raise CommandError(
+                '--batch-size и --workers должны быть больше нуля.'
+            )
+        total_sent = total_failed = 0
+        try:
+            while True:
+                sent, failed = process_queue(
+                    options['batch_size'], options['workers']
+                )
+                total_sent += sent
+                total_failed += failed
+                if sent or failed:
+                    continue
+                # The queue is drained: time to drop old emails.
+                purge_finished()
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(
+            f'Отправлено писем: {total_sent}, ошибок отправки: {total_failed}.'
+        ))
@@ -0,0 +1,58 @@
+# Generated by Django 3.2 on 2026-10-18 17:21
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
+import django.db.models.deletion
+
+
+def hash_codes(apps, schema_editor):
+    CustomUser = apps.get_model('users', 'CustomUser')
+    ConfirmationCode = apps.get_model('users', 'ConfirmationCode')
+    expires_at = timezone.now() + timedelta(
+        seconds=settings.CONFIRMATION_CODE_LIFETIME
+    )
+    users = CustomUser.objects.exclude(
+        confirmation_code__isnull=True
+    ).exclude(confirmation_code='').values_list('pk', 'username', 'confirmation_code')
+    ConfirmationCode.objects.bulk_create(
+        ConfirmationCode(
+            user_id=user_id,
+            code_hash=salted_hmac(
+                'users.ConfirmationCode', f'{username}:{code}',
+                algorithm='sha256'
+            ).hexdigest(),
+            expires_at=expires_at,
+        )
+        for user_id, username, code in users.iterator()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_queuedemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConfirmationCode',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='confirmation', serialize=False, to='users.customuser', verbose_name='Пользователь')),
+                ('code_hash', models.CharField(max_length=64, verbose_name='Хеш кода')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='Действует до')),
+            ],
+            options={
+                'verbose_name': 'Код подтверждения',
+                'verbose_name_plural': 'Коды подтверждения',
+            },
+        ),
+        migrations.RunPython(hash_codes, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='customuser',
+            name='confirmation_code',
+        ),
+    ]
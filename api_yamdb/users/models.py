@@ -1,6 +1,11 @@
+from datetime import timedelta
+
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import connection, models
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
 
 
 class CustomUser(AbstractUser):
@@ -35,12 +40,10 @@ class CustomUser(AbstractUser):
         max_length=30,
         verbose_name='Роль'
     )
-    confirmation_code = models.CharField(
-        max_length=200,
-        blank=True,
-        null=True,
-        unique=True,
-        verbose_name='Код подтверждения'
+    token_version = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Версия токенов'
     )
 
     class Meta:
@@ -48,6 +51,38 @@ class CustomUser(AbstractUser):
             'username',
         )
 
+    # Fields embedded in access tokens: changing any of them revokes
+    # tokens issued before by bumping `token_version`.
+    TOKEN_FIELDS = ('role', 'is_superuser', 'is_active')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_token_fields = instance.get_token_fields()
+        instance._loaded_username = instance.__dict__.get('username')
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._loaded_token_fields = self.get_token_fields()
+        self._loaded_username = self.username
+
+    def get_token_fields(self):
+        return tuple(
+            self.__dict__.get(field) for field in self.TOKEN_FIELDS
+        )
+
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, '_loaded_token_fields', None)
+        if loaded is not None and loaded != self.get_token_fields():
+            self.token_version += 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'token_version'}
+        super().save(*args, **kwargs)
+        self._loaded_token_fields = self.get_token_fields()
+        self._loaded_username = self.username
+
     @property
     def is_admin(self):
         return self.role == self.ADMIN or self.is_superuser
@@ -58,3 +93,192 @@ class CustomUser(AbstractUser):
 
     def __str__(self):
         return self.username
+
+
+class ConfirmationCode(models.Model):
+    """
+    Confirmation code of a user.
+
+    Only a keyed hash of the code is stored; the code is valid until
+    `expires_at` and expired rows are removed by
+    `purge_confirmation_codes`.
+    """
+
+    KEY_SALT = 'users.ConfirmationCode'
+    user = models.OneToOneField(
+        CustomUser,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='confirmation',
+        verbose_name='Пользователь'
+    )
+    code_hash = models.CharField(
+        max_length=64,
+        verbose_name='Хеш кода'
+    )
+    expires_at = models.DateTimeField(
+        db_index=True,
+        verbose_name='Действует до'
+    )
+
+    class Meta:
+        verbose_name = 'Код подтверждения'
+        verbose_name_plural = 'Коды подтверждения'
+
+    def __str__(self):
+        return f'{self.user_id} до {self.expires_at}'
+
+    @classmethod
+    def make_hash(cls, username, code):
+        return salted_hmac(
+            cls.KEY_SALT, f'{username}:{code}', algorithm='sha256'
+        ).hexdigest()
+
+    @staticmethod
+    def make_expiry():
+        return timezone.now() + timedelta(
+            seconds=settings.CONFIRMATION_CODE_LIFETIME
+        )
+
+    @classmethod
+    def build(cls, user, code):
+        return cls(
+            user=user,
+            code_hash=cls.make_hash(user.username, code),
+            expires_at=cls.make_expiry(),
+        )
+
+    @classmethod
+    def issue(cls, user, code, new_user=False):
+        """Store the code of a user, replacing the previous one."""
+        confirmation = cls.build(user, code)
+        if new_user or not cls.objects.filter(user=user).update(
+            code_hash=confirmation.code_hash,
+            expires_at=confirmation.expires_at
+        ):
+            confirmation.save(force_insert=True)
+        return confirmation
+
+    @classmethod
+    def reissue(cls, username, email, code):
+        """
+        Store the code of the user with this username and email in a
+        single upsert; return False when there is no such user.
+        """
+        quote = connection.ops.quote_name
+        user_meta = CustomUser._meta
+        fields = [cls._meta.get_field(name) for name in (
+            'user', 'code_hash', 'expires_at'
+        )]
+        columns = ', '.join(quote(field.column) for field in fields)
+        updates = ', '.join(
+            f'{quote(field.column)} = excluded.{quote(field.column)}'
+            for field in fields[1:]
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {quote(cls._meta.db_table)} ({columns}) '
+                f'SELECT {quote(user_meta.pk.column)}, %s, %s '
+                f'FROM {quote(user_meta.db_table)} '
+                f'WHERE {quote("username")} = %s AND {quote("email")} = %s '
+                f'ON CONFLICT ({quote(fields[0].column)}) '
+                f'DO UPDATE SET {updates}',
+                [
+                    cls.make_hash(username, code),
+                    connection.ops.adapt_datetimefield_value(
+                        cls.make_expiry()
+                    ),
+                    username,
+                    email,
+                ]
+            )
+            return cursor.rowcount > 0
+
+    def check_code(self, code):
+        """Constant-time check of a code against the stored hash."""
+        return self.expires_at > timezone.now() and constant_time_compare(
+            self.code_hash, self.make_hash(self.user.username, code)
+        )
+
+
+class QueuedEmail(models.Model):
+    """
+    Outgoing email waiting for delivery by `send_queued_mail`.
+
+    A message is due once `next_attempt_at` has passed. Workers claim
+    due messages by moving `next_attempt_at` forward, so a message
+    claimed by a crashed worker becomes due again by itself.
+    """
+
+    PENDING = 'pending'
+    SENT = 'sent'
+    FAILED = 'failed'
+    STATUSES = (
+        (PENDING, 'pending'),
+        (SENT, 'sent'),
+        (FAILED, 'failed'),
+    )
+    subject = models.CharField(
+        max_length=255,
+        verbose_name='Тема'
+    )
+    body = models.TextField(
+        verbose_name='Текст'
+    )
+    from_email = models.CharField(
+        max_length=254,
+        verbose_name='Отправитель'
+    )
+    recipients = models.TextField(
+        verbose_name='Получатели'
+    )
+    status = models.CharField(
+        default=PENDING,
+        choices=STATUSES,
+        max_length=10,
+        verbose_name='Статус'
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='Попытки'
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='Следующая попытка'
+    )
+    claim = models.UUIDField(
+        blank=True,
+        null=True,
+        verbose_name='Метка обработчика'
+    )
+    last_error = models.TextField(
+        blank=True,
+        verbose_name='Последняя ошибка'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Создано'
+    )
+    sent_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name='Отправлено'
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=('status', 'next_attempt_at'),
+                name='queuedemail_due_idx'
+            )
+        ]
+        ordering = ('pk',)
+        verbose_name = 'Письмо в очереди'
+        verbose_name_plural = 'Очередь писем'
+
+    def __str__(self):
+        return f'{self.subject} -> {self.recipients}'
+
+    @property
+    def recipient_list(self):
+        return self.recipients.split('\n')
@@ -0,0 +1,28 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from rest_framework_simplejwt.settings import api_settings
+
+from api.cache import AUTHORS, get_cache, invalidate
+from users.authentication import token_version_cache_key, user_cache_key
+
+User = get_user_model()
+
+
+def forget_user(sender, instance, **kwargs):
+    """Drop the cached user, so that role changes apply at once."""
+    user_id = getattr(instance, api_settings.USER_ID_FIELD)
+    get_cache().delete_many(
+        (user_cache_key(user_id), token_version_cache_key(user_id))
+    )
+
+
+def invalidate_authored_responses(sender, instance, created, **kwargs):
+    """Reviews and comments render the username of their author."""
+    loaded = getattr(instance, '_loaded_username', None)
+    if not created and loaded is not None and loaded != instance.username:
+        invalidate(AUTHORS)
+
+
+post_save.connect(forget_user, sender=User)
+post_save.connect(invalidate_authored_responses, sender=User)
+post_delete.connect(forget_user, sender=User)
@@ -0,0 +1,29 @@
+import secrets
+import string
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+CONFIRMATION_CODE_ALPHABET = string.ascii_letters + string.digits
+CONFIRMATION_CODE_LENGTH = 10
+ROLE_CLAIM = 'role'
+SUPERUSER_CLAIM = 'is_superuser'
+VERSION_CLAIM = 'token_version'
+
+
+class RoleAccessToken(AccessToken):
+    """Access token carrying the role and the token version of its user."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[ROLE_CLAIM] = user.role
+        token[SUPERUSER_CLAIM] = user.is_superuser
+        token[VERSION_CLAIM] = user.token_version
+        return token
+
+
+def generate_confirmation_code():
+    return ''.join(
+        secrets.choice(CONFIRMATION_CODE_ALPHABET)
+        for _ in range(CONFIRMATION_CODE_LENGTH)
+    )
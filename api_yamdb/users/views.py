@@ -1,24 +1,26 @@
-import secrets
-import string
-
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
 from django.shortcuts import get_object_or_404
 from django.db import IntegrityError
 from rest_framework import filters, permissions, status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import AccessToken
 
 from api.permissions import IsAdmin
 from api.utils import HTTPMethods
+from users.mail import (
+    CONFIRMATION_SUBJECT,
+    confirmation_message,
+    queue_mail,
+)
+from users.models import ConfirmationCode
 from users.serializers import (
     UserSerializer,
     UserSignUpSerializer,
     GetTokenSerializer,
 )
+from users.tokens import RoleAccessToken, generate_confirmation_code
 
 User = get_user_model()
 
@@ -65,26 +67,24 @@ def signup(request):
     serializer.is_valid(raise_exception=True)
     email = serializer.validated_data['email']
     username = serializer.validated_data['username']
+    confirmation_code = generate_confirmation_code()
+    # No transaction: every step is a single statement and a repeated
+    # signup completes whatever a failed one left behind.
     try:
-        user, _ = User.objects.get_or_create(
-            username=username, email=email
+        if not ConfirmationCode.reissue(username, email, confirmation_code):
+            user = User.objects.create(username=username, email=email)
+            ConfirmationCode.issue(user, confirmation_code, new_user=True)
+        queue_mail(
+            subject=CONFIRMATION_SUBJECT,
+            message=confirmation_message(confirmation_code),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=[email],
         )
     except IntegrityError:
         return Response(
             'Проблемы с базой данных.',
             status=status.HTTP_400_BAD_REQUEST
         )
-    code = string.ascii_letters + string.digits
-    confirmation_code = ''.join(secrets.choice(code) for i in range(10))
-    user.confirmation_code = confirmation_code
-    user.save()
-    send_mail(
-        subject='Код подтверждения',
-        message=f'Ваш код {confirmation_code}',
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[email],
-        fail_silently=False
-    )
     return Response(
         serializer.data,
         status=status.HTTP_200_OK
@@ -99,8 +99,21 @@ def get_jwt_token_for_user(request):
     serializer.is_valid(raise_exception=True)
     username = serializer.validated_data['username']
     confirmation_code = serializer.validated_data['confirmation_code']
-    user = get_object_or_404(User, username=username)
-    if user.confirmation_code != confirmation_code:
+    user = get_object_or_404(
+        User.objects.select_related('confirmation'), username=username
+    )
+    try:
+        valid = user.confirmation.check_code(confirmation_code)
+    except ConfirmationCode.DoesNotExist:
+        valid = False
+    if not valid:
+        return Response(status=status.HTTP_400_BAD_REQUEST)
+    # A code is good for one token only; of concurrent exchanges of the
+    # same code only the one that deletes it gets a token.
+    deleted, _ = ConfirmationCode.objects.filter(
+        pk=user.confirmation.pk
+    ).delete()
+    if not deleted:
         return Response(status=status.HTTP_400_BAD_REQUEST)
-    token = AccessToken.for_user(user)
+    token = RoleAccessToken.for_user(user)
     return Response({'token': str(token)}, status=status.HTTP_200_OK)
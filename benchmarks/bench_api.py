@@ -0,0 +1,288 @@
+"""
+Latency and throughput of every endpoint of `api/urls.py`.
+
+Seeds a synthetic catalogue of configurable size with `generate_fixtures`
+in a throwaway SQLite database, replays requests through the full Django
+stack (middleware, routing, authentication, rendering) with the test
+client and stores p50/p99 latency and throughput per endpoint as JSON:
+
+    python benchmarks/bench_api.py --titles 2000 --requests 300
+    python benchmarks/bench_api.py --compare benchmarks/results/base.json
+
+With `--compare` the run exits with status 1 when the p50 latency of
+any endpoint grew by more than `--threshold`.
+"""
+import argparse
+import io
+import json
+import random
+import sys
+import time
+from itertools import count
+from urllib.parse import quote
+
+from common import (
+    RESULTS_DIR,
+    compare,
+    environment,
+    migrate,
+    print_table,
+    setup_django,
+    summarize,
+    write_results,
+)
+
+REVIEW_URL = '/api/v1/titles/{}/reviews/{}/'
+COMMENTS_URL = REVIEW_URL + 'comments/'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--categories', type=int, default=10)
+    parser.add_argument('--genres', type=int, default=30)
+    parser.add_argument('--titles', type=int, default=1000)
+    parser.add_argument('--reviews', type=int, default=10000)
+    parser.add_argument('--comments', type=int, default=20000)
+    parser.add_argument('--requests', type=int, default=200,
+                        help='Measured requests per endpoint.')
+    parser.add_argument('--warmup', type=int, default=20,
+                        help='Unmeasured requests per endpoint.')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Disable the API response cache.')
+    parser.add_argument('--only', nargs='*', metavar='ENDPOINT',
+                        help='Run only the given endpoints.')
+    parser.add_argument('--output', help='Path of the JSON results.')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='JSON results of a previous run.')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Allowed relative p50 growth with --compare.')
+    return parser.parse_args(argv)
+
+
+def seed_catalogue(args):
+    """Fill the database with `generate_fixtures` and benchmark accounts."""
+    from django.core.management import call_command
+    from reviews.models import User
+
+    call_command(
+        'generate_fixtures', stdout=io.StringIO(), seed=args.seed,
+        users=args.users, categories=args.categories, genres=args.genres,
+        titles=args.titles, reviews=args.reviews, comments=args.comments,
+        wal=True
+    )
+    # The admin reviews titles during the run, so it has no seeded reviews.
+    User.objects.create(username='admin', email='admin@yamdb.fake',
+                        role=User.ADMIN)
+
+
+class Catalogue:
+    """Identifiers of the seeded objects requests are drawn from."""
+
+    def __init__(self, rng):
+        from reviews.models import Category, Genre, Review, Title, User
+
+        self.rng = rng
+        self.title_ids = list(Title.objects.values_list('id', flat=True))
+        self.reviews = list(Review.objects.values_list('title_id', 'id'))
+        self.users = list(
+            User.objects.exclude(username='admin').only('pk', 'username')
+        )
+        self.usernames = [user.username for user in self.users]
+        self.codes = count()
+        self.genres = list(Genre.objects.values_list('slug', flat=True))
+        self.categories = list(
+            Category.objects.values_list('slug', flat=True)
+        )
+
+    def title(self):
+        return self.rng.choice(self.title_ids)
+
+    def review(self):
+        return self.rng.choice(self.reviews)
+
+    def page(self, total, page_size=10):
+        return self.rng.randint(1, max(total // page_size, 1))
+
+    def confirmation(self):
+        """Issue a new code to a random user, codes are single-use."""
+        from users.models import ConfirmationCode
+
+        user = self.rng.choice(self.users)
+        code = f'bench{next(self.codes)}'
+        ConfirmationCode.issue(user, code)
+        return {'username': user.username, 'confirmation_code': code}
+
+
+def endpoints(catalogue, clients):
+    """
+    Requests to benchmark: name -> (client, method, url factory, body).
+
+    Read endpoints come first, so that writes do not change what they
+    measure; every factory call draws new random parameters, so cache
+    hit rates resemble a real mix of clients.
+    """
+    from reviews.management.commands.generate_fixtures import (
+        WORDS,
+        sentence,
+    )
+
+    rng = catalogue.rng
+    anon, user, admin = clients['anon'], clients['user'], clients['admin']
+    unique = count()
+    titles = len(catalogue.title_ids)
+    review_targets = iter(catalogue.title_ids)
+
+    return {
+        'categories-list': (anon, 'get', lambda: (
+            f'/api/v1/categories/?page='
+            f'{catalogue.page(len(catalogue.categories))}'
+        ), None),
+        'genres-list': (anon, 'get', lambda: (
+            f'/api/v1/genres/?page={catalogue.page(len(catalogue.genres))}'
+        ), None),
+        'titles-list': (anon, 'get', lambda: (
+            f'/api/v1/titles/?page={catalogue.page(titles)}'
+        ), None),
+        'titles-list-genre': (anon, 'get', lambda: (
+            f'/api/v1/titles/?genre={rng.choice(catalogue.genres)}'
+        ), None),
+        'titles-search': (anon, 'get', lambda: (
+            f'/api/v1/titles/?search={quote(rng.choice(WORDS))}'
+        ), None),
+        'titles-detail': (anon, 'get', lambda: (
+            f'/api/v1/titles/{catalogue.title()}/'
+        ), None),
+        'review-list': (anon, 'get', lambda: (
+            f'/api/v1/titles/{catalogue.title()}/reviews/'
+        ), None),
+        'review-list-cursor': (anon, 'get', lambda: (
+            f'/api/v1/titles/{catalogue.title()}/reviews/?pagination=cursor'
+        ), None),
+        'review-detail': (anon, 'get', lambda: (
+            REVIEW_URL.format(*catalogue.review())
+        ), None),
+        'comment-list': (anon, 'get', lambda: (
+            COMMENTS_URL.format(*catalogue.review())
+        ), None),
+        'users-list': (admin, 'get', lambda: (
+            f'/api/v1/users/?page={catalogue.page(len(catalogue.usernames))}'
+        ), None),
+        'users-detail': (admin, 'get', lambda: (
+            f'/api/v1/users/{rng.choice(catalogue.usernames)}/'
+        ), None),
+        'users-me': (user, 'get', lambda: '/api/v1/users/me/', None),
+        'token': (anon, 'post', lambda: '/api/v1/auth/token/',
+                  catalogue.confirmation),
+        'signup': (anon, 'post', lambda: '/api/v1/auth/signup/', lambda: (
+            lambda idx: {'username': f'bench{idx}',
+                         'email': f'bench{idx}@yamdb.fake'}
+        )(next(unique))),
+        'categories-create': (admin, 'post', lambda: '/api/v1/categories/',
+                              lambda: {'name': 'Bench',
+                                       'slug': f'bench-{next(unique)}'}),
+        'titles-create': (admin, 'post', lambda: '/api/v1/titles/',
+                          lambda: {
+                              'name': sentence(rng, 3),
+                              'year': 2000,
+                              'genre': rng.sample(catalogue.genres, 2),
+                              'category': rng.choice(catalogue.categories),
+                          }),
+        'review-create': (admin, 'post', lambda: (
+            f'/api/v1/titles/{next(review_targets)}/reviews/'
+        ), lambda: {'text': sentence(rng, 20), 'score': rng.randint(1, 10)}),
+        'comment-create': (user, 'post', lambda: (
+            COMMENTS_URL.format(*catalogue.review())
+        ), lambda: {'text': sentence(rng, 10)}),
+    }
+
+
+def make_clients():
+    from rest_framework.test import APIClient
+    from reviews.models import User
+    from users.tokens import RoleAccessToken
+
+    clients = {'anon': APIClient()}
+    users = User.objects.order_by('pk')
+    for name, user in (('user', users.first()), ('admin', users.last())):
+        client = APIClient()
+        token = RoleAccessToken.for_user(user)
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        clients[name] = client
+    return clients
+
+
+def run_endpoint(client, method, url, body, requests, warmup):
+    latencies = []
+    errors = 0
+    started = time.perf_counter()
+    for idx in range(warmup + requests):
+        path = url()
+        data = body() if body else None
+        if idx == warmup:
+            latencies.clear()
+            errors = 0
+            started = time.perf_counter()
+        before = time.perf_counter()
+        response = getattr(client, method)(path, data, format='json')
+        latencies.append(time.perf_counter() - before)
+        if response.status_code >= 400:
+            errors += 1
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    overrides = {}
+    if args.no_cache:
+        overrides['CACHES'] = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+            }
+        }
+    db_path = setup_django(**overrides)
+    migrate()
+    started = time.perf_counter()
+    seed_catalogue(args)
+    print(f'Seeded {db_path} in {time.perf_counter() - started:.1f} s')
+
+    catalogue = Catalogue(random.Random(args.seed))
+    clients = make_clients()
+    # Each measured request creates a review of the admin on its own title.
+    requests = min(
+        args.requests, max(len(catalogue.title_ids) - args.warmup, 1)
+    )
+    results = {}
+    for name, (client, method, url, body) in endpoints(
+        catalogue, clients
+    ).items():
+        if args.only and name not in args.only:
+            continue
+        amount = requests if name == 'review-create' else args.requests
+        results[name] = run_endpoint(
+            client, method, url, body, amount, args.warmup
+        )
+    print_table(results)
+
+    output = write_results(
+        args.output or RESULTS_DIR / f'api-{int(time.time())}.json',
+        {
+            'environment': environment(),
+            'parameters': vars(args),
+            'endpoints': results,
+        }
+    )
+    print(f'Results: {output}')
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)['endpoints']
+        regressions = compare(baseline, results, args.threshold)
+        for name, before, after in regressions:
+            print(f'REGRESSION {name}: p50 {before:.2f} -> {after:.2f} ms')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
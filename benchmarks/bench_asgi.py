@@ -0,0 +1,229 @@
+"""
+Concurrency of the read endpoints under WSGI and ASGI with slow clients.
+
+Both modes serve the same synthetic catalogue in their own process:
+
+- `wsgi`: the sync views behind a pool of `--threads` worker threads,
+  each busy until its client has read the whole response;
+- `asgi`: one event loop with the async read views
+  (`ASYNC_READ_VIEWS`), slow clients only hold a coroutine.
+
+Every client sends `--requests` requests one after another to the title
+list/detail, review list and comment list and takes `--client-delay`
+seconds to read each response:
+
+    python benchmarks/bench_asgi.py --clients 64 --client-delay 0.05
+"""
+import argparse
+import asyncio
+import io
+import os
+import random
+import sys
+import threading
+import time
+
+from common import (
+    RESULTS_DIR,
+    environment,
+    migrate,
+    print_table,
+    run_separately,
+    setup_django,
+    summarize,
+    write_results,
+)
+
+MODES = ('wsgi', 'asgi')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--mode', choices=MODES,
+                        help='Run a single mode in this process.')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--titles', type=int, default=1000)
+    parser.add_argument('--reviews', type=int, default=5000)
+    parser.add_argument('--comments', type=int, default=5000)
+    parser.add_argument('--clients', type=int, default=64,
+                        help='Concurrent clients.')
+    parser.add_argument('--requests', type=int, default=10,
+                        help='Requests per client.')
+    parser.add_argument('--client-delay', type=float, default=0.05,
+                        help='Seconds a client takes to read a response.')
+    parser.add_argument('--threads', type=int, default=8,
+                        help='Worker threads of the WSGI server.')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Disable the API response cache.')
+    parser.add_argument('--output', help='Path of the JSON results.')
+    return parser.parse_args(argv)
+
+
+def seed(args):
+    from django.core.management import call_command
+    from reviews.models import Review
+
+    call_command(
+        'generate_fixtures', stdout=io.StringIO(), seed=args.seed,
+        users=args.users, titles=args.titles, reviews=args.reviews,
+        comments=args.comments, wal=True
+    )
+    return list(Review.objects.values_list('title_id', 'id'))
+
+
+def paths(args, reviews, number):
+    """Request paths of one client."""
+    rng = random.Random(args.seed + number)
+    for _ in range(args.requests):
+        title_id, review_id = rng.choice(reviews)
+        yield rng.choice((
+            f'/api/v1/titles/?page={rng.randint(1, 10)}',
+            f'/api/v1/titles/{title_id}/',
+            f'/api/v1/titles/{title_id}/reviews/',
+            f'/api/v1/titles/{title_id}/reviews/{review_id}/comments/',
+        ))
+
+
+def run_wsgi(args, reviews):
+    from wsgiref.util import setup_testing_defaults
+
+    from django.core.handlers.wsgi import WSGIHandler
+
+    application = WSGIHandler()
+    workers = threading.Semaphore(args.threads)
+    latencies = []
+    errors = []
+
+    def client(number):
+        for path in paths(args, reviews, number):
+            path, _, query = path.partition('?')
+            environ = {
+                'PATH_INFO': path, 'QUERY_STRING': query,
+                'wsgi.input': io.BytesIO(),
+            }
+            setup_testing_defaults(environ)
+            statuses = []
+            before = time.perf_counter()
+            with workers:
+                body = application(
+                    environ, lambda status, headers: statuses.append(status)
+                )
+                for _ in body:
+                    # The worker thread writes to a slow client.
+                    time.sleep(args.client_delay)
+                body.close()
+            latencies.append(time.perf_counter() - before)
+            if not statuses[0].startswith('200'):
+                errors.append(statuses[0])
+
+    threads = [
+        threading.Thread(target=client, args=(number,))
+        for number in range(args.clients)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, time.perf_counter() - started, len(errors)
+
+
+def run_asgi(args, reviews):
+    from django.core.asgi import get_asgi_application
+
+    application = get_asgi_application()
+    latencies = []
+    errors = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def client(number):
+        for path in paths(args, reviews, number):
+            path, _, query = path.partition('?')
+            scope = {
+                'type': 'http', 'asgi': {'version': '3.0'},
+                'http_version': '1.1', 'method': 'GET', 'scheme': 'http',
+                'path': path, 'raw_path': path.encode(),
+                'query_string': query.encode(), 'root_path': '',
+                'headers': [(b'host', b'testserver')],
+                'client': ('127.0.0.1', 50000 + number),
+                'server': ('testserver', 80),
+            }
+            statuses = []
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    statuses.append(message['status'])
+                else:
+                    # Only this coroutine waits for the slow client.
+                    await asyncio.sleep(args.client_delay)
+
+            before = time.perf_counter()
+            await application(scope, receive, send)
+            latencies.append(time.perf_counter() - before)
+            if statuses[0] != 200:
+                errors.append(statuses[0])
+
+    async def clients():
+        await asyncio.gather(*(
+            client(number) for number in range(args.clients)
+        ))
+
+    started = time.perf_counter()
+    asyncio.run(clients())
+    return latencies, time.perf_counter() - started, len(errors)
+
+
+def run_mode(args):
+    if args.mode == 'asgi':
+        os.environ['ASYNC_READ_VIEWS'] = '1'
+    overrides = {'ALLOWED_HOSTS': ['*']}
+    if args.no_cache:
+        overrides['CACHES'] = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+            }
+        }
+    setup_django(**overrides)
+    migrate()
+    reviews = seed(args)
+    from django.db import connections
+
+    connections.close_all()
+    run = run_asgi if args.mode == 'asgi' else run_wsgi
+    latencies, elapsed, errors = run(args, reviews)
+    return {f'{args.mode}-reads': summarize(latencies, elapsed, errors)}
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.mode:
+        rows = run_mode(args)
+        if args.output:
+            write_results(args.output, rows)
+        else:
+            print_table(rows)
+        return 0
+
+    results = run_separately(__file__, argv or sys.argv[1:], '--mode', MODES)
+    print_table(results)
+    before, after = results['wsgi-reads'], results['asgi-reads']
+    print(f'Throughput: {before["rps"]} -> {after["rps"]} requests/s')
+
+    setup_django()
+    output = write_results(
+        args.output or RESULTS_DIR / f'asgi-{int(time.time())}.json',
+        {
+            'environment': environment(),
+            'parameters': vars(args),
+            'endpoints': results,
+        }
+    )
+    print(f'Results: {output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
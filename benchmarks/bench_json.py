@@ -0,0 +1,117 @@
+"""
+JSON rendering and parsing of a page of `TitleGetSerializer` output.
+
+Compares DRF's `JSONRenderer`/`JSONParser` with `FastJSONRenderer`/
+`FastJSONParser` on the same serialized page (titles with category and
+genres) and checks that both renderers produce the same bytes:
+
+    python benchmarks/bench_json.py --page-size 100 --iterations 2000
+"""
+import argparse
+import io
+import sys
+import time
+from collections import OrderedDict
+
+from common import (
+    RESULTS_DIR,
+    environment,
+    migrate,
+    print_table,
+    setup_django,
+    summarize,
+    write_results,
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--genres', type=int, default=30)
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--output', help='Path of the JSON results.')
+    return parser.parse_args(argv)
+
+
+def title_page(args):
+    """A paginated response body of `--page-size` serialized titles."""
+    from django.core.management import call_command
+    from api.serializers import TitleGetSerializer
+    from api.views import TitleViewSet
+
+    call_command(
+        'generate_fixtures', stdout=io.StringIO(), seed=args.seed,
+        users=10, categories=10, genres=args.genres,
+        titles=args.page_size, reviews=args.page_size, comments=0
+    )
+    titles = TitleViewSet.queryset[:args.page_size]
+    return OrderedDict((
+        ('count', args.page_size),
+        ('next', None),
+        ('previous', None),
+        ('results', TitleGetSerializer(titles, many=True).data),
+    ))
+
+
+def measure(function, iterations):
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        before = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - before)
+    return summarize(latencies, time.perf_counter() - started)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    setup_django()
+    migrate()
+    from api.parsers import FastJSONParser
+    from api.renderers import FastJSONRenderer
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    data = title_page(args)
+    body = JSONRenderer().render(data)
+    if FastJSONRenderer().render(data) != body:
+        print('FastJSONRenderer output differs from JSONRenderer')
+        return 1
+    print(f'Page of {args.page_size} titles: {len(body)} bytes')
+
+    results = {}
+    for name, renderer in (
+        ('render-stdlib', JSONRenderer()),
+        ('render-fast', FastJSONRenderer()),
+    ):
+        results[name] = measure(
+            lambda: renderer.render(data), args.iterations
+        )
+    for name, parser in (
+        ('parse-stdlib', JSONParser()),
+        ('parse-fast', FastJSONParser()),
+    ):
+        results[name] = measure(
+            lambda: parser.parse(io.BytesIO(body)), args.iterations
+        )
+    print_table(results)
+    for action in ('render', 'parse'):
+        before = results[f'{action}-stdlib']['mean_ms']
+        after = results[f'{action}-fast']['mean_ms']
+        print(f'{action}: {before / after:.1f}x faster')
+
+    output = write_results(
+        args.output or RESULTS_DIR / f'json-{int(time.time())}.json',
+        {
+            'environment': environment(),
+            'parameters': vars(args),
+            'endpoints': results,
+        }
+    )
+    print(f'Results: {output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Database round trips and latency of `POST /api/v1/auth/signup/`.
+
+Measures first-time signups (new users) and repeated signups (code
+re-requests of existing users) separately:
+
+    python benchmarks/bench_signup.py --requests 500
+"""
+import argparse
+import sys
+import time
+
+from common import (
+    RESULTS_DIR,
+    environment,
+    migrate,
+    print_table,
+    setup_django,
+    summarize,
+    write_results,
+)
+
+SIGNUP_URL = '/api/v1/auth/signup/'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=300,
+                        help='Measured signups per scenario.')
+    parser.add_argument('--output', help='Path of the JSON results.')
+    return parser.parse_args(argv)
+
+
+def run_scenario(client, usernames):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    latencies = []
+    queries = []
+    errors = 0
+    started = time.perf_counter()
+    for username in usernames:
+        data = {'username': username, 'email': f'{username}@yamdb.fake'}
+        with CaptureQueriesContext(connection) as context:
+            before = time.perf_counter()
+            response = client.post(SIGNUP_URL, data, format='json')
+            latencies.append(time.perf_counter() - before)
+        queries.append(len(context))
+        if response.status_code != 200:
+            errors += 1
+    stats = summarize(latencies, time.perf_counter() - started, errors)
+    stats['queries'] = round(sum(queries) / len(queries), 2)
+    return stats
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    setup_django()
+    migrate()
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+    usernames = [f'signup{idx}' for idx in range(args.requests)]
+    results = {
+        'signup-new': run_scenario(client, usernames),
+        'signup-existing': run_scenario(client, usernames),
+    }
+    print_table(results)
+    for name, stats in results.items():
+        print(f'{name}: {stats["queries"]} queries per request')
+    output = write_results(
+        args.output or RESULTS_DIR / f'signup-{int(time.time())}.json',
+        {
+            'environment': environment(),
+            'parameters': vars(args),
+            'endpoints': results,
+        }
+    )
+    print(f'Results: {output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""
+Mixed read/write throughput of SQLite with and without `SQLITE_PRAGMAS`.
+
+Every profile runs in its own process against its own database file
+(the journal mode is stored in the file): worker threads, each with its
+own connection, read titles and reviews and post comments through the
+full Django stack; the response cache is disabled so reads reach the
+database:
+
+    python benchmarks/bench_sqlite.py --threads 8 --requests 200
+
+`default` keeps the SQLite defaults (rollback journal, synchronous=FULL,
+no busy timeout beyond the driver's), `tuned` applies `SQLITE_PRAGMAS`.
+"""
+import argparse
+import io
+import random
+import sys
+import threading
+import time
+
+from common import (
+    RESULTS_DIR,
+    environment,
+    migrate,
+    print_table,
+    run_separately,
+    setup_django,
+    summarize,
+    write_results,
+)
+
+PROFILES = ('default', 'tuned')
+COMMENTS_URL = '/api/v1/titles/{}/reviews/{}/comments/'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--profile', choices=PROFILES,
+                        help='Run a single profile in this process.')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--titles', type=int, default=500)
+    parser.add_argument('--reviews', type=int, default=5000)
+    parser.add_argument('--comments', type=int, default=5000)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200,
+                        help='Requests per thread.')
+    parser.add_argument('--write-ratio', type=float, default=0.2,
+                        help='Share of requests that post a comment.')
+    parser.add_argument('--output', help='Path of the JSON results.')
+    return parser.parse_args(argv)
+
+
+def seed(args, profile):
+    from django.core.management import call_command
+    from django.db import connection
+    from reviews.models import Review, User
+    from users.tokens import RoleAccessToken
+
+    call_command(
+        'generate_fixtures', stdout=io.StringIO(), seed=args.seed,
+        users=args.users, titles=args.titles, reviews=args.reviews,
+        comments=args.comments, wal=profile == 'tuned'
+    )
+    if profile == 'default':
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode = DELETE')
+    reviews = list(Review.objects.values_list('title_id', 'id'))
+    token = str(RoleAccessToken.for_user(User.objects.order_by('pk')[0]))
+    return reviews, token
+
+
+def worker(args, number, reviews, token, barrier, results):
+    from django.db import connections
+    from rest_framework.test import APIClient
+
+    rng = random.Random(args.seed + number)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    stats = results[number] = {
+        'reads': [], 'writes': [], 'read_errors': 0, 'write_errors': 0
+    }
+    barrier.wait()
+    try:
+        for _ in range(args.requests):
+            title_id, review_id = rng.choice(reviews)
+            write = rng.random() < args.write_ratio
+            before = time.perf_counter()
+            try:
+                if write:
+                    response = client.post(
+                        COMMENTS_URL.format(title_id, review_id),
+                        {'text': 'Комментарий'}, format='json'
+                    )
+                elif rng.random() < 0.5:
+                    response = client.get(f'/api/v1/titles/{title_id}/')
+                else:
+                    response = client.get(
+                        f'/api/v1/titles/{title_id}/reviews/'
+                    )
+                failed = response.status_code >= 400
+            except Exception:
+                # "database is locked" surfaces as OperationalError.
+                failed = True
+            kind = 'writes' if write else 'reads'
+            stats[kind].append(time.perf_counter() - before)
+            if failed:
+                stats[f'{kind[:-1]}_errors'] += 1
+    finally:
+        connections.close_all()
+
+
+def run_profile(args):
+    overrides = {
+        'CACHES': {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+            }
+        },
+    }
+    if args.profile == 'default':
+        overrides['SQLITE_PRAGMAS'] = {}
+    setup_django(**overrides)
+    migrate()
+    reviews, token = seed(args, args.profile)
+    from django.db import connections
+
+    connections.close_all()
+
+    results = {}
+    barrier = threading.Barrier(args.threads + 1)
+    threads = [
+        threading.Thread(
+            target=worker,
+            args=(args, number, reviews, token, barrier, results)
+        )
+        for number in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    rows = {}
+    for kind in ('reads', 'writes'):
+        latencies = [
+            latency for stats in results.values() for latency in stats[kind]
+        ]
+        errors = sum(
+            stats[f'{kind[:-1]}_errors'] for stats in results.values()
+        )
+        if latencies:
+            rows[f'{args.profile}-{kind}'] = summarize(
+                latencies, elapsed, errors
+            )
+    rows[f'{args.profile}-total'] = summarize(
+        [
+            latency for stats in results.values()
+            for latency in stats['reads'] + stats['writes']
+        ],
+        elapsed,
+        sum(row['errors'] for row in rows.values())
+    )
+    return rows
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.profile:
+        rows = run_profile(args)
+        if args.output:
+            write_results(args.output, rows)
+        else:
+            print_table(rows)
+        return 0
+
+    results = run_separately(
+        __file__, argv or sys.argv[1:], '--profile', PROFILES
+    )
+    print_table(results)
+    before, after = results['default-total'], results['tuned-total']
+    print(f'Throughput: {before["rps"]} -> {after["rps"]} requests/s')
+
+    setup_django()
+    output = write_results(
+        args.output or RESULTS_DIR / f'sqlite-{int(time.time())}.json',
+        {
+            'environment': environment(),
+            'parameters': vars(args),
+            'endpoints': results,
+        }
+    )
+    print(f'Results: {output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Shared helpers of the benchmark scripts."""
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+PROJECT_DIR = ROOT_DIR / 'api_yamdb'
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+
+def setup_django(db_path=None, **overrides):
+    """
+    Configure Django against a throwaway SQLite database.
+
+    Benchmarks never touch the development database: unless `db_path`
+    is given, a new file is created in a temporary directory.
+    Keyword arguments override settings before any connection is made.
+    """
+    if str(PROJECT_DIR) not in sys.path:
+        sys.path.insert(0, str(PROJECT_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'api_yamdb.settings')
+    import django
+    from django.conf import settings
+
+    django.setup()
+    if db_path is None:
+        db_path = Path(tempfile.mkdtemp(prefix='yamdb-bench-')) / 'db.sqlite3'
+    settings.DATABASES['default']['NAME'] = str(db_path)
+    settings.DEBUG = False
+    settings.EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+    settings.REQUEST_METRICS_DIR = None
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    return Path(db_path)
+
+
+def migrate():
+    from django.core.management import call_command
+
+    call_command('migrate', verbosity=0, interactive=False)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies, elapsed, errors=0):
+    """Latency percentiles (ms) and throughput of a series of requests."""
+    latencies = sorted(latencies)
+    count = len(latencies)
+    return {
+        'requests': count,
+        'errors': errors,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'mean_ms': round(sum(latencies) / count * 1000, 3),
+        'max_ms': round(latencies[-1] * 1000, 3),
+        'rps': round(count / elapsed, 1) if elapsed else None,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ('git', 'rev-parse', '--short', 'HEAD'),
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    import django
+
+    return {
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'platform': platform.platform(),
+    }
+
+
+def write_results(path, results):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False))
+    return path
+
+
+def print_table(rows, stream=sys.stdout):
+    header = f'{"endpoint":<28}{"p50 ms":>10}{"p99 ms":>10}{"rps":>10}'
+    print(header, file=stream)
+    print('-' * len(header), file=stream)
+    for name, stats in rows.items():
+        errors = f'  ({stats["errors"]} errors)' if stats['errors'] else ''
+        print(
+            f'{name:<28}{stats["p50_ms"]:>10.2f}{stats["p99_ms"]:>10.2f}'
+            f'{stats["rps"] or 0:>10.1f}{errors}',
+            file=stream
+        )
+
+
+def run_separately(script, argv, option, values):
+    """
+    Run `script` once per value of `option`, each in its own process.
+
+    Django is configured once per process, so variants that differ in
+    startup settings are measured apart. Every run writes its rows to
+    the `--output` file; the union of the rows is returned.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='yamdb-bench-') as directory:
+        for value in values:
+            output = Path(directory) / f'{value}.json'
+            subprocess.run(
+                [sys.executable, str(script), *argv,
+                 option, value, '--output', str(output)],
+                check=True
+            )
+            results.update(json.loads(output.read_text()))
+    return results
+
+
+def compare(baseline, current, threshold, metric='p50_ms'):
+    """
+    Endpoints whose `metric` grew by more than `threshold` (a fraction).
+
+    Returns a list of `(name, baseline value, current value)`.
+    """
+    regressions = []
+    for name, stats in current.items():
+        before = baseline.get(name, {}).get(metric)
+        after = stats.get(metric)
+        if before and after and after > before * (1 + threshold):
+            regressions.append((name, before, after))
+    return regressions
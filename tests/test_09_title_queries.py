@@ -0,0 +1,117 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.pagination import PageNumberPagination
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09TitleQueries:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    @staticmethod
+    def create_catalogue(size):
+        from reviews.models import Category, Genre, GenreTitle, Title
+
+        category = Category.objects.create(name='Фильм', slug='films')
+        Genre.objects.bulk_create(
+            Genre(name=f'Жанр {idx}', slug=f'genre-{idx}')
+            for idx in range(3)
+        )
+        Title.objects.bulk_create(
+            Title(name=f'Произведение {idx:04}', year=2000, category=category)
+            for idx in range(size)
+        )
+        genres = list(Genre.objects.all())
+        titles = list(Title.objects.all())
+        GenreTitle.objects.bulk_create(
+            GenreTitle(title_id=title, genre_id=genre)
+            for title in titles
+            for genre in genres
+        )
+        return titles
+
+    @pytest.mark.parametrize('page_size', (10, 100, 1000))
+    def test_01_title_list_queries(self, client, monkeypatch,
+                                   django_assert_num_queries, page_size):
+        self.create_catalogue(page_size)
+        monkeypatch.setattr(PageNumberPagination, 'page_size', page_size)
+
+        with django_assert_num_queries(3):
+            response = client.get(self.TITLES_URL)
+        assert response.status_code == HTTPStatus.OK
+        results = response.json()['results']
+        assert len(results) == page_size
+        assert all(len(title['genre']) == 3 for title in results), (
+            f'Проверьте, что ответ на GET-запрос к `{self.TITLES_URL}` '
+            'содержит жанры каждого произведения.'
+        )
+
+    def test_02_title_detail_queries(self, client,
+                                     django_assert_num_queries):
+        titles = self.create_catalogue(10)
+
+        with django_assert_num_queries(2):
+            response = client.get(
+                self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0].pk)
+            )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['category']['slug'] == 'films'
+
+    def test_03_title_write_queries(self, admin_client):
+        from reviews.models import Category, Genre, Title
+
+        Category.objects.create(name='Фильм', slug='films')
+        Genre.objects.bulk_create(
+            Genre(name=f'Жанр {idx}', slug=f'genre-{idx}')
+            for idx in range(20)
+        )
+        # Authenticate once, so that the cached user is not counted.
+        admin_client.get('/api/v1/users/me/')
+        queries = {}
+        for genre_count in (1, 20):
+            data = {
+                'name': f'Произведение {genre_count}',
+                'year': 2000,
+                'genre': [f'genre-{idx}' for idx in range(genre_count)],
+                'category': 'films',
+            }
+            with CaptureQueriesContext(connection) as context:
+                response = admin_client.post(
+                    self.TITLES_URL, data=data, format='json'
+                )
+            assert response.status_code == HTTPStatus.CREATED
+            assert len(response.json()['genre']) == genre_count
+            queries[genre_count] = len(context)
+        assert queries[1] == queries[20], (
+            f'Проверьте, что POST-запрос к `{self.TITLES_URL}` выполняет '
+            'одинаковое число запросов к базе независимо от числа жанров.'
+        )
+
+        title = Title.objects.get(name='Произведение 20')
+        url = self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=title.pk)
+        response = admin_client.patch(
+            url,
+            data={'genre': [f'genre-{idx}' for idx in range(10, 25)]},
+            format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.patch(
+                url,
+                data={'genre': [f'genre-{idx}' for idx in range(10, 20)]},
+                format='json'
+            )
+        assert response.status_code == HTTPStatus.OK
+        assert sorted(
+            genre['slug'] for genre in response.json()['genre']
+        ) == sorted(f'genre-{idx}' for idx in range(10, 20))
+        # +1: `post_delete` receivers that invalidate the response cache
+        # make Django select unlinked `GenreTitle` rows before deleting.
+        assert len(context) <= queries[20] + 2 + 1, (
+            f'Проверьте, что PATCH-запрос к `{self.TITLES_DETAIL_URL_TEMPLATE}` '
+            'обновляет жанры произведения постоянным числом запросов.'
+        )
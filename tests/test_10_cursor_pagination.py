@@ -0,0 +1,115 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import check_pagination, create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10CursorPagination:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def walk_cursor_pages(self, client, url, page_size):
+        ids = []
+        url = f'{url}?pagination=cursor'
+        while url:
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            data = response.json()
+            assert 'count' not in data, (
+                'Проверьте, что в режиме курсорной пагинации не '
+                'выполняется подсчёт объектов.'
+            )
+            assert len(data['results']) <= page_size
+            ids.extend(element['id'] for element in data['results'])
+            url = data['next']
+        return ids
+
+    def test_01_cursor_pages(self, client, admin_client, admin, user,
+                             user_client, moderator, moderator_client,
+                             monkeypatch):
+        from api.pagination import PubDateCursorPagination
+
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        comments, reviews, titles = create_comments(admin_client, author_map)
+        monkeypatch.setattr(PubDateCursorPagination, 'page_size', 2)
+
+        reviews_url = self.REVIEWS_URL_TEMPLATE.format(
+            title_id=titles[0]['id']
+        )
+        check_pagination(
+            reviews_url, client.get(reviews_url).json(), len(reviews)
+        )
+        review_ids = self.walk_cursor_pages(client, reviews_url, 2)
+        assert review_ids == [review['id'] for review in reversed(reviews)], (
+            f'Проверьте, что `{self.REVIEWS_URL_TEMPLATE}?pagination=cursor` '
+            'возвращает все отзывы от новых к старым.'
+        )
+
+        comments_url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=titles[0]['id'], review_id=reviews[0]['id']
+        )
+        comment_ids = self.walk_cursor_pages(client, comments_url, 2)
+        assert comment_ids == [
+            comment['id'] for comment in reversed(comments)
+        ], (
+            f'Проверьте, что `{self.COMMENTS_URL_TEMPLATE}?pagination=cursor` '
+            'возвращает все комментарии от новых к старым.'
+        )
+
+    def test_02_same_pub_date(self, client, admin_client, admin,
+                              monkeypatch):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from api.pagination import PubDateCursorPagination
+        from reviews.models import Comment
+
+        _, reviews, titles = create_comments(admin_client, {
+            admin: admin_client
+        })
+        review = reviews[0]
+        for number in range(7):
+            Comment.objects.create(
+                review_id=review['id'], author=admin, text=f'Текст {number}'
+            )
+        comments = Comment.objects.filter(review_id=review['id'])
+        comments.update(pub_date=comments.first().pub_date)
+        expected = sorted(comments.values_list('id', flat=True), reverse=True)
+        monkeypatch.setattr(PubDateCursorPagination, 'page_size', 2)
+
+        url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=titles[0]['id'], review_id=review['id']
+        )
+        assert self.walk_cursor_pages(client, url, 2) == expected, (
+            'Проверьте, что курсор учитывает `id` при одинаковой '
+            '`pub_date`.'
+        )
+
+        next_url = client.get(f'{url}?pagination=cursor').json()['next']
+        with CaptureQueriesContext(connection) as context:
+            data = client.get(next_url).json()
+        assert [element['id'] for element in data['results']] == (
+            expected[2:4]
+        )
+        assert not any(
+            'OFFSET' in query['sql'] for query in context.captured_queries
+        ), (
+            'Проверьте, что курсор задаёт позицию по `(pub_date, id)` '
+            'без OFFSET.'
+        )
+        previous = client.get(data['previous']).json()
+        assert [element['id'] for element in previous['results']] == (
+            expected[:2]
+        )
+
+        response = client.get(f'{url}?cursor=cD1ub3QtYS1kYXRl')
+        assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11NestedQueries:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def test_01_list_skips_parent_lookup(self, client, admin_client, admin,
+                                         user, user_client,
+                                         django_assert_num_queries):
+        author_map = {admin: admin_client, user: user_client}
+        _, reviews, titles = create_comments(admin_client, author_map)
+
+        with django_assert_num_queries(2):
+            response = client.get(
+                self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+            )
+        assert response.status_code == HTTPStatus.OK
+        with django_assert_num_queries(2):
+            response = client.get(self.COMMENTS_URL_TEMPLATE.format(
+                title_id=titles[0]['id'], review_id=reviews[0]['id']
+            ))
+        assert response.status_code == HTTPStatus.OK
+
+    def test_02_missing_parent(self, client, admin_client, admin, user,
+                               user_client):
+        author_map = {admin: admin_client, user: user_client}
+        _, reviews, titles = create_comments(admin_client, author_map)
+
+        response = client.get(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[1]['id'])
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что GET-запрос к списку отзывов произведения без '
+            'отзывов возвращает ответ со статусом 200.'
+        )
+        response = client.get(self.REVIEWS_URL_TEMPLATE.format(title_id=0))
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что GET-запрос к списку отзывов несуществующего '
+            'произведения возвращает ответ со статусом 404.'
+        )
+        response = client.get(self.COMMENTS_URL_TEMPLATE.format(
+            title_id=titles[1]['id'], review_id=reviews[0]['id']
+        ))
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что GET-запрос к комментариям отзыва, который не '
+            'относится к произведению из адреса, возвращает ответ со '
+            'статусом 404.'
+        )
+        response = user_client.post(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=0),
+            data={'text': 'text', 'score': 5}
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,147 @@
+import json
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_categories, create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12TitleBulkImport:
+
+    TITLES_BULK_URL = '/api/v1/titles/bulk/'
+
+    @staticmethod
+    def make_items(genres, categories, count):
+        return [
+            {
+                'name': f'Произведение {idx}',
+                'year': 1900 + idx % 100,
+                'genre': [genre['slug'] for genre in genres],
+                'category': categories[idx % 2]['slug'],
+                'description': f'Описание {idx}',
+            }
+            for idx in range(count)
+        ]
+
+    def test_01_bulk_permissions(self, client, user_client, moderator_client):
+        for user_client_, status in (
+            (client, HTTPStatus.UNAUTHORIZED),
+            (user_client, HTTPStatus.FORBIDDEN),
+            (moderator_client, HTTPStatus.FORBIDDEN),
+        ):
+            response = user_client_.post(
+                self.TITLES_BULK_URL, data='[]', content_type='application/json'
+            )
+            assert response.status_code == status, (
+                f'Проверьте, что POST-запрос к `{self.TITLES_BULK_URL}` '
+                'доступен только администратору.'
+            )
+
+    def test_02_bulk_json(self, admin_client):
+        from reviews.models import GenreTitle, Title
+
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        items = self.make_items(genres, categories, 5)
+        items[1]['year'] = 'дветыщи'
+        items[3]['genre'] = ['unknown']
+        items.append('not a title')
+
+        response = admin_client.post(
+            self.TITLES_BULK_URL, data=items, format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Проверьте, что POST-запрос администратора к '
+            f'`{self.TITLES_BULK_URL}` возвращает ответ со статусом 201.'
+        )
+        data = response.json()
+        assert [error['index'] for error in data['errors']] == [1, 3, 5], (
+            f'Проверьте, что ответ на POST-запрос к `{self.TITLES_BULK_URL}` '
+            'содержит ошибки для каждого некорректного элемента.'
+        )
+        assert 'year' in data['errors'][0]['errors']
+        assert 'genre' in data['errors'][1]['errors']
+        assert len(data['created']) == 3
+        titles = Title.objects.in_bulk(data['created'])
+        for pk, idx in zip(data['created'], (0, 2, 4)):
+            assert titles[pk].name == items[idx]['name']
+        assert GenreTitle.objects.filter(
+            title_id__in=data['created']
+        ).count() == 3 * len(genres)
+
+        response = admin_client.post(
+            self.TITLES_BULK_URL, data=[{'name': 'x'}], format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_03_bulk_ndjson(self, admin_client):
+        from reviews.models import Title
+
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        items = self.make_items(genres, categories, 3)
+        response = admin_client.post(
+            self.TITLES_BULK_URL,
+            data='\n'.join(json.dumps(item) for item in items) + '\n',
+            content_type='application/x-ndjson'
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert Title.objects.count() == 3
+
+    def test_04_bulk_queries(self, admin_client):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        queries = []
+        for count in (10, 100):
+            items = self.make_items(genres, categories, count)
+            with CaptureQueriesContext(connection) as context:
+                response = admin_client.post(
+                    self.TITLES_BULK_URL, data=items, format='json'
+                )
+            assert response.status_code == HTTPStatus.CREATED
+            queries.append(len(context))
+        assert queries[0] == queries[1], (
+            f'Проверьте, что POST-запрос к `{self.TITLES_BULK_URL}` '
+            'выполняет одинаковое число запросов независимо от числа '
+            'произведений.'
+        )
+
+    def test_05_bulk_ids_by_batch(self, admin_client, monkeypatch):
+        from api.serializers import TitleListSerializer
+        from reviews.models import Title
+
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        Title.objects.create(name='Старое произведение', year=2000)
+        monkeypatch.setattr(TitleListSerializer, 'batch_size', 2)
+        items = self.make_items(genres, categories, 5)
+        response = admin_client.post(
+            self.TITLES_BULK_URL, data=items, format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        titles = Title.objects.in_bulk(response.json()['created'])
+        assert [
+            titles[pk].name for pk in response.json()['created']
+        ] == [item['name'] for item in items], (
+            f'Проверьте, что ответ на POST-запрос к `{self.TITLES_BULK_URL}` '
+            'содержит идентификаторы созданных произведений по порядку.'
+        )
+
+    def test_06_bulk_body_size(self, admin_client, settings):
+        from reviews.models import Title
+
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        settings.BULK_IMPORT_MAX_SIZE = 100
+        response = admin_client.post(
+            self.TITLES_BULK_URL,
+            data=self.make_items(genres, categories, 3), format='json'
+        )
+        assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE, (
+            f'Проверьте, что POST-запрос к `{self.TITLES_BULK_URL}` с телом '
+            'больше `BULK_IMPORT_MAX_SIZE` возвращает ответ со статусом 413.'
+        )
+        assert not Title.objects.exists()
@@ -0,0 +1,67 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+CSV_DATA = {
+    'users.csv': (
+        'id,username,email,role,bio,first_name,last_name\n'
+        '100,bingobongo,bingobongo@yamdb.fake,user,,,\n'
+        '101,capt_obvious,capt_obvious@yamdb.fake,admin,,Капитан,\n'
+    ),
+    'category.csv': 'id,name,slug\n1,Фильм,movie\n2,Книга,book\n',
+    'genre.csv': 'id,name,slug\n1,Драма,drama\n2,Комедия,comedy\n',
+    'titles.csv': (
+        'id,name,year,category\n'
+        '1,Побег из Шоушенка,1994,1\n'
+        '2,Крестный отец,1972,1\n'
+        '3,Мастер и Маргарита,1967,2\n'
+    ),
+    'genre_title.csv': 'id,title_id,genre_id\n1,1,1\n2,2,1\n3,2,2\n',
+    'review.csv': (
+        'id,title_id,text,author,score,pub_date\n'
+        '1,1,Ставлю десять звёзд!,100,10,2019-09-24T21:08:21.567Z\n'
+        '2,1,Не впечатлило.,101,5,2019-09-25T21:08:21.567Z\n'
+        '3,2,Классика.,100,9,2019-09-26T21:08:21.567Z\n'
+    ),
+    'comments.csv': (
+        'id,review_id,text,author,pub_date\n'
+        '1,1,Согласен.,101,2019-09-24T21:08:21.567Z\n'
+    ),
+}
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13LoadCSV:
+
+    def test_01_load_csv(self, tmp_path):
+        from reviews.models import Comment, GenreTitle, Review, Title, User
+
+        for filename, content in CSV_DATA.items():
+            (tmp_path / filename).write_text(content, encoding='utf-8')
+        stdout = StringIO()
+
+        call_command(
+            'load_csv', path=tmp_path, batch_size=2, stdout=stdout
+        )
+
+        assert User.objects.count() == 2
+        assert Title.objects.count() == 3
+        assert GenreTitle.objects.count() == 3
+        assert Comment.objects.get(pk=1).author.username == 'capt_obvious'
+        review = Review.objects.get(pk=1)
+        assert review.pub_date.year == 2019, (
+            'Проверьте, что команда `load_csv` сохраняет дату публикации '
+            'из CSV-файла.'
+        )
+        assert Title.objects.get(pk=1).rating == 7, (
+            'Проверьте, что после загрузки отзывов команда `load_csv` '
+            'пересчитывает рейтинги произведений.'
+        )
+        assert 'строк/с' in stdout.getvalue()
+
+        review = Review.objects.create(
+            title_id=3, author_id=101, text='Новый отзыв', score=8
+        )
+        assert review.pk > 3
+        assert review.pub_date.year > 2019
@@ -0,0 +1,78 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14ResponseCache:
+
+    CATEGORIES_URL = '/api/v1/categories/'
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    def test_01_cached_reads(self, client, admin_client,
+                             django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        detail_url = self.TITLES_DETAIL_URL_TEMPLATE.format(
+            title_id=titles[0]['id']
+        )
+        for url in (self.TITLES_URL, f'{self.TITLES_URL}?year=1984',
+                    detail_url, self.CATEGORIES_URL):
+            expected = client.get(url).json()
+            with django_assert_num_queries(0):
+                response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            assert response.json() == expected, (
+                f'Проверьте, что повторный GET-запрос к `{url}` '
+                'возвращает закешированный ответ.'
+            )
+        assert len(client.get(f'{self.TITLES_URL}?year=1984').json()[
+            'results'
+        ]) == 1
+
+    def test_02_invalidation(self, client, admin_client, user_client):
+        titles, categories, _ = create_titles(admin_client)
+        detail_url = self.TITLES_DETAIL_URL_TEMPLATE.format(
+            title_id=titles[0]['id']
+        )
+        assert client.get(detail_url).json()['rating'] is None
+
+        create_single_review(user_client, titles[0]['id'], 'Отзыв', 7)
+        assert client.get(detail_url).json()['rating'] == 7, (
+            'Проверьте, что кеш произведений сбрасывается при добавлении '
+            'отзыва.'
+        )
+
+        response = admin_client.patch(detail_url, data={'name': 'Новое'})
+        assert response.status_code == HTTPStatus.OK
+        assert client.get(detail_url).json()['name'] == 'Новое'
+
+        client.get(self.CATEGORIES_URL)
+        response = admin_client.delete(
+            f'{self.CATEGORIES_URL}{categories[0]["slug"]}/'
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert len(client.get(self.CATEGORIES_URL).json()['results']) == 1, (
+            'Проверьте, что кеш категорий сбрасывается при удалении '
+            'категории.'
+        )
+        assert client.get(detail_url).json()['category'] is None, (
+            'Проверьте, что кеш произведений сбрасывается при удалении '
+            'категории.'
+        )
+
+    def test_03_hosts(self, client, admin_client, monkeypatch):
+        from rest_framework.pagination import PageNumberPagination
+
+        create_titles(admin_client)
+        monkeypatch.setattr(PageNumberPagination, 'page_size', 1)
+        first = client.get(self.TITLES_URL, HTTP_HOST='a.example.com')
+        second = client.get(self.TITLES_URL, HTTP_HOST='b.example.com')
+        assert first.json()['next'].startswith('http://a.example.com/')
+        assert second.json()['next'].startswith('http://b.example.com/'), (
+            'Проверьте, что закешированные ответы не отдают ссылки '
+            'пагинации другого хоста.'
+        )
+        assert first['ETag'] != second['ETag']
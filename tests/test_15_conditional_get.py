@@ -0,0 +1,246 @@
+import time
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_comments, create_single_comment
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15ConditionalGet:
+
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def assert_not_modified(self, client, url, django_assert_num_queries):
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        etag = response['ETag']
+        assert etag.startswith('"'), (
+            f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+            'строгий заголовок `ETag`.'
+        )
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f'Проверьте, что GET-запрос к `{url}` с актуальным '
+            '`If-None-Match` возвращает ответ со статусом 304.'
+        )
+        assert response['ETag'] == etag
+        return etag
+
+    def test_01_not_modified(self, client, admin_client, admin, user,
+                             user_client, django_assert_num_queries,
+                             monkeypatch):
+        author_map = {admin: admin_client, user: user_client}
+        _, reviews, titles = create_comments(admin_client, author_map)
+        title_id, review_id = titles[0]['id'], reviews[0]['id']
+        for url in (
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=title_id),
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title_id),
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review_id
+            ),
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review_id
+            ),
+        ):
+            self.assert_not_modified(client, url, django_assert_num_queries)
+
+        title_url = self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        now = time.time_ns()
+        monkeypatch.setattr(time, 'time_ns', lambda: now + 10 ** 9)
+        last_modified = client.get(title_url)['Last-Modified']
+        response = client.get(title_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_DETAIL_URL_TEMPLATE}` '
+            'с актуальным `If-Modified-Since` возвращает ответ со статусом '
+            '304.'
+        )
+
+    def test_02_modified(self, client, admin_client, admin, user,
+                         user_client, django_assert_num_queries):
+        author_map = {admin: admin_client, user: user_client}
+        _, reviews, titles = create_comments(admin_client, author_map)
+        title_id, review_id = titles[0]['id'], reviews[0]['id']
+        reviews_url = self.REVIEWS_URL_TEMPLATE.format(title_id=title_id)
+        comments_url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=title_id, review_id=review_id
+        )
+        reviews_etag = self.assert_not_modified(
+            client, reviews_url, django_assert_num_queries
+        )
+        comments_etag = self.assert_not_modified(
+            client, comments_url, django_assert_num_queries
+        )
+
+        response = user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[1]['id']
+            ),
+            data={'text': 'Изменённый отзыв'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        response = client.get(reviews_url, HTTP_IF_NONE_MATCH=reviews_etag)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что `ETag` ответа на GET-запрос к '
+            f'`{self.REVIEWS_URL_TEMPLATE}` меняется при изменении отзыва.'
+        )
+        assert response['ETag'] != reviews_etag
+
+        create_single_comment(user_client, title_id, review_id, 'Ещё один')
+        response = client.get(comments_url, HTTP_IF_NONE_MATCH=comments_etag)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что `ETag` ответа на GET-запрос к '
+            f'`{self.COMMENTS_URL_TEMPLATE}` меняется при добавлении '
+            'комментария.'
+        )
+
+    def test_03_leading_zeros(self, client, admin_client, admin, user,
+                              user_client):
+        author_map = {admin: admin_client, user: user_client}
+        _, reviews, titles = create_comments(admin_client, author_map)
+        title_id, review_id = titles[0]['id'], reviews[0]['id']
+        urls = (
+            self.REVIEWS_URL_TEMPLATE.format(title_id=f'0{title_id}'),
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=f'0{title_id}', review_id=f'0{review_id}'
+            ),
+        )
+        etags = [client.get(url)['ETag'] for url in urls]
+        response = admin_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review_id
+            ),
+            data={'text': 'Изменённый отзыв'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        create_single_comment(user_client, title_id, review_id, 'Ещё один')
+        for url, etag in zip(urls, etags):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.OK, (
+                f'Проверьте, что `ETag` ответа на GET-запрос к `{url}` '
+                'меняется при изменении данных, даже если в '
+                'идентификаторе есть ведущие нули.'
+            )
+
+    def test_04_username_change(self, client, admin_client, admin, user,
+                                user_client):
+        author_map = {admin: admin_client, user: user_client}
+        _, reviews, titles = create_comments(admin_client, author_map)
+        title_id, review_id = titles[0]['id'], reviews[0]['id']
+        urls = (
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title_id),
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review_id
+            ),
+        )
+        etags = [client.get(url)['ETag'] for url in urls]
+        response = admin_client.patch(
+            f'/api/v1/users/{user.username}/', data={'username': 'renamed'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        for url, etag in zip(urls, etags):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.OK, (
+                f'Проверьте, что `ETag` ответа на GET-запрос к `{url}` '
+                'меняется при смене имени автора.'
+            )
+            assert 'renamed' in response.content.decode()
+
+    def test_05_last_modified_same_second(self, client, admin_client,
+                                          monkeypatch):
+        from reviews.models import Title
+
+        clock = [(time.time_ns() // 10 ** 9 + 10) * 10 ** 9]
+        monkeypatch.setattr(time, 'time_ns', lambda: clock[0])
+        title = Title.objects.create(name='Произведение', year=2000)
+        url = self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=title.pk)
+        clock[0] += 10 ** 8
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert not response.has_header('Last-Modified'), (
+            'Проверьте, что `Last-Modified` не отдаётся, пока не '
+            'закончилась секунда последнего изменения.'
+        )
+        clock[0] += 10 ** 9
+        last_modified = client.get(url)['Last-Modified']
+        clock[0] += 10 ** 8
+        response = admin_client.patch(url, data={'name': 'Новое название'})
+        assert response.status_code == HTTPStatus.OK
+        response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_DETAIL_URL_TEMPLATE}` '
+            'с `If-Modified-Since` возвращает новые данные после '
+            'изменения.'
+        )
+        assert response.json()['name'] == 'Новое название'
+
+    def test_06_missing_objects(self, client, admin_client, admin,
+                                user_client, user):
+        from email.utils import formatdate
+
+        _, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        future = formatdate(time.time() + 3600, usegmt=True)
+        for url in (
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=999999),
+            self.REVIEWS_URL_TEMPLATE.format(title_id=999999),
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=titles[0]['id'], review_id=999999
+            ),
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=titles[0]['id'], review_id=999999
+            ),
+        ):
+            for headers in (
+                {'HTTP_IF_NONE_MATCH': '*'},
+                {'HTTP_IF_MODIFIED_SINCE': future},
+            ):
+                response = client.get(url, **headers)
+                assert response.status_code == HTTPStatus.NOT_FOUND, (
+                    f'Проверьте, что GET-запрос к `{url}` с {headers} '
+                    'возвращает 404 для несуществующего объекта.'
+                )
+        url = self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        response = client.get(url, HTTP_IF_NONE_MATCH='*')
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        empty_title = titles[-1]
+        reviews_url = self.REVIEWS_URL_TEMPLATE.format(
+            title_id=empty_title['id']
+        )
+        response = client.get(reviews_url)
+        etag = response['ETag']
+        assert admin_client.delete(
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=empty_title['id'])
+        ).status_code == HTTPStatus.NO_CONTENT
+        response = client.get(reviews_url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что после удаления произведения его отзывы '
+            'не отвечают 304.'
+        )
+
+
+def test_shared_cache_check(settings):
+    from api.checks import check_shared_cache
+
+    assert [
+        warning.id for warning in check_shared_cache(None)
+    ] == ['api.W001'], (
+        'Проверьте, что `check --deploy` предупреждает о кеше, '
+        'локальном для процесса.'
+    )
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
+    }
+    assert check_shared_cache(None) == []
@@ -0,0 +1,57 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16TitleSearch:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    def search(self, client, query):
+        response = client.get(self.TITLES_URL, {'search': query})
+        assert response.status_code == HTTPStatus.OK
+        return [title['name'] for title in response.json()['results']]
+
+    def test_01_search(self, client, admin_client):
+        titles, categories, genres = create_titles(admin_client)
+        admin_client.post(self.TITLES_URL, data={
+            'name': 'Терминатор 2: Судный день',
+            'year': 1991,
+            'genre': [genres[0]['slug']],
+            'category': categories[0]['slug'],
+            'description': 'Терминатор возвращается. Терминатор защищает.'
+        })
+
+        assert self.search(client, 'терминатор') == [
+            'Терминатор 2: Судный день', 'Терминатор'
+        ], (
+            f'Проверьте, что параметр `search` эндпоинта `{self.TITLES_URL}` '
+            'ищет по названию и описанию и сортирует по релевантности.'
+        )
+        assert self.search(client, 'yippie') == ['Крепкий орешек'], (
+            f'Проверьте, что параметр `search` эндпоинта `{self.TITLES_URL}` '
+            'ищет по описанию произведения.'
+        )
+        assert self.search(client, 'креп оре') == ['Крепкий орешек']
+        assert self.search(client, 'терминатор орешек') == []
+        assert self.search(client, '"(*') == self.search(client, '')
+
+        response = admin_client.patch(
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[1]['id']),
+            data={'name': 'Die Hard'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert self.search(client, 'крепкий') == [], (
+            'Проверьте, что поисковый индекс обновляется при изменении '
+            'произведения.'
+        )
+        assert self.search(client, 'die') == ['Die Hard']
+
+        admin_client.delete(
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[1]['id'])
+        )
+        assert self.search(client, 'die') == []
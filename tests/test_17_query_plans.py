@@ -0,0 +1,110 @@
+import re
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_comments, create_titles
+
+FULL_SCAN = re.compile(r'^SCAN \S+$')
+TEMP_SORT = 'USE TEMP B-TREE'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17QueryPlans:
+
+    LIST_URL_TEMPLATES = (
+        '/api/v1/categories/',
+        '/api/v1/genres/',
+        '/api/v1/titles/',
+        '/api/v1/titles/?year=1984',
+        '/api/v1/titles/?category=films',
+        '/api/v1/titles/{title_id}/reviews/',
+        '/api/v1/titles/{title_id}/reviews/?pagination=cursor',
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/',
+        '/api/v1/users/',
+    )
+    # Titles of a genre come through the link table and search results
+    # are ordered by relevance: both sort the rows they match, but find
+    # them through indexes only.
+    SORTED_URL_TEMPLATES = (
+        '/api/v1/titles/?genre=horror',
+        '/api/v1/titles/?search=терминатор',
+        '/api/v1/titles/?genre=horror&search=терминатор',
+    )
+
+    @staticmethod
+    def explain(sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+
+    def get_plans(self, client, url):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        return response, [
+            (query['sql'], self.explain(query['sql']))
+            for query in context.captured_queries
+            if query['sql'].startswith('SELECT')
+        ]
+
+    def test_01_list_query_plans(self, admin_client, admin, user,
+                                 user_client):
+        if connection.vendor != 'sqlite':
+            pytest.skip('Планы запросов проверяются только для SQLite.')
+        author_map = {admin: admin_client, user: user_client}
+        _, reviews, titles = create_comments(admin_client, author_map)
+
+        for url_template in self.LIST_URL_TEMPLATES:
+            url = url_template.format(
+                title_id=titles[0]['id'], review_id=reviews[0]['id']
+            )
+            _, plans = self.get_plans(admin_client, url)
+            for sql, plan in plans:
+                bad_steps = [
+                    step for step in plan
+                    if FULL_SCAN.match(step) or TEMP_SORT in step
+                ]
+                assert not bad_steps, (
+                    f'Проверьте индексы для GET-запроса к `{url_template}`: '
+                    f'запрос `{sql}` выполняет {bad_steps}.'
+                )
+
+    def test_02_sorted_query_plans(self, admin_client):
+        from api.filters import TITLE_SEARCH_TABLE
+
+        if connection.vendor != 'sqlite':
+            pytest.skip('Планы запросов проверяются только для SQLite.')
+        create_titles(admin_client)
+
+        for url in self.SORTED_URL_TEMPLATES:
+            response, plans = self.get_plans(admin_client, url)
+            assert response.json()['count'] == 1
+            for sql, plan in plans:
+                bad_steps = [
+                    step for step in plan
+                    if step.startswith('SCAN')
+                    and not step.startswith(f'SCAN {TITLE_SEARCH_TABLE} ')
+                ]
+                assert not bad_steps, (
+                    f'Проверьте индексы для GET-запроса к `{url}`: '
+                    f'запрос `{sql}` выполняет {bad_steps}.'
+                )
+
+    def test_03_title_genres_order(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        for url in (
+            '/api/v1/titles/',
+            f'/api/v1/titles/{titles[0]["id"]}/',
+        ):
+            response = admin_client.get(url)
+            data = response.json()
+            title = data['results'][-1] if 'results' in data else data
+            assert [genre['name'] for genre in title['genre']] == [
+                'Комедия', 'Ужасы'
+            ], (
+                f'Проверьте, что жанры произведения в ответе на GET-запрос '
+                f'к `{url}` отсортированы по названию.'
+            )
@@ -0,0 +1,133 @@
+import json
+import re
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18RequestMetrics:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_server_timing(self, client):
+        response = client.get(self.TITLES_URL)
+        assert response.status_code == HTTPStatus.OK
+        server_timing = response['Server-Timing']
+        for metric in ('db;dur=', 'app;dur=', 'serializer;dur=',
+                       'render;dur=', 'total;dur='):
+            assert metric in server_timing, (
+                f'Проверьте, что ответ на GET-запрос к `{self.TITLES_URL}` '
+                f'содержит метрику `{metric}` в заголовке `Server-Timing`.'
+            )
+        assert re.search(r'db;dur=[\d.]+;desc="\d+ queries"', server_timing)
+
+    def test_02_serializer_time(self, client, admin_client, monkeypatch):
+        import time
+
+        from api.serializers import TitleGetSerializer
+        from tests.utils import create_titles
+
+        create_titles(admin_client)
+        to_representation = TitleGetSerializer.to_representation
+
+        def slow_to_representation(self, instance):
+            time.sleep(0.02)
+            return to_representation(self, instance)
+
+        monkeypatch.setattr(
+            TitleGetSerializer, 'to_representation', slow_to_representation
+        )
+        response = client.get(self.TITLES_URL)
+        timings = dict(re.findall(
+            r'(\w+);dur=([\d.]+)', response['Server-Timing']
+        ))
+        assert float(timings['serializer']) >= 20 * len(
+            response.json()['results']
+        ), (
+            'Проверьте, что время сериализации учитывается в метрике '
+            '`serializer`.'
+        )
+        assert float(timings['app']) < float(timings['serializer'])
+
+    def test_03_dump_metrics(self, client, settings, tmp_path):
+        from api.metrics import request_metrics
+
+        settings.REQUEST_METRICS_DIR = tmp_path
+        request_metrics.reset()
+        for _ in range(3):
+            client.get(self.TITLES_URL)
+        client.get('/api/v1/categories/')
+        request_metrics.flush()
+
+        stdout = StringIO()
+        call_command('dump_request_metrics', '--json', stdout=stdout)
+        routes = json.loads(stdout.getvalue())
+        assert routes['titles-list']['requests'] == 3, (
+            'Проверьте, что метрики запросов агрегируются по имени '
+            'маршрута.'
+        )
+        assert routes['titles-list']['queries'] >= 1
+        assert sum(routes['titles-list']['histogram']) == 3
+        assert routes['categories-list']['bytes'] > 0
+
+        stdout = StringIO()
+        call_command('dump_request_metrics', '--reset', stdout=stdout)
+        assert 'titles-list' in stdout.getvalue()
+        assert not list(tmp_path.glob('*.json'))
+
+    def test_04_dumps_of_finished_processes(self, client, settings,
+                                            tmp_path):
+        import itertools
+        import os
+        import time
+
+        from api.metrics import process_exists, request_metrics
+
+        assert settings.REQUEST_METRICS_DIR is None, (
+            'Проверьте, что метрики запросов по умолчанию не сохраняются '
+            'на диск.'
+        )
+        settings.REQUEST_METRICS_DIR = tmp_path
+        request_metrics.reset()
+        client.get(self.TITLES_URL)
+        request_metrics.flush()
+        dump = (tmp_path / f'{os.getpid()}.json').read_text()
+        finished_pid, expired_pid = itertools.islice(
+            (pid for pid in range(2 ** 22, 1, -1) if not process_exists(pid)),
+            2
+        )
+        (tmp_path / f'{finished_pid}.json').write_text(dump)
+        expired = tmp_path / f'{expired_pid}.json'
+        expired.write_text(dump)
+        old = time.time() - settings.REQUEST_METRICS_RETENTION - 1
+        os.utime(expired, (old, old))
+
+        stdout = StringIO()
+        call_command('dump_request_metrics', '--json', stdout=stdout)
+        assert json.loads(stdout.getvalue())['titles-list']['requests'] == 2
+        assert not expired.exists(), (
+            'Проверьте, что `dump_request_metrics` удаляет устаревшие '
+            'метрики завершившихся процессов.'
+        )
+
+    def test_05_reset_running_process(self, client, settings, tmp_path):
+        from api.metrics import request_metrics
+
+        settings.REQUEST_METRICS_DIR = tmp_path
+        request_metrics.reset()
+        for _ in range(3):
+            client.get(self.TITLES_URL)
+        request_metrics.flush()
+        call_command('dump_request_metrics', '--reset', stdout=StringIO())
+
+        client.get(self.TITLES_URL)
+        request_metrics.flush()
+        stdout = StringIO()
+        call_command('dump_request_metrics', '--json', stdout=stdout)
+        assert json.loads(stdout.getvalue())['titles-list']['requests'] == 1, (
+            'Проверьте, что `dump_request_metrics --reset` сбрасывает '
+            'счётчики работающих процессов.'
+        )
@@ -0,0 +1,114 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+OPTIONS = {
+    'seed': 7,
+    'users': 50,
+    'categories': 3,
+    'genres': 5,
+    'titles': 200,
+    'reviews': 1000,
+    'comments': 1000,
+    'batch_size': 64,
+}
+
+
+def generate(**options):
+    call_command(
+        'generate_fixtures', stdout=StringIO(), **{**OPTIONS, **options}
+    )
+
+
+def snapshot():
+    from reviews.models import Comment, Review, Title
+
+    return (
+        list(Title.objects.order_by('pk').values_list(
+            'pk', 'name', 'category_id', 'rating_sum', 'rating_count'
+        )),
+        list(Review.objects.order_by('pk').values_list(
+            'pk', 'title_id', 'author_id', 'score', 'pub_date'
+        )),
+        list(Comment.objects.order_by('pk').values_list(
+            'review_id', 'author_id'
+        )),
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19GenerateFixtures:
+
+    def test_01_generate_fixtures(self):
+        from django.db.models import Count, Sum
+        from reviews.models import Category, Genre, GenreTitle, Title, User
+
+        generate()
+
+        assert User.objects.count() == OPTIONS['users']
+        assert Category.objects.count() == OPTIONS['categories']
+        assert Genre.objects.count() == OPTIONS['genres']
+        assert Title.objects.count() == OPTIONS['titles']
+        assert GenreTitle.objects.count() >= OPTIONS['titles']
+        titles = Title.objects.annotate(
+            reviews_total=Count('reviews'), scores=Sum('reviews__score')
+        )
+        for title in titles:
+            assert title.rating_count == title.reviews_total, (
+                'Проверьте, что команда `generate_fixtures` сохраняет '
+                'количество отзывов произведения в `rating_count`.'
+            )
+            assert title.rating_sum == (title.scores or 0)
+        counts = sorted(title.reviews_total for title in titles)
+        assert counts[-1] >= 10 * (sum(counts) / len(counts)), (
+            'Проверьте, что число отзывов на произведение распределено '
+            'неравномерно (по закону Ципфа).'
+        )
+        assert counts[len(counts) // 2] <= 2
+
+    def test_02_generate_fixtures_deterministic(self):
+        from reviews.models import Category, Genre, Title, User
+
+        generate()
+        first = snapshot()
+        for model in (Title, Genre, Category, User):
+            model.objects.all().delete()
+        generate()
+
+        assert snapshot() == first, (
+            'Проверьте, что команда `generate_fixtures` генерирует '
+            'одинаковые данные при одинаковом `seed`.'
+        )
+
+    def test_03_generate_fixtures_seed(self):
+        from reviews.models import Title
+
+        generate()
+        generate(seed=OPTIONS['seed'] + 1)
+
+        names = list(Title.objects.order_by('pk').values_list(
+            'name', flat=True
+        ))
+        assert names[:OPTIONS['titles']] != names[OPTIONS['titles']:], (
+            'Проверьте, что команда `generate_fixtures` использует `seed`.'
+        )
+
+    def test_04_generate_fixtures_raw(self):
+        from django.db import connection
+        from reviews.models import Category, Genre, Title, User
+
+        if connection.vendor != 'sqlite':
+            pytest.skip('`--raw` пишет только в SQLite.')
+        generate()
+        first = snapshot()
+        for model in (Title, Genre, Category, User):
+            model.objects.all().delete()
+        generate(raw=True)
+
+        assert snapshot() == first, (
+            'Проверьте, что команда `generate_fixtures --raw` генерирует '
+            'те же данные, что и без `--raw`.'
+        )
+        user = User.objects.order_by('pk').first()
+        assert user.is_active and user.role == User.USER
@@ -0,0 +1,57 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20UserCache:
+
+    ME_URL = '/api/v1/users/me/'
+    USERS_URL = '/api/v1/users/'
+    USER_DETAIL_URL_TEMPLATE = '/api/v1/users/{username}/'
+
+    def test_01_cached_user(self, user_client, django_assert_num_queries):
+        expected = user_client.get(self.ME_URL).json()
+
+        with django_assert_num_queries(0):
+            response = user_client.get(self.ME_URL)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == expected, (
+            'Проверьте, что аутентифицированный запрос не загружает '
+            'пользователя из базы данных повторно.'
+        )
+
+    def test_02_role_change(self, admin_client, moderator, moderator_client):
+        assert moderator_client.get(self.USERS_URL).status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+
+        response = admin_client.patch(
+            self.USER_DETAIL_URL_TEMPLATE.format(username=moderator.username),
+            data={'role': 'admin'}
+        )
+        assert response.status_code == HTTPStatus.OK
+
+        assert moderator_client.get(self.USERS_URL).status_code == (
+            HTTPStatus.OK
+        ), (
+            'Проверьте, что смена роли пользователя сбрасывает '
+            'закешированного пользователя.'
+        )
+
+    def test_03_me_update_and_delete(self, admin_client, user, user_client):
+        response = user_client.patch(self.ME_URL, data={'bio': 'Новое'})
+        assert response.status_code == HTTPStatus.OK
+        assert user_client.get(self.ME_URL).json()['bio'] == 'Новое'
+
+        response = admin_client.delete(
+            self.USER_DETAIL_URL_TEMPLATE.format(username=user.username)
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert user_client.get(self.ME_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        ), (
+            'Проверьте, что удалённый пользователь не остаётся '
+            'в кеше аутентификации.'
+        )
@@ -0,0 +1,105 @@
+from http import HTTPStatus
+
+import pytest
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tests.utils import create_single_review, create_titles
+
+
+def claims_client(user):
+    from users.models import ConfirmationCode
+
+    code = f'code-{user.username}'
+    ConfirmationCode.issue(user, code)
+    response = APIClient().post('/api/v1/auth/token/', data={
+        'username': user.username,
+        'confirmation_code': code,
+    })
+    assert response.status_code == HTTPStatus.OK
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f'Bearer {response.json()["token"]}'
+    )
+    return client, AccessToken(response.json()['token'])
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21TokenClaims:
+
+    CATEGORIES_URL = '/api/v1/categories/'
+    ME_URL = '/api/v1/users/me/'
+    USER_DETAIL_URL_TEMPLATE = '/api/v1/users/{username}/'
+
+    def test_01_token_claims(self, admin, user):
+        _, token = claims_client(admin)
+        assert token['role'] == 'admin'
+        assert token['is_superuser'] is False
+        assert token['token_version'] == admin.token_version, (
+            'Проверьте, что токен содержит роль пользователя и версию '
+            'токенов.'
+        )
+
+    def test_02_query_free_permissions(self, user,
+                                       django_assert_num_queries):
+        client, _ = claims_client(user)
+        data = {'name': 'Фильм', 'slug': 'films'}
+        client.post(self.CATEGORIES_URL, data=data)
+
+        with django_assert_num_queries(0):
+            response = client.post(self.CATEGORIES_URL, data=data)
+
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            'Проверьте, что права доступа проверяются по данным токена '
+            'без запросов к базе данных.'
+        )
+        response = client.get(self.ME_URL)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['username'] == user.username
+
+    def test_03_role_change_revokes_token(self, admin, moderator,
+                                          admin_client):
+        client, _ = claims_client(moderator)
+        assert client.get(self.ME_URL).status_code == HTTPStatus.OK
+
+        response = admin_client.patch(
+            self.USER_DETAIL_URL_TEMPLATE.format(username=moderator.username),
+            data={'role': 'user'}
+        )
+        assert response.status_code == HTTPStatus.OK
+
+        assert client.get(self.ME_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        ), (
+            'Проверьте, что смена роли пользователя отзывает выданные '
+            'ранее токены.'
+        )
+        moderator.refresh_from_db()
+        client, token = claims_client(moderator)
+        assert token['role'] == 'user'
+        assert client.get(self.ME_URL).status_code == HTTPStatus.OK
+
+        client.patch(self.ME_URL, data={'bio': 'Новое'})
+        assert client.get(self.ME_URL).status_code == HTTPStatus.OK, (
+            'Проверьте, что изменение профиля без смены роли не отзывает '
+            'токены.'
+        )
+
+    def test_04_author_permissions(self, admin_client, user, moderator):
+        titles, _, _ = create_titles(admin_client)
+        author_client, _ = claims_client(user)
+        moderator.role = 'user'
+        moderator.save()
+        other_client, _ = claims_client(moderator)
+        review = create_single_review(
+            author_client, titles[0]['id'], 'Отзыв', 5
+        ).json()
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{review["id"]}/'
+
+        response = other_client.patch(url, data={'text': 'Чужой'})
+        assert response.status_code == HTTPStatus.FORBIDDEN
+        response = author_client.patch(url, data={'text': 'Свой'})
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что автор может изменить свой отзыв, '
+            'аутентифицировавшись токеном с ролью.'
+        )
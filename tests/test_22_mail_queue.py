@@ -0,0 +1,136 @@
+from datetime import timedelta
+from http import HTTPStatus
+from io import StringIO
+from smtplib import SMTPException
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.utils import timezone
+
+
+def send_queued_mail(**options):
+    call_command('send_queued_mail', stdout=StringIO(), **options)
+
+
+def fail_sending(self, messages):
+    raise SMTPException('Сервер недоступен.')
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22MailQueue:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    def test_01_signup_queues_email(self, client):
+        from users.models import QueuedEmail
+
+        data = {'email': 'queued@yamdb.fake', 'username': 'queued'}
+        response = client.post(self.URL_SIGNUP, data=data)
+
+        assert response.status_code == HTTPStatus.OK
+        assert len(mail.outbox) == 0, (
+            'Проверьте, что эндпоинт регистрации ставит письмо в очередь, '
+            'а не отправляет его сам.'
+        )
+        email = QueuedEmail.objects.get()
+        assert email.status == QueuedEmail.PENDING
+        assert email.recipient_list == [data['email']]
+
+        send_queued_mail()
+
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == [data['email']]
+        email.refresh_from_db()
+        assert email.status == QueuedEmail.SENT
+        assert email.sent_at is not None
+
+    def test_02_retry_with_backoff(self, settings, monkeypatch):
+        from users.mail import queue_mail
+        from users.models import QueuedEmail
+
+        settings.MAIL_QUEUE_MAX_ATTEMPTS = 3
+        email = queue_mail('Тема', 'Текст', ['retry@yamdb.fake'])
+        monkeypatch.setattr(EmailBackend, 'send_messages', fail_sending)
+        delays = []
+        for _ in range(2):
+            started = timezone.now()
+            send_queued_mail()
+            email.refresh_from_db()
+            assert email.status == QueuedEmail.PENDING
+            assert 'SMTPException' in email.last_error
+            delays.append(email.next_attempt_at - started)
+            send_queued_mail()
+            assert QueuedEmail.objects.get().attempts == len(delays), (
+                'Проверьте, что письмо не отправляется повторно '
+                'до истечения задержки.'
+            )
+            email.next_attempt_at = timezone.now()
+            email.save()
+        assert delays[1] >= 2 * delays[0] - timedelta(seconds=1), (
+            'Проверьте, что задержка между попытками растёт.'
+        )
+
+        send_queued_mail()
+        email.refresh_from_db()
+        assert email.status == QueuedEmail.FAILED, (
+            'Проверьте, что после `MAIL_QUEUE_MAX_ATTEMPTS` неудачных '
+            'попыток письмо помечается как неотправленное.'
+        )
+
+        monkeypatch.undo()
+        send_queued_mail()
+        assert len(mail.outbox) == 0
+
+    def test_03_thread_pool_batches(self):
+        from users.mail import claim_due, queue_mail
+        from users.models import QueuedEmail
+
+        for idx in range(10):
+            queue_mail('Тема', f'Текст {idx}', [f'user{idx}@yamdb.fake'])
+        first, second = claim_due(4), claim_due(4)
+        assert len(first) == len(second) == 4
+        assert not {email.pk for email in first} & {
+            email.pk for email in second
+        }, 'Проверьте, что одно письмо не достаётся двум обработчикам.'
+        QueuedEmail.objects.update(next_attempt_at=timezone.now())
+
+        send_queued_mail(batch_size=3, workers=4)
+
+        assert sorted(message.body for message in mail.outbox) == sorted(
+            f'Текст {idx}' for idx in range(10)
+        ), 'Проверьте, что каждое письмо из очереди отправлено один раз.'
+        assert not QueuedEmail.objects.exclude(
+            status=QueuedEmail.SENT
+        ).exists()
+
+    def test_04_retention(self, settings):
+        from users.mail import queue_mail
+        from users.models import QueuedEmail
+
+        for idx in range(3):
+            queue_mail('Тема', f'Текст {idx}', [f'user{idx}@yamdb.fake'])
+        send_queued_mail()
+        pending = queue_mail('Тема', 'Текст', ['pending@yamdb.fake'])
+        old = timezone.now() - timedelta(
+            seconds=settings.MAIL_QUEUE_RETENTION + 60
+        )
+        QueuedEmail.objects.filter(
+            pk__in=QueuedEmail.objects.filter(
+                status=QueuedEmail.SENT
+            ).values('pk')[:2]
+        ).update(next_attempt_at=old)
+        QueuedEmail.objects.filter(pk=pending.pk).update(
+            next_attempt_at=timezone.now() + timedelta(hours=1)
+        )
+
+        send_queued_mail()
+
+        assert QueuedEmail.objects.filter(
+            status=QueuedEmail.SENT
+        ).count() == 1, (
+            'Проверьте, что `send_queued_mail` удаляет отправленные письма '
+            'старше `MAIL_QUEUE_RETENTION`.'
+        )
+        assert QueuedEmail.objects.filter(pk=pending.pk).exists()
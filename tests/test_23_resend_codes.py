@@ -0,0 +1,77 @@
+from io import StringIO
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import CommandError, call_command
+
+
+@pytest.fixture
+def backend_calls(monkeypatch):
+    calls = {'connections': 0, 'send_messages': []}
+    original_init = EmailBackend.__init__
+    original_send = EmailBackend.send_messages
+
+    def init(self, *args, **kwargs):
+        calls['connections'] += 1
+        original_init(self, *args, **kwargs)
+
+    def send_messages(self, messages):
+        calls['send_messages'].append(len(messages))
+        return original_send(self, messages)
+
+    monkeypatch.setattr(EmailBackend, '__init__', init)
+    monkeypatch.setattr(EmailBackend, 'send_messages', send_messages)
+    return calls
+
+
+def resend(*args, **options):
+    stdout = StringIO()
+    call_command('resend_confirmation_codes', *args, stdout=stdout, **options)
+    return stdout.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23ResendCodes:
+
+    def test_01_single_connection(self, django_user_model, backend_calls):
+        from users.models import ConfirmationCode
+
+        for idx in range(5):
+            user = django_user_model.objects.create_user(
+                username=f'user{idx}', email=f'user{idx}@yamdb.fake'
+            )
+            ConfirmationCode.issue(user, f'old{idx}')
+
+        output = resend(all=True, batch_size=2)
+
+        assert backend_calls['connections'] == 1, (
+            'Проверьте, что команда `resend_confirmation_codes` отправляет '
+            'все письма через одно соединение.'
+        )
+        assert backend_calls['send_messages'] == [2, 2, 1], (
+            'Проверьте, что письма отправляются пачками `send_messages` '
+            'размера `--batch-size`.'
+        )
+        assert 'писем/с' in output
+        assert len(mail.outbox) == 5
+        for idx, message in enumerate(mail.outbox):
+            confirmation = ConfirmationCode.objects.get(
+                user__email=message.to[0]
+            )
+            assert not confirmation.check_code(f'old{idx}')
+            assert confirmation.check_code(message.body.split()[-1]), (
+                'Проверьте, что письмо содержит новый код подтверждения '
+                'пользователя.'
+            )
+
+    def test_02_selection(self, admin, moderator, user, backend_calls):
+        resend(user.username)
+        assert [message.to for message in mail.outbox] == [[user.email]]
+
+        resend(role='moderator')
+        assert mail.outbox[-1].to == [moderator.email]
+        assert len(mail.outbox) == 2
+
+        with pytest.raises(CommandError):
+            resend()
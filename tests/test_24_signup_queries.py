@@ -0,0 +1,86 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def table_writes(context, table):
+    return [
+        query['sql'].split()[0] for query in context.captured_queries
+        if query['sql'].startswith((
+            f'INSERT INTO "{table}"', f'UPDATE "{table}"'
+        ))
+    ]
+
+
+def sent_code():
+    from users.models import QueuedEmail
+
+    return QueuedEmail.objects.order_by('pk').last().body.split()[-1]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24SignupQueries:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+    URL_TOKEN = '/api/v1/auth/token/'
+
+    def test_01_signup_round_trips(self, client):
+        from users.models import ConfirmationCode
+
+        data = {'email': 'fast@yamdb.fake', 'username': 'fast'}
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(self.URL_SIGNUP, data=data)
+        assert response.status_code == HTTPStatus.OK
+        assert len(context) <= 4, (
+            'Проверьте, что новый пользователь и его код сохраняются без '
+            'лишних запросов.'
+        )
+        assert table_writes(context, 'users_customuser') == ['INSERT']
+        code = sent_code()
+        confirmation = ConfirmationCode.objects.get(user__username='fast')
+        assert code not in confirmation.code_hash
+        assert confirmation.check_code(code)
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(self.URL_SIGNUP, data=data)
+        assert response.status_code == HTTPStatus.OK
+        assert len(context) <= 3, (
+            'Проверьте, что повторная регистрация сохраняет код без '
+            'предварительного SELECT.'
+        )
+        assert not table_writes(context, 'users_customuser'), (
+            'Проверьте, что повторная регистрация не изменяет пользователя.'
+        )
+        assert len(table_writes(context, 'users_confirmationcode')) == 1, (
+            'Проверьте, что повторная регистрация обновляет код '
+            'одним запросом.'
+        )
+        confirmation.refresh_from_db()
+        assert not confirmation.check_code(code)
+        assert confirmation.check_code(sent_code())
+
+    def test_02_signup_after_token(self, client):
+        from users.models import ConfirmationCode
+
+        data = {'email': 'again@yamdb.fake', 'username': 'again'}
+        client.post(self.URL_SIGNUP, data=data)
+        response = client.post(self.URL_TOKEN, data={
+            'username': 'again', 'confirmation_code': sent_code()
+        })
+        assert response.status_code == HTTPStatus.OK
+        assert not ConfirmationCode.objects.exists()
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(self.URL_SIGNUP, data=data)
+        assert response.status_code == HTTPStatus.OK
+        assert len(context) <= 3, (
+            'Проверьте, что пользователь, уже получивший токен, получает '
+            'новый код одним запросом.'
+        )
+        response = client.post(self.URL_TOKEN, data={
+            'username': 'again', 'confirmation_code': sent_code()
+        })
+        assert response.status_code == HTTPStatus.OK
@@ -0,0 +1,107 @@
+from datetime import timedelta
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+from django.utils import timezone
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25ConfirmationCodes:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+    URL_TOKEN = '/api/v1/auth/token/'
+
+    def signup(self, client, username):
+        data = {'email': f'{username}@yamdb.fake', 'username': username}
+        response = client.post(self.URL_SIGNUP, data=data)
+        assert response.status_code == HTTPStatus.OK
+        call_command('send_queued_mail', stdout=StringIO())
+        return mail.outbox[-1].body.split()[-1]
+
+    def test_01_signup_and_token(self, client):
+        from users.models import ConfirmationCode
+
+        code = self.signup(client, 'hashed')
+        confirmation = ConfirmationCode.objects.get(user__username='hashed')
+        assert code not in confirmation.code_hash, (
+            'Проверьте, что код подтверждения не хранится в открытом виде.'
+        )
+        assert confirmation.expires_at > timezone.now()
+
+        response = client.post(
+            self.URL_TOKEN, data={'username': 'hashed',
+                                  'confirmation_code': code[::-1]}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        response = client.post(
+            self.URL_TOKEN, data={'username': 'hashed',
+                                  'confirmation_code': code}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert 'token' in response.json()
+
+    def test_02_expired_code(self, client):
+        from users.models import ConfirmationCode
+
+        code = self.signup(client, 'expired')
+        ConfirmationCode.objects.update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        response = client.post(
+            self.URL_TOKEN, data={'username': 'expired',
+                                  'confirmation_code': code}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что просроченный код подтверждения не принимается.'
+        )
+
+    def test_03_purge_expired(self, django_user_model):
+        from users.models import ConfirmationCode
+
+        now = timezone.now()
+        for idx in range(5):
+            user = django_user_model.objects.create_user(
+                username=f'user{idx}', email=f'user{idx}@yamdb.fake'
+            )
+            ConfirmationCode.issue(user, f'code{idx}')
+        ConfirmationCode.objects.filter(user__username__in=[
+            'user0', 'user1', 'user2'
+        ]).update(expires_at=now - timedelta(minutes=1))
+
+        stdout = StringIO()
+        call_command('purge_confirmation_codes', batch_size=2, stdout=stdout)
+
+        assert 'Удалено просроченных кодов подтверждения: 3' in (
+            stdout.getvalue()
+        )
+        assert sorted(ConfirmationCode.objects.values_list(
+            'user__username', flat=True
+        )) == ['user3', 'user4'], (
+            'Проверьте, что `purge_confirmation_codes` удаляет только '
+            'просроченные коды.'
+        )
+
+    def test_04_code_not_kept(self, client):
+        from users.models import ConfirmationCode, QueuedEmail
+
+        code = self.signup(client, 'once')
+        assert not QueuedEmail.objects.filter(body__contains=code).exists(), (
+            'Проверьте, что после отправки письма код подтверждения не '
+            'остаётся в очереди писем в открытом виде.'
+        )
+        data = {'username': 'once', 'confirmation_code': code}
+        assert client.post(
+            self.URL_TOKEN, data=data
+        ).status_code == HTTPStatus.OK
+        assert not ConfirmationCode.objects.filter(
+            user__username='once'
+        ).exists()
+        assert client.post(
+            self.URL_TOKEN, data=data
+        ).status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что код подтверждения можно обменять на токен '
+            'только один раз.'
+        )
@@ -0,0 +1,52 @@
+import pytest
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+
+
+def file_connection(path):
+    wrapper = DatabaseWrapper(
+        {**connection.settings_dict, 'NAME': str(path)}, alias='pragmas'
+    )
+    wrapper.force_debug_cursor = True
+    wrapper.ensure_connection()
+    return wrapper
+
+
+def pragma(wrapper, name):
+    with wrapper.cursor() as cursor:
+        cursor.execute(f'PRAGMA {name}')
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26SqlitePragmas:
+
+    def test_01_new_connection(self, tmp_path):
+        wrapper = file_connection(tmp_path / 'db.sqlite3')
+        try:
+            assert not wrapper.queries_log, (
+                'Проверьте, что PRAGMA не попадают в журнал запросов.'
+            )
+            assert pragma(wrapper, 'journal_mode') == 'wal', (
+                'Проверьте, что новые соединения с SQLite переводятся '
+                'в режим WAL.'
+            )
+            assert pragma(wrapper, 'synchronous') == 1
+            assert pragma(wrapper, 'busy_timeout') == 5000
+            assert pragma(wrapper, 'mmap_size') == 256 * 1024 * 1024
+            assert pragma(wrapper, 'cache_size') == -64 * 1024
+            assert pragma(wrapper, 'temp_store') == 2
+        finally:
+            wrapper.close()
+
+    def test_02_configurable(self, settings, tmp_path):
+        settings.SQLITE_PRAGMAS = {'busy_timeout': 250}
+        wrapper = file_connection(tmp_path / 'db.sqlite3')
+        try:
+            assert pragma(wrapper, 'busy_timeout') == 250
+            assert pragma(wrapper, 'journal_mode') == 'delete', (
+                'Проверьте, что применяются только PRAGMA '
+                'из `SQLITE_PRAGMAS`.'
+            )
+        finally:
+            wrapper.close()
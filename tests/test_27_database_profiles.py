@@ -0,0 +1,184 @@
+import os
+import runpy
+from pathlib import Path
+
+import pytest
+from django.db import OperationalError, connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+
+SETTINGS = (
+    Path(__file__).resolve().parent.parent
+    / 'api_yamdb' / 'api_yamdb' / 'settings.py'
+)
+
+
+def load_settings(monkeypatch, **environ):
+    for name, value in environ.items():
+        monkeypatch.setenv(name, value)
+    return runpy.run_path(str(SETTINGS))
+
+
+class Test27DatabaseProfiles:
+
+    def test_01_profiles(self, monkeypatch):
+        default = load_settings(monkeypatch)['DATABASES']['default']
+        assert default['ENGINE'] == 'django.db.backends.sqlite3'
+        assert 'CONN_MAX_AGE' not in default
+
+        persistent = load_settings(
+            monkeypatch,
+            DATABASE_PROFILE='sqlite-persistent',
+            DB_CONN_MAX_AGE='120'
+        )['DATABASES']['default']
+        assert persistent['CONN_MAX_AGE'] == 120, (
+            'Проверьте, что профиль `sqlite-persistent` сохраняет '
+            'соединения между запросами.'
+        )
+        assert persistent['CONN_HEALTH_CHECKS'] is True
+
+        postgresql = load_settings(
+            monkeypatch,
+            DATABASE_PROFILE='postgresql',
+            POSTGRES_HOST='db',
+            DB_POOL_MAX_SIZE='8'
+        )['DATABASES']['default']
+        assert postgresql['ENGINE'] == 'api.backends.postgresql_pool'
+        assert postgresql['HOST'] == 'db'
+        assert postgresql['POOL']['MAX_SIZE'] == 8
+
+        with pytest.raises(ValueError):
+            load_settings(monkeypatch, DATABASE_PROFILE='oracle')
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27HealthChecks:
+
+    def test_01_reuse_and_replace(self, tmp_path, monkeypatch):
+        from api.db import check_connection
+
+        wrapper = DatabaseWrapper({
+            **connection.settings_dict,
+            'NAME': str(tmp_path / 'db.sqlite3'),
+            'CONN_MAX_AGE': 600,
+            'CONN_HEALTH_CHECKS': True,
+        }, alias='persistent')
+        try:
+            wrapper.ensure_connection()
+            raw = wrapper.connection
+            wrapper.close_if_unusable_or_obsolete()
+            check_connection(wrapper)
+            assert wrapper.connection is raw, (
+                'Проверьте, что рабочее соединение используется повторно.'
+            )
+
+            monkeypatch.setattr(wrapper, 'is_usable', lambda: False)
+            check_connection(wrapper)
+            assert wrapper.connection is None, (
+                'Проверьте, что неработающее соединение закрывается '
+                'в начале запроса.'
+            )
+            wrapper.ensure_connection()
+            assert wrapper.connection is not raw
+        finally:
+            wrapper.close()
+
+
+@pytest.mark.skipif(
+    not os.getenv('POSTGRES_TEST_DSN'),
+    reason='POSTGRES_TEST_DSN is not set'
+)
+class Test27ConnectionPool:
+
+    def wrapper(self, alias, **pool):
+        psycopg2 = pytest.importorskip('psycopg2')
+        from api.backends.postgresql_pool.base import DatabaseWrapper
+
+        dsn = psycopg2.extensions.parse_dsn(os.environ['POSTGRES_TEST_DSN'])
+        return DatabaseWrapper({
+            **connection.settings_dict,
+            'ENGINE': 'api.backends.postgresql_pool',
+            'NAME': dsn.get('dbname', ''),
+            'USER': dsn.get('user', ''),
+            'PASSWORD': dsn.get('password', ''),
+            'HOST': dsn.get('host', ''),
+            'PORT': dsn.get('port', ''),
+            'OPTIONS': {'application_name': 'test_27_pool'},
+            'CONN_HEALTH_CHECKS': True,
+            'POOL': {'MIN_SIZE': 1, 'MAX_SIZE': 1, 'TIMEOUT': 0.1, **pool},
+        }, alias=alias)
+
+    def test_01_pool_per_params(self):
+        from api.backends.postgresql_pool.base import pool_key
+
+        first = self.wrapper('first')
+        params = first.get_connection_params()
+        assert pool_key(params) == pool_key(
+            self.wrapper('second').get_connection_params()
+        )
+        assert pool_key(params) != pool_key(
+            {**params, 'database': f'test_{params["database"]}'}
+        ), (
+            'Проверьте, что пул соединений выбирается по параметрам '
+            'соединения, а не по псевдониму базы.'
+        )
+
+    def test_02_exhausted_pool(self):
+        from api.backends.postgresql_pool.base import POOLS, pool_key
+
+        first, second = self.wrapper('first'), self.wrapper('second')
+        try:
+            first.ensure_connection()
+            with pytest.raises(OperationalError):
+                second.ensure_connection()
+            first.close()
+            second.ensure_connection()
+            with second.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                assert cursor.fetchone() == (1,)
+        finally:
+            first.close()
+            second.close()
+            POOLS.pop(pool_key(first.get_connection_params())).closeall()
+
+    def test_03_dead_pooled_connection(self):
+        from api.backends.postgresql_pool.base import POOLS, pool_key
+
+        first = self.wrapper('first', MAX_SIZE=2)
+        second = self.wrapper('second', MAX_SIZE=2)
+        try:
+            first.ensure_connection()
+            pid = first.connection.get_backend_pid()
+            first.close()
+            second.ensure_connection()
+            with second.cursor() as cursor:
+                cursor.execute('SELECT pg_terminate_backend(%s)', [pid])
+            first.ensure_connection()
+            with first.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                assert cursor.fetchone() == (1,), (
+                    'Проверьте, что соединение из пула проверяется '
+                    'при выдаче и разорванное заменяется новым.'
+                )
+            assert first.connection.get_backend_pid() != pid
+        finally:
+            first.close()
+            second.close()
+            POOLS.pop(pool_key(first.get_connection_params())).closeall()
+
+    def test_04_close_pool(self):
+        from api.backends.postgresql_pool.base import POOLS, pool_key
+        from api.backends.postgresql_pool.creation import DatabaseCreation
+
+        wrapper = self.wrapper('first')
+        assert isinstance(wrapper.creation, DatabaseCreation)
+        params = wrapper.get_connection_params()
+        wrapper.ensure_connection()
+        raw = wrapper.connection
+        wrapper.close()
+        assert not raw.closed
+        wrapper.close_pool(params)
+        assert raw.closed, (
+            'Проверьте, что соединения пула закрываются перед удалением '
+            'тестовой базы.'
+        )
+        assert pool_key(params) not in POOLS
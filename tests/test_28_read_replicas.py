@@ -0,0 +1,152 @@
+import sqlite3
+import time
+from http import HTTPStatus
+
+import pytest
+from django.db import connections
+
+
+def add_replica(alias, path):
+    """Snapshot of the test database in a separate SQLite file."""
+    primary = connections['default']
+    primary.ensure_connection()
+    target = sqlite3.connect(path)
+    primary.connection.backup(target)
+    target.close()
+    connections.settings[alias] = {
+        **primary.settings_dict, 'NAME': str(path)
+    }
+
+
+def remove_replica(alias):
+    connections[alias].close()
+    del connections[alias]
+    del connections.settings[alias]
+
+
+@pytest.fixture
+def replica(settings, tmp_path, admin):
+    """
+    A replica lagging behind the primary, taken after the fixtures.
+    """
+    alias = 'replica1'
+    add_replica(alias, tmp_path / 'replica.sqlite3')
+    settings.DATABASE_REPLICAS = [alias]
+    yield alias
+    remove_replica(alias)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28ReadReplicas:
+
+    URL_CATEGORIES = '/api/v1/categories/'
+
+    def test_01_read_your_writes(self, client, admin_client, replica,
+                                 monkeypatch, settings):
+        data = {'name': 'Фильм', 'slug': 'films'}
+        response = admin_client.post(self.URL_CATEGORIES, data=data)
+        assert response.status_code == HTTPStatus.CREATED
+
+        response = client.get(self.URL_CATEGORIES)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['count'] == 0, (
+            'Проверьте, что GET-запросы читают данные из реплики.'
+        )
+        assert 'ETag' not in response, (
+            'Проверьте, что ответ из отстающей реплики не получает ETag.'
+        )
+
+        response = admin_client.get(self.URL_CATEGORIES)
+        assert response.json()['count'] == 1, (
+            'Проверьте, что после записи клиент читает данные '
+            'из основной базы.'
+        )
+
+        later = time.time() + settings.READ_YOUR_WRITES_WINDOW + 1
+        monkeypatch.setattr(time, 'time', lambda: later)
+        response = admin_client.get(self.URL_CATEGORIES)
+        assert response.json()['count'] == 0, (
+            'Проверьте, что после `READ_YOUR_WRITES_WINDOW` клиент '
+            'снова читает данные из реплики.'
+        )
+
+    def test_02_pin_per_client(self, replica):
+        from rest_framework.test import APIClient
+        from reviews.models import Category
+
+        Category.objects.create(name='Фильм', slug='films')
+        writer, reader = APIClient(), APIClient()
+        data = {'email': 'pinned@yamdb.fake', 'username': 'pinned'}
+        response = writer.post('/api/v1/auth/signup/', data=data)
+        assert response.status_code == HTTPStatus.OK
+
+        assert writer.get(self.URL_CATEGORIES).json()['count'] == 1
+        assert reader.get(self.URL_CATEGORIES).json()['count'] == 0, (
+            'Проверьте, что после записи из основной базы читает только '
+            'написавший клиент, а не все клиенты с его адреса.'
+        )
+
+    def test_03_token_version_from_primary(self, admin, replica):
+        from rest_framework.test import APIClient
+        from users.tokens import RoleAccessToken
+
+        admin.token_version += 1
+        admin.save(update_fields=['token_version'])
+        client = APIClient()
+        client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {RoleAccessToken.for_user(admin)}'
+        )
+        response = client.get(self.URL_CATEGORIES)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что версия токена читается из основной базы, '
+            'а не из отстающей реплики.'
+        )
+
+    def test_04_round_robin(self, settings):
+        from api.routers import ReadReplicaRouter, replica_reads
+        from reviews.models import Category
+
+        router = ReadReplicaRouter()
+        settings.DATABASE_REPLICAS = ['replica1', 'replica2']
+        assert router.db_for_read(Category) == 'default'
+        aliases = []
+        for _ in range(4):
+            with replica_reads():
+                aliases.append(router.db_for_read(Category))
+                assert router.db_for_read(Category) == aliases[-1], (
+                    'Проверьте, что все чтения одного запроса идут '
+                    'в одну реплику.'
+                )
+                assert router.db_for_write(Category) == 'default'
+        assert sorted(aliases) == ['replica1', 'replica1',
+                                   'replica2', 'replica2']
+        assert aliases[0] != aliases[1], (
+            'Проверьте, что реплики выбираются по кругу.'
+        )
+
+    def test_05_replica_per_request(self, client, admin_client, settings,
+                                    tmp_path):
+        from django.test.utils import CaptureQueriesContext
+
+        from tests.utils import create_titles
+
+        create_titles(admin_client)
+        aliases = ['replica1', 'replica2']
+        for alias in aliases:
+            add_replica(alias, tmp_path / f'{alias}.sqlite3')
+        settings.DATABASE_REPLICAS = aliases
+        try:
+            with CaptureQueriesContext(connections['replica1']) as first, \
+                    CaptureQueriesContext(connections['replica2']) as second:
+                response = client.get('/api/v1/titles/')
+            assert response.status_code == HTTPStatus.OK
+            assert response.json()['count'] == 2
+            assert sorted([len(first) > 0, len(second) > 0]) == [
+                False, True
+            ], (
+                'Проверьте, что подсчёт, страница и prefetch одного '
+                'запроса читаются из одной реплики.'
+            )
+        finally:
+            for alias in aliases:
+                remove_replica(alias)
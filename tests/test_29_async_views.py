@@ -0,0 +1,151 @@
+import asyncio
+import importlib
+import re
+import threading
+from http import HTTPStatus
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import clear_url_caches, resolve
+
+
+def reload_urls():
+    import api.urls
+    import api_yamdb.urls
+
+    importlib.reload(api.urls)
+    importlib.reload(api_yamdb.urls)
+    clear_url_caches()
+
+
+@async_to_sync
+async def fetch(method, url, *args, **kwargs):
+    return await getattr(AsyncClient(), method)(url, *args, **kwargs)
+
+
+@pytest.fixture
+def async_urls(settings):
+    settings.ASYNC_READ_VIEWS = True
+    reload_urls()
+    yield
+    settings.ASYNC_READ_VIEWS = False
+    reload_urls()
+
+
+@pytest.fixture
+def title(django_user_model):
+    from reviews.models import Category, Comment, Genre, Review, Title
+
+    author = django_user_model.objects.create_user(username='author')
+    title = Title.objects.create(
+        name='Фильм', year=2000,
+        category=Category.objects.create(name='Кино', slug='films')
+    )
+    title.genre.add(Genre.objects.create(name='Драма', slug='drama'))
+    review = Review.objects.create(
+        title=title, author=author, text='Отзыв', score=7
+    )
+    Comment.objects.create(review=review, author=author, text='Комментарий')
+    return title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test29AsyncViews:
+
+    def urls(self, title):
+        review = title.reviews.get()
+        return (
+            '/api/v1/titles/',
+            f'/api/v1/titles/{title.pk}/',
+            f'/api/v1/titles/{title.pk}/reviews/',
+            f'/api/v1/titles/{title.pk}/reviews/{review.pk}/comments/',
+        )
+
+    def test_01_same_responses(self, client, title, async_urls):
+        for url in self.urls(title):
+            assert asyncio.iscoroutinefunction(resolve(url).func), (
+                f'Проверьте, что `{url}` обслуживается асинхронным '
+                f'представлением при `ASYNC_READ_VIEWS`.'
+            )
+            response = fetch('get', url)
+            expected = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            assert response.json() == expected.json()
+            assert response['ETag'] == expected['ETag']
+            assert re.search(
+                r'desc="[1-9]\d* queries"', response['Server-Timing']
+            ), 'Проверьте, что запросы асинхронных представлений учтены.'
+
+        response = fetch('get', '/api/v1/titles/0/')
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_02_writes(self, admin, title, async_urls):
+        from users.tokens import RoleAccessToken
+
+        token = RoleAccessToken.for_user(admin)
+        response = fetch(
+            'patch', f'/api/v1/titles/{title.pk}/', {'name': 'Новое название'},
+            content_type='application/json',
+            authorization=f'Bearer {token}'
+        )
+        assert response.status_code == HTTPStatus.OK
+        title.refresh_from_db()
+        assert title.name == 'Новое название'
+
+    def test_03_concurrent_reads(self, title, async_urls, monkeypatch):
+        from api.views import TitleViewSet
+
+        list_titles = TitleViewSet.list
+        lock = threading.Lock()
+        running = []
+        overlapped = threading.Event()
+
+        def slow_list(self, request, *args, **kwargs):
+            with lock:
+                running.append(request)
+                if len(running) > 1:
+                    overlapped.set()
+            try:
+                # Waits for another request to enter the view.
+                overlapped.wait(timeout=5)
+                return list_titles(self, request, *args, **kwargs)
+            finally:
+                with lock:
+                    running.remove(request)
+
+        monkeypatch.setattr(TitleViewSet, 'list', slow_list)
+
+        async def get_many(count):
+            async_client = AsyncClient()
+            return await asyncio.gather(*(
+                async_client.get('/api/v1/titles/') for _ in range(count)
+            ))
+
+        responses = async_to_sync(get_many)(5)
+        assert all(
+            response.status_code == HTTPStatus.OK for response in responses
+        )
+        assert overlapped.is_set(), (
+            'Проверьте, что асинхронные представления обрабатывают '
+            'запросы на чтение параллельно.'
+        )
+
+    def test_04_cookies(self, title, async_urls, monkeypatch):
+        from api.views import TitleViewSet
+
+        list_titles = TitleViewSet.list
+
+        def list_with_cookie(self, request, *args, **kwargs):
+            response = list_titles(self, request, *args, **kwargs)
+            response.set_cookie('seen', 'titles', httponly=True)
+            return response
+
+        monkeypatch.setattr(TitleViewSet, 'list', list_with_cookie)
+        response = fetch('get', '/api/v1/titles/')
+        assert response.status_code == HTTPStatus.OK
+        assert response.cookies['seen'].value == 'titles', (
+            'Проверьте, что асинхронные представления сохраняют cookie '
+            'ответа.'
+        )
+        assert response.cookies['seen']['httponly']
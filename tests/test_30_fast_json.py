@@ -0,0 +1,95 @@
+import datetime
+import io
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+DATA = OrderedDict((
+    ('text', 'Отзыв с разделителем\u2028строк'),
+    ('rating', Decimal('7.50')),
+    ('created', datetime.datetime(
+        2022, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc
+    )),
+    ('date', datetime.date(2022, 1, 2)),
+    ('id', uuid.UUID(int=42)),
+    ('lazy', gettext_lazy('Произведение')),
+    ('scores', {1: 10, 2: 5}),
+    ('genres', [OrderedDict((('name', 'Драма'), ('slug', 'drama')))]),
+    ('big', 2 ** 70),
+    ('empty', None),
+))
+
+
+class Test30FastJSON:
+
+    def test_01_renderer(self):
+        from api.renderers import FastJSONRenderer
+
+        assert FastJSONRenderer().render(DATA) == JSONRenderer().render(
+            DATA
+        ), (
+            'Проверьте, что `FastJSONRenderer` выдаёт те же байты, '
+            'что и `JSONRenderer`.'
+        )
+        for media_type in ('application/json', 'application/json; indent=4'):
+            assert FastJSONRenderer().render(
+                [DATA], media_type
+            ) == JSONRenderer().render([DATA], media_type)
+        assert FastJSONRenderer().render(None) == b''
+
+    def test_02_known_differences(self):
+        from api.renderers import FastJSONRenderer
+
+        assert FastJSONRenderer().render([1e16]) == b'[1e16]'
+        assert JSONRenderer().render([1e16]) == b'[1e+16]'
+        for value in (float('nan'), float('inf'), -float('inf')):
+            with pytest.raises(ValueError):
+                JSONRenderer().render([value])
+            assert FastJSONRenderer().render([value]) == b'[null]', (
+                'Различия `FastJSONRenderer` и `JSONRenderer` должны быть '
+                'описаны в документации класса.'
+            )
+
+    def test_03_parser(self):
+        from api.parsers import FastJSONParser
+
+        for body in (
+            b'{"name": "\\u0424\\u0438\\u043b\\u044c\\u043c", "year": 2000}',
+            '[{"genre": ["драма"]}, 12345678901234567890123]'.encode(),
+        ):
+            assert FastJSONParser().parse(io.BytesIO(body)) == (
+                JSONParser().parse(io.BytesIO(body))
+            )
+        for body in (b'{"score": NaN}', b'{"score": 1'):
+            with pytest.raises(ParseError):
+                FastJSONParser().parse(io.BytesIO(body))
+
+
+@pytest.mark.django_db(transaction=True)
+class Test30FastJSONResponses:
+
+    def test_01_titles_page(self, admin_client):
+        from reviews.models import Category, Genre
+
+        Category.objects.create(name='Кино', slug='films')
+        Genre.objects.create(name='Драма', slug='drama')
+        data = {
+            'name': 'Фильм\u2028', 'year': 2000,
+            'genre': ['drama'], 'category': 'films',
+        }
+        assert admin_client.post(
+            '/api/v1/titles/', data=data, format='json'
+        ).status_code == HTTPStatus.CREATED
+
+        response = admin_client.get('/api/v1/titles/')
+        assert response.content == JSONRenderer().render(response.data), (
+            'Проверьте, что ответы API совпадают с выводом `JSONRenderer`.'
+        )